@@ -0,0 +1,311 @@
+"""
+Benchmarks the render and probe pipeline of twidgets and checks it against a baseline.
+
+Each direction runs in a fresh interpreter, in a throwaway home with a large
+widgets and addons configuration. psutil and py-cpuinfo are replaced by fake
+modules, /proc and /sys files and the package database by fixture files, the
+space of the disks by fixed values, and the
+commands run by exec addons by canned outputs, so the timings only depend on
+the code and not on the state of the machine.
+
+The best time of every benchmark (in microseconds per call) is compared to the
+baseline file, a benchmark slower than the baseline by more than the threshold
+fails. Baselines are machine dependent, record them again with `--update`
+before comparing on another machine.
+
+Usage:
+    python benchmarks/pipeline.py [--threshold PERCENT] [--update] [--baseline PATH] [--python PATH]
+"""
+import argparse, io, json, os, subprocess, sys, tempfile, timeit, types
+from time import perf_counter
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+# Percent a benchmark may be slower than its baseline
+THRESHOLD = 25
+
+# direction: twidgets arguments the benchmarks of that direction run with
+DIRECTIONS = {
+    "column": ["--direction", "column", "--align", "center"],
+    "row": ["--direction", "row", "--logo", "linux", "--column", "3"],
+}
+
+# Number of addons and exec addons in the benchmark configuration
+ADDONS = 120
+EXEC_ADDONS = 6
+
+# Runs of main() per direction, the best one is reported
+MAIN_RUNS = 20
+
+# Canned output of each command run by the fake subprocess module
+COMMAND_OUTPUT = {f"fake-command {index}": f"output {index}\n" for index in range(EXEC_ADDONS)}
+
+# Contents of the fake files, by the path they stand in for
+FAKE_FILES = {
+    "/proc/sys/kernel/random/boot_id": "0b8c1a9e-5f3e-4a57-9a1e-6a5d4f0c2b7d\n",
+    "/proc/meminfo": "MemTotal:       16314932 kB\nMemFree:         8123456 kB\nMemAvailable:   11234567 kB\n",
+    "/proc/uptime": "123456.78 901234.56\n",
+    "/proc/loadavg": "0.52 0.58 0.59 1/345 12345\n",
+    "/proc/stat": "cpu  8000 80 4000 64000 160 0 40 0 0 0\n" + "".join(f"cpu{index} 1000 10 500 8000 20 0 5 0 0 0\n" for index in range(8)) + "intr 0\n",
+    "/proc/self/stat": "12345 (python3) S 1 12345 12345 0 -1 4194304 1000 0 0 0 42 7 0 0 20 0 1 0\n",
+    "/proc/cpuinfo": "processor\t: 0\ncpu MHz\t\t: 3600.000\n\n" * 8,
+    "/proc/mounts": "/dev/sda1 / ext4 rw,relatime 0 0\nproc /proc proc rw 0 0\n/dev/sdb1 /srv ext4 rw,relatime 0 0\n/dev/sda1 /var/lib/docker ext4 rw,relatime 0 0\nserver:/export /mnt/nfs nfs4 rw,relatime 0 0\n",
+    "/sys/class/power_supply/BAT0/type": "Battery\n",
+    "/var/lib/dpkg/status": "".join(f"Package: pkg{index}\nStatus: install ok installed\nVersion: 1.0\n\n" for index in range(2000)),
+}
+
+# The path constants of the /proc and /sys readers, by the fixture they are pointed at
+FAKE_PATHS = {
+    ("procfs", "MEMINFO_PATH"): "/proc/meminfo",
+    ("procfs", "UPTIME_PATH"): "/proc/uptime",
+    ("procfs", "LOADAVG_PATH"): "/proc/loadavg",
+    ("procfs", "POWER_SUPPLY_DIR"): "/sys/class/power_supply",
+    ("cpu", "STAT_PATH"): "/proc/stat",
+    ("cpu", "SELF_STAT_PATH"): "/proc/self/stat",
+    ("cpu", "CPUINFO_PATH"): "/proc/cpuinfo",
+    ("cpu", "FREQUENCY_GLOB"): "/sys/devices/system/cpu/cpufreq/policy*/scaling_cur_freq",
+    ("storage", "MOUNTS_PATH"): "/proc/mounts",
+}
+
+# Space of every disk, in place of statvfs
+DISK_USAGE = {"free": 312 * 1024 ** 3, "total": 512 * 1024 ** 3}
+
+def benchmark_config():
+    """
+    Returns a large configuration, every built-in widget moved and recolored
+    and many addons inserted at various indexes.
+    """
+    names = [
+        "username", "hostname", "platform", "shell", "python", "internet", "package", "window", "arch",
+        "cpu", "usage", "memory", "storage", "battery", "uptime", "weather", "time", "date"
+    ]
+    widgets = {name: {"index": len(names) - index, "color": "cyan"} for index, name in enumerate(names)}
+    # Hidden by default
+    widgets["usage"]["state"] = "active"
+
+    addons = {}
+    for index in range(ADDONS):
+        addons[f"text{index}"] = {"text": f"addon {index}", "color": "yellow", "icon": "*", "index": index * 7 % 40}
+    for index in range(EXEC_ADDONS):
+        addons[f"exec{index}"] = {"exec": f"fake-command {index}", "color": "green", "icon": ">", "index": index}
+
+    return {"widgets": widgets, "addons": addons}
+
+def fake_psutil():
+    # Only what the probes use, with fixed values
+    psutil = types.ModuleType("psutil")
+    psutil.virtual_memory = lambda: types.SimpleNamespace(total=16 * 1024 ** 3, used=6 * 1024 ** 3, available=10 * 1024 ** 3, percent=37.5)
+    psutil.disk_usage = lambda path: types.SimpleNamespace(total=512 * 1024 ** 3, used=200 * 1024 ** 3, free=312 * 1024 ** 3, percent=39.1)
+    psutil.sensors_battery = lambda: types.SimpleNamespace(percent=76, power_plugged=False, secsleft=7200)
+    psutil.boot_time = lambda: 1700000000
+    psutil.process_iter = lambda attrs=None: iter([])
+    psutil.NoSuchProcess = psutil.AccessDenied = psutil.ZombieProcess = type("Error", (Exception,), {})
+    return psutil
+
+def fake_cpuinfo():
+    cpuinfo = types.ModuleType("cpuinfo")
+    cpuinfo.CPUINFO_VERSION_STRING = "9.0.0"
+    cpuinfo.get_cpu_info = lambda: {
+        "brand_raw": "Fake CPU 9000", "hardware_raw": "fake", "hz_advertised_friendly": "3.6000 GHz",
+        "bits": 64, "count": 8, "arch": "X86_64"
+    }
+    return cpuinfo
+
+def fake_subprocess():
+    # The real module, with commands answered from COMMAND_OUTPUT instead of being run
+    fake = types.ModuleType("subprocess")
+    fake.__dict__.update(vars(subprocess))
+
+    class Popen:
+        def __init__(self, command, **kwargs):
+            self.args = command
+            self.pid = os.getpid()
+            self.returncode = 0
+
+        def communicate(self, input=None, timeout=None):
+            return COMMAND_OUTPUT.get(self.args, ""), ""
+
+    def run(command, **kwargs):
+        return subprocess.CompletedProcess(command, 0, COMMAND_OUTPUT.get(command, ""), "")
+
+    fake.Popen = Popen
+    fake.run = run
+    return fake
+
+def fake_open(root):
+    # Opens the fixture file standing in for a system file, other paths as is
+    def opener(path, *args, **kwargs):
+        if isinstance(path, str) and path in FAKE_FILES:
+            path = os.path.join(root, path.lstrip("/"))
+        return open(path, *args, **kwargs)
+    return opener
+
+def time_call(func, repeat=5):
+    """
+    Returns the best time of a call of `func`, in microseconds.
+    """
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat, number)) / number * 1e6
+
+def run_benchmarks(direction):
+    """
+    Runs the benchmarks of one direction, in this (fresh) interpreter.
+
+    Returns:
+    dict: The best time of each benchmark, in microseconds.
+    """
+    home = tempfile.mkdtemp(prefix="twidgets-bench-")
+    root = os.path.join(home, "fake-root")
+
+    for path, content in FAKE_FILES.items():
+        path = os.path.join(root, path.lstrip("/"))
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            f.write(content)
+
+    with open(os.path.join(home, ".twidgets.json"), "w") as f:
+        json.dump(benchmark_config(), f)
+
+    # twidgets reads the home, the terminal size and its arguments on import
+    os.environ.update(HOME=home, COLUMNS="160", LINES="50", FORCE_COLOR="1", SHELL="/bin/bash")
+    sys.argv = ["twidgets", *DIRECTIONS[direction]]
+    sys.modules["psutil"] = fake_psutil()
+    sys.modules["cpuinfo"] = fake_cpuinfo()
+
+    import twidgets
+    from twidgets import cache, packages, network, procfs, cpu, storage
+
+    twidgets.subprocess = fake_subprocess()
+    twidgets.open = cache.open = fake_open(root)
+
+    modules = {"procfs": procfs, "cpu": cpu, "storage": storage}
+    for (module, name), path in FAKE_PATHS.items():
+        setattr(modules[module], name, os.path.join(root, path.lstrip("/")))
+    procfs.disk_usage = lambda path: dict(DISK_USAGE)
+    packages.databases = lambda system: [("apt", os.path.join(root, "var/lib/dpkg/status"), packages.count_dpkg)]
+    twidgets.check_connectivity = lambda **kwargs: network.Connectivity(True, ["1.1.1.1", 443], 0.001)
+
+    results = {}
+    stdout = sys.stdout
+    sink = io.StringIO()
+
+    def quiet(func, *args, **kwargs):
+        # Runs func with its output discarded
+        def run():
+            sys.stdout = sink
+            try:
+                return func(*args, **kwargs)
+            finally:
+                sys.stdout = stdout
+                sink.seek(0)
+                sink.truncate()
+        return run
+
+    def run_main():
+        try:
+            twidgets.main()
+        except SystemExit:
+            pass
+
+    if direction == "column":
+        text = twidgets.badge(color=twidgets.color.green, icon=twidgets.icon.cpu, text="3.6 GHz")
+        ansi = "\033[1;32mlinux\033[0m \033[36m6.8.0\033[0m " * 4
+
+        results["contains_escape_code"] = time_call(lambda: (twidgets.contains_escape_code(text), twidgets.contains_escape_code(ansi)))
+        results["cleaned_string"] = time_call(lambda: (twidgets.cleaned_string(text), twidgets.cleaned_string(ansi)))
+        results["truncate_text"] = time_call(lambda: (twidgets.truncate_text("short text"), twidgets.truncate_text("long text " * 30)))
+        results["badge"] = time_call(lambda: twidgets.badge(color=twidgets.color.green, icon=twidgets.icon.cpu, text="3.6 GHz"))
+
+        for name in twidgets.config.logo.list():
+            art = twidgets.config.logo.select(name)
+            try:
+                art = art.format(**twidgets.color_codes)
+            except Exception:
+                pass
+            results[f"print_align[{name}]"] = time_call(quiet(twidgets.print_align, art, end="\n"))
+
+        info = twidgets.probe([])
+        username = twidgets.get_username()
+        widget_config = twidgets.load_widget_config()
+        pending = twidgets.start_addons()
+        widgets_set = twidgets.build_widgets_set(info, username, [])
+
+        def order():
+            configured = twidgets.configure_widgets(dict(widgets_set), widget_config)
+            return twidgets.run_addons(twidgets.build_badges(configured), configured, pending)
+
+        results["ordering"] = time_call(quiet(order))
+
+    # End to end, probes, addons and rendering included
+    run = quiet(run_main)
+    best = None
+    for _ in range(MAIN_RUNS):
+        start = perf_counter()
+        run()
+        elapsed = (perf_counter() - start) * 1e6
+        best = elapsed if best is None else min(best, elapsed)
+    results[f"main[{direction}]"] = best
+
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the twidgets render and probe pipeline against a baseline.")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD, help=f"Percent a benchmark may be slower than its baseline. (default: {THRESHOLD})")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="Baseline file to compare with.")
+    parser.add_argument("--update", action="store_true", help="Record the results as the new baseline.")
+    parser.add_argument("--python", default=sys.executable, help="Interpreter used to run twidgets.")
+    parser.add_argument("--direction", choices=DIRECTIONS, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.direction:
+        # Child process, print the results for the parent
+        print(json.dumps(run_benchmarks(args.direction)))
+        return
+
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ, PYTHONPATH=root)
+
+    results = {}
+    for direction in DIRECTIONS:
+        process = subprocess.run([args.python, os.path.abspath(__file__), "--direction", direction], stdout=subprocess.PIPE, text=True, env=env)
+        if process.returncode:
+            print(f"benchmarks failed in direction: {direction}")
+            sys.exit(1)
+        results.update(json.loads(process.stdout.splitlines()[-1]))
+
+    if args.update:
+        with open(args.baseline, "w") as f:
+            json.dump({"python": sys.version.split()[0], "benchmarks": results}, f, indent=2)
+            f.write("\n")
+        for name, value in results.items():
+            print(f"{name:<28} {value:12.1f} us")
+        print(f"baseline written to: {args.baseline}")
+        return
+
+    try:
+        with open(args.baseline) as f:
+            baseline = json.load(f)["benchmarks"]
+    except (OSError, ValueError, KeyError):
+        print(f"no baseline at: {args.baseline}, record one with --update")
+        sys.exit(1)
+
+    failed = False
+    for name, value in results.items():
+        expected = baseline.get(name)
+        if expected is None:
+            print(f"{name:<28} {value:12.1f} us  (no baseline)")
+            continue
+
+        change = (value / expected - 1) * 100
+        status = "ok"
+        if change > args.threshold:
+            status = "FAIL"
+            failed = True
+
+        print(f"{name:<28} {value:12.1f} us  (baseline {expected:.1f} us, {change:+.0f}%)  {status}")
+
+    sys.exit(1 if failed else 0)
+
+if __name__ == "__main__":
+    main()
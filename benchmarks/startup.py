@@ -0,0 +1,75 @@
+"""
+Measures the cold start of each twidgets mode and checks it against a budget.
+
+Every mode is run a few times in a fresh interpreter with `-X importtime`, the
+best wall time is compared to the budget (ms) and the imported modules are
+checked against the ones that mode must never load.
+
+Usage:
+    python benchmarks/startup.py [--runs N] [--python PATH]
+"""
+import argparse, os, subprocess, sys, tempfile
+from time import perf_counter
+
+# mode: (budget in ms, modules that must not be imported)
+STARTUP_BUDGET = {
+    "--version": (150, ["rich", "rich_argparse", "requests", "psutil", "cpuinfo"]),
+    "--configs": (250, ["requests", "psutil", "cpuinfo"]),
+    "--show logo": (300, ["requests", "psutil", "cpuinfo"]),
+    "--stdout": (2000, ["rich", "rich_argparse", "requests"]),
+    "--json": (2000, ["rich", "rich_argparse", "requests"]),
+}
+
+def run_mode(python, mode, env):
+    """
+    Runs twidgets once in the given mode.
+
+    Returns:
+    tuple: Wall time in ms and the set of imported top-level module names.
+    """
+    command = [python, "-X", "importtime", "-m", "twidgets", *mode.split()]
+
+    start = perf_counter()
+    process = subprocess.run(command, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, env=env)
+    elapsed = (perf_counter() - start) * 1000
+
+    modules = set()
+    for line in process.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if line.startswith("import time:") and "|" in line:
+            name = line.rsplit("|", 1)[-1].strip()
+            modules.add(name.split(".")[0])
+
+    return elapsed, modules
+
+def main():
+    parser = argparse.ArgumentParser(description="Check twidgets startup time against the per-mode budget.")
+    parser.add_argument("--runs", type=int, default=5, help="Runs per mode, the best one is reported.")
+    parser.add_argument("--python", default=sys.executable, help="Interpreter used to run twidgets.")
+    args = parser.parse_args()
+
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    home = tempfile.mkdtemp(prefix="twidgets-bench-")
+
+    # Run against an empty config in a throwaway home so user settings don't skew results
+    env = dict(os.environ, HOME=home, PYTHONPATH=root, COLUMNS="120", LINES="40")
+
+    failed = False
+    for mode, (budget, forbidden) in STARTUP_BUDGET.items():
+        results = [run_mode(args.python, mode, env) for _ in range(args.runs)]
+        best = min(elapsed for elapsed, _ in results)
+        loaded = sorted(set().union(*(modules for _, modules in results)) & set(forbidden))
+
+        status = "ok"
+        if best > budget or loaded:
+            status = "FAIL"
+            failed = True
+
+        print(f"{mode:<14} {best:8.1f} ms  (budget {budget} ms)  {status}")
+        if loaded:
+            print(f"{'':<14} unexpected imports: {', '.join(loaded)}")
+
+    sys.exit(1 if failed else 0)
+
+if __name__ == "__main__":
+    main()
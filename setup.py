@@ -23,6 +23,7 @@ setup(
         'console_scripts': ['twidgets = twidgets:main'],
     },
     packages=find_packages(),
+    package_data={"twidgets": ["logos/*.txt"]},
     install_requires=["py-cpuinfo", "psutil", "rich", "rich-argparse", "requests"],
     keywords=['python', 'style', 'terminal', "widgets", "sysfetch"],
     classifiers=[
@@ -1,69 +1,120 @@
-import cpuinfo
-from io import StringIO
-from rich.text import Text
 from time import time, sleep
+from .lazy import lazy_module
+from .cache import load, store, remember, boot_session
+from .packages import count_packages
+from .daemon import fetch, serve
+from .profiler import profiler
+from .cells import measure, display_width, truncate
+from .layout import Layout
+from .history import History, sparkline
+from . import cpu, procfs, storage
+from .network import check_connectivity, DEFAULT_TIMEOUT, DEFAULT_TTL
+from .weather import get_weather, DEFAULT_TTL as WEATHER_TTL, DEFAULT_STALE_TTL as WEATHER_STALE_TTL
+from .scripts import ScriptPool, ScriptError, compile_script
 from itertools import zip_longest
+from functools import lru_cache
 from .system import system, hostname, arch, release
-from concurrent.futures import ThreadPoolExecutor
-import os, re, sys, json, ctypes, requests, subprocess
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed, wait, FIRST_COMPLETED
+import os, sys, json, atexit, ctypes, signal, hashlib, threading, subprocess
+from .path import SOCKET_PATH
 from .config import (
     CONFIG_PATH,
+    config_file,
     color_codes,
     window_rows,
     window_size,
     pyversion,
     console,
-    cftime,
-    today,
+    clock,
     color,
     align,
     logo,
     args
 )
 
-if not system == "android":
-    import psutil
+# Heavy third-party modules are imported on first use, so modes like
+# --stdout or --json never pay for the ones they don't touch
+rich_text = lazy_module("rich.text")
+cpuinfo = lazy_module("cpuinfo")
+psutil = lazy_module("psutil")
+
+cpu_info = None
+# Held while py-cpuinfo runs, so the probes needing it never run it twice
+cpu_info_lock = threading.Lock()
+logo_lines = None
+
+# Seconds an exec addon may run before its badge shows a placeholder instead
+ADDON_TIMEOUT = 5
+ADDON_PLACEHOLDER = "timed out"
+
+# Shown in the cell of a widget whose probe or addon hasn't finished yet
+PENDING = "…"
+
+# Bump when the raw readings returned by the probes change, so a daemon
+# started by an older version isn't used
+READINGS_VERSION = 5
+
+# Widgets hidden unless their state is set to "active" in the configuration,
+# the CPU usage needs a sample of the CPU times that a short run can't spare
+DEFAULT_DISABLED = ["usage"]
+
+# Probes that return at once, run before the others instead of in a thread
+INSTANT_PROBES = ["shell"]
+
+# Where the shared storage of Android is mounted, the "emulated" file system df reports
+ANDROID_STORAGE = "/storage/emulated"
+
+# Hertz in each unit of the CPU frequency reported by py-cpuinfo
+FREQUENCY_UNITS = {"Hz": 1, "KHz": 1e3, "MHz": 1e6, "GHz": 1e9, "THz": 1e12}
+
+# Worker processes running the script addons, kept warm across refreshes in watch mode
+script_pool = ScriptPool()
+
+# The recent values of the metrics shown as sparklines, see `HISTORY_METRICS`
+history = History()
+
+# Samples drawn in a sparkline, the most recent ones
+SPARK_WIDTH = 10
+
+# The least range of a sparkline, in percentage points of usage
+SPARK_MIN_SPAN = 10
 
 def contains_escape_code(text):
-    # Extended pattern for ANSI and ASCII escape codes, including cursor movements and other control codes
-    ansi_ascii_pattern = r'\x1B\[[0-9;?]*[A-Za-z]|\x1B[EF]'
+    # Check if the text contains ANSI escape codes (colors, cursor movements and other control codes)
+    return measure(text).escape
 
-    # Check if the text contains ANSI or ASCII escape codes
-    if re.search(ansi_ascii_pattern, text):
-        return True
-    else:
-        return False
-    
 def cleaned_string(text):
-    is_contains_escape_code = contains_escape_code(text)
+    # The text as it appears on screen, without its ANSI escape codes and rich markup
+    return measure(text).plain
 
-    if is_contains_escape_code:
-        # Remove all matched ANSI escape codes and other escape sequences
-        cleaned_text = re.sub(r'\x1B\[[0-?9;]*[mK]|\\n|\\t|\\r|\\b|\\f|\\v|\\0', '', text)
-    else:
-        # Remove all occurrences of text within square brackets (inclusive)
-        cleaned_text = re.sub(r'\[.*?\]', '', text)
+def get_padding(max_length, width=None, align=align):
+    """
+    Returns the number of spaces that aligns a text of `max_length` within `width`
+    (the console width by default).
+    """
+    if align == "left":
+        return 0
+
+    if width is None:
+        width = console.width
 
-    return cleaned_text
+    # Calculate the total padding needed to center the text in the terminal
+    return int(((width - max_length) // 2) + 2)
 
-def print_align(string, source=console.width, align=align, end=""):
+def print_align(string, source=None, align=align, end=""):
     is_contains_escape_code = contains_escape_code(string)
-    cleaned_lines = cleaned_string(string).splitlines()
     lines = string.splitlines()
-    width = source
+    # Default to the console width, resolved here so rich is only loaded when printing
+    width = console.width if source is None else source
 
-    if isinstance(source, str):
-        width = len(max(cleaned_lines))
+    # The display width of the longest line
+    max_length = display_width(string)
 
-    # Calculate the maximum length of the lines
-    max_length = max(len(line) for line in cleaned_lines)
+    if isinstance(source, str):
+        width = max_length
 
     # Determine padding based on alignment
-    if align == "left":
-        padding = ""
-    else:  # center alignment
-        # Calculate the total padding needed to center the logo in the terminal
-        padding = " " * int(((width - max_length) // 2) + 2)
+    padding = " " * get_padding(max_length, width, align)
 
     aligned_lines = []
     
@@ -73,7 +124,7 @@ def print_align(string, source=console.width, align=align, end=""):
         
     aligned_text = "\n".join(aligned_lines)
     if is_contains_escape_code:
-        console.print(Text.from_ansi(aligned_text), end=end)
+        console.print(rich_text.Text.from_ansi(aligned_text), end=end)
     else:
         console.print(aligned_text, end=end)
     if end == "\r":
@@ -134,23 +185,41 @@ def convert_size(size_in_bytes):
     # Return the converted size and its corresponding unit
     return size_in_bytes, selected_unit
 
+def get_cpu_info():
+    """
+    Returns the detailed CPU info from py-cpuinfo, probing it only once per run
+    and only when the cpu probe runs (for the cpu widget or the detailed arch).
+
+    The result is cached on disk for the current boot, since brand, frequency,
+    bits and core count don't change until the next reboot.
+    """
+    global cpu_info
+
+    with cpu_info_lock:
+        if cpu_info is None:
+            # The cache is invalidated by a reboot, a hostname change or a py-cpuinfo upgrade
+            boot = boot_session()
+            key = [boot, hostname, cpuinfo.CPUINFO_VERSION_STRING]
+
+            # Without a boot identifier the cache can't be invalidated, so always probe
+            with profiler.phase("cpuinfo"):
+                cpu_info = remember("cpuinfo", key, cpuinfo.get_cpu_info, refresh=args.refresh_cache or not boot)
+    return cpu_info
+
 margin = "\n"*args.margin
 
-try:
-    logo = logo.select(args.logo).format(**color_codes)
-except Exception:
-    logo = logo.select(args.logo)
-    
-if args.direction == "row":
-    cleaned_logo = cleaned_string(logo)
-    logo_len = len(cleaned_logo.splitlines())
+# The logo art, with its width and height measured once
+logo_asset = logo.asset(args.logo, color_codes)
+logo = logo_asset.art
 
-    max_logo_width_len = len(max(cleaned_logo.splitlines()))
-    alongside_width = max_logo_width_len + 2
+if args.direction == "row":
+    logo_len = logo_asset.height
+    alongside_width = logo_asset.width + 2
 
 def truncate_text(text):
     """
     Truncates the text if it exceeds the available window width, adding an ellipsis if truncated.
+    The width is measured in terminal cells, wide glyphs take two.
 
     Parameters:
     - text (str): The text to display.
@@ -162,53 +231,32 @@ def truncate_text(text):
     """
 
     try:
-        # Calculate the total width by adding alongside width and the text length
-        total_width = alongside_width + len(cleaned_string(text)) + 5        
-    except Exception:
-        total_width = len(cleaned_string(text)) + 5
-    
-    # Determine the remaining width by subtracting total width from available window rows
-    remaining_width = window_rows - total_width
-    
-    # If the remaining width is negative, truncate the text and add an ellipsis
-    if total_width > window_rows:
-        text = text[:remaining_width] + "\u2026"  # "\u2026" is the unicode for ellipsis (…)
-    
-    return text
+        # Cells left for the text, beside the logo in row direction
+        available = window_rows - alongside_width - 5
+    except NameError:
+        available = window_rows - 5
 
-def getCols(data):
-    cols = [line.strip().split() for line in data]
-    return cols
+    return truncate(text, available)
 
-def findStr(data, find):
-    fstr = [i for i in data if any(find in j for j in i)]
-
-    # Use a set to remove duplicates, then check if the length is 1
-    if len(set(tuple(sublist) for sublist in fstr)) == 1:
-    # Print the first sublist (index 0)
-        return fstr[0]
+class BadgeTemplate:
+    """
+    The markup of a badge around its text, so rendering a badge is a single
+    substitution instead of rebuilding its markup every time.
 
-    if len(fstr) > 1:
-        return fstr
-    else:
-        return fstr[0]
-    
-def insert_dict(dictionary, index, key, value):
-    try:
-        dictionary.pop(key)  # Remove the dictionary item with the specified key.
-    except Exception:
-        pass
+    Attributes:
+    before (str): The markup before the text, the left of the badge, the icon and the text style.
+    after (str): The markup after the text, closing its style and the right of the badge.
+    """
 
-    # insert new key and value using keys() and values() methods
-    keys = list(dictionary.keys())
-    values = list(dictionary.values())
+    def __init__(self, before:str, after:str):
+        self.before = before
+        self.after = after
 
-    # insert new key and value at the desired index
-    keys.insert(index, key)
-    values.insert(index, value)
+    def render(self, text:str) -> str:
+        return self.before + text + self.after
 
-    # create a new dictionary using keys and values list
-    return dict(zip(keys, values))
+# (style, color, icon, no_badge): the compiled BadgeTemplate
+badge_templates = {}
 
 class Icon():
     net: str
@@ -222,6 +270,7 @@ class Icon():
     window  = ""
     arch    = "󰘚"
     cpu     = ""
+    usage   = "󰓅"
     ram     = ""
     storage = "󰋊"
     volume  = "󰕾"
@@ -277,7 +326,39 @@ class Icon():
     def __init__(self):
         self.color = color
 
-    def badge(self, text:str, color:str = None, icon:str = None, no_badge:str = args.no_badge):
+    def template(self, style:str, color:str = None, icon:str = None, no_badge:str = args.no_badge):
+        """
+        Returns the template of a badge, compiled once per (style, color, icon, no_badge).
+
+        Args:
+        style (str): "icon" for a colored icon and the text, "plain" for the text
+        alone and "colored" for the text in color.
+        color (str): The color of the icon, or of the text.
+        icon (str): The icon shown before the text.
+        no_badge (str): Leave out the rounded badge around the text.
+
+        Returns:
+        BadgeTemplate: The markup around the text of the badge.
+        """
+        key = (style, color, icon, bool(no_badge))
+
+        if key not in badge_templates:
+            if no_badge:
+                left = right = ""
+            else:
+                left = f"[{self.color.black}]{self.circle[0]}[on {self.color.black}]"
+                right = f"[/][{self.color.black}]{self.circle[1]}"
+
+            if style == "icon":
+                badge_templates[key] = BadgeTemplate(f"{left}[{color}]{icon}[/] [b white]", f"[/]{right}")
+            elif style == "plain":
+                badge_templates[key] = BadgeTemplate(f"{left}[b white]", f"[/]{right}")
+            else:
+                badge_templates[key] = BadgeTemplate(f"{left}[b white][{color}]", f"[/][/]{right}")
+
+        return badge_templates[key]
+
+    def badge(self, text:str, color:str = None, icon:str = None, no_badge:str = args.no_badge, spark:str = None):
         """
         Generate a badge with specified color, icon, and text.
 
@@ -285,30 +366,23 @@ class Icon():
         color (str): The color of the badge.
         icon (str): The icon string containing the icon and possibly a number.
         text (str): The text to display alongside the badge.
+        spark (str): A sparkline shown before the text, in the color of the badge.
 
         Returns:
         str: The generated badge.
         """
 
-        text = truncate_text(text)
+        if spark and text:
+            text = f"[{color}]{spark}[/] {text}" if color else f"{spark} {text}"
 
-        if no_badge:
-            badge = {
-                "left": "",
-                "right": ""
-            }
-        else:
-            badge = {
-                "left": f"[{self.color.black}]{self.circle[0]}[on {self.color.black}]",
-                "right": f"[/][{self.color.black}]{self.circle[1]}"
-            }
+        text = truncate_text(text)
 
         if icon and color and text:
-            return f"{badge["left"]}[{color}]{icon}[/] [b white]{text}[/]{badge["right"]}"
+            return self.template("icon", color, icon, no_badge).render(text)
         elif not icon and not color and text:
-            return f"{badge["left"]}[b white]{text}[/]{badge["right"]}"
+            return self.template("plain", no_badge=no_badge).render(text)
         elif not icon and text:
-            return f"{badge["left"]}[b white][{color}]{text}[/][/]{badge["right"]}"
+            return self.template("colored", color, no_badge=no_badge).render(text)
         else:
             # If conditions are not met, return an empty string
             return ''
@@ -316,17 +390,25 @@ class Icon():
 class System():
     @staticmethod
     def getInternet():
+        """
+        Checks the network status, racing TCP connections to well-known
+        endpoints (or the ones configured under "internet") against a short deadline.
+
+        Returns:
+            bool: True if online, False if offline.
+        """
+        settings = config_file.internet or {}
+
         try:
-            global reqStatus
-            # sending equest to get network status code
-            req = requests.get(f"https://1.1.1.1", timeout=3)
-            status = req.status_code
-
-            # capture request status code and set boolean with ternary operator
-            reqStatus = True if status == 200 else None
-            
+            return check_connectivity(
+                endpoints=settings.get("endpoints"),
+                timeout=settings.get("timeout", DEFAULT_TIMEOUT),
+                ttl=settings.get("cache_ttl", DEFAULT_TTL),
+                refresh=args.refresh_cache
+            ).online
         except Exception:
-            reqStatus = False
+            # The check itself failed, counted as offline rather than ending the run
+            return False
 
     @staticmethod
     def getPackage():
@@ -334,85 +416,23 @@ class System():
         Determines the package manager and counts the number of installed packages
         based on the current operating system.
 
+        The count is read straight from the package manager's database
+        (dpkg status, pacman local, rpmdb, apk, xbps, brew Cellar, registry)
+        instead of running the package manager itself.
+
         Returns:
-            str: A string representing the count of installed packages and the package manager used.
+            dict: The "count" of installed packages and the package "manager" used.
             Returns None if an error occurs.
         """
-        if system == "windows":
-            # For Windows, use PowerShell to count installed programs
-            pkg = "exe"
-            command = r"(Get-ItemProperty HKLM:\Software\Microsoft\Windows\CurrentVersion\Uninstall\* | ? { $_.DisplayName -and $_.DisplayName -notmatch '^KB[0-9]' }).Count"
-            command = f"powershell -c \"{command}\""
-
-        elif system == "android":
-            # For Android, use apt to count installed packages
-            pkg = "apt"
-            command = "dpkg -l | wc -l"
-
-        elif system == "linux":
-            # For Linux, determine the package manager based on the distribution
-            def get_distro():
-                with open("/etc/os-release", "r") as f:
-                    for line in f:
-                        if line.startswith("ID="):
-                            return line.split("=")[1].strip().lower()
-
-            distro = get_distro()
-
-            def is_apt_supported():
-                return os.path.isfile("/etc/apt/sources.list")
-            
-            def is_pacman_supported():
-                return os.path.isfile("/etc/pacman.conf")
-
-            if is_apt_supported():
-                pkg = "apt"
-                command = "dpkg -l | grep '^ii' | wc -l"
-
-            elif is_pacman_supported():
-                pkg = "pacman"
-                command = "pacman -Q | wc -l"
-
-            elif any(d in distro for d in ["centos", "rhel", "fedora"]):
-                pkg = "rpm"
-                command = "yum list installed | wc -l"
-
-            elif "alpine" in distro:
-                pkg = "apk"
-                command = "apk info | wc -l"
-
-            elif "void" in distro:
-                pkg = "xbps"
-                command = "xbps-query -l | wc -l"
-
-            elif "opensuse" in distro:
-                pkg = "rpm"
-                command = "zypper packages --installed-only | wc -l"
-
-            elif "freebsd" in distro:
-                pkg = "pkg"
-                command = "pkg info | wc -l"
-
-            elif any(d in distro for d in ["openbsd", "netbsd"]):
-                pkg = "pkg"
-                command = "pkg_info | wc -l"
-            else:
-                return None
+        result = count_packages(system, refresh=args.refresh_cache)
 
-        elif system == "darwin":
-            # For macOS, use Homebrew to count installed packages
-            pkg = "brew"
-            command = "brew list | wc -l"
-
-        try:
-            # Run the command and capture the output
-            output = subprocess.run(command, shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, check=True).stdout.strip()
-        except Exception:
-            # Return None if an error occurs
+        if not result:
+            # Return None if no known package database is found
             return None
-        
+
+        count, pkg = result
         # Return the count of installed packages and the package manager used
-        return output + f" {pkg}"
+        return {"count": count, "manager": pkg}
     
     @staticmethod
     def getCPU():
@@ -420,19 +440,45 @@ class System():
         Retrieves the CPU info of the system.
 
         Returns:
-            str: A string representing the CPU info with its appropriate unit (GHz or MHz).
+            dict: The "brand" and "hardware" names of the CPU, its advertised "frequency" in hertz,
+            its "bits" and its "count" of cores.
         """
+        cpu_info = get_cpu_info()
         freqs, unit = cpu_info["hz_advertised_friendly"].split()
-        freqs = round(float(freqs), 1)
-        if args.text == "detailed":
-            if system == "android":
-                cpu = f"{cpu_info["hardware_raw"]} {freqs} {unit}"
-            else:
-                cpu = f"{cpu_info["brand_raw"]}"
-        else:
-            cpu = f"{freqs} {unit}"  # Concatenate frequency and unit to form CPU information string
-        
-        return cpu
+
+        return {
+            "brand": cpu_info.get("brand_raw"),
+            "hardware": cpu_info.get("hardware_raw"),
+            "frequency": float(freqs) * FREQUENCY_UNITS[unit],
+            "bits": cpu_info.get("bits"),
+            "count": cpu_info.get("count")
+        }
+
+    @staticmethod
+    def getUsage():
+        """
+        Retrieves how busy the CPU is, from the CPU times of /proc/stat (psutil elsewhere).
+
+        Each reading covers the time since the previous one, of this run (watch mode, daemon)
+        or of a recent run. Without one, a short sample is taken in the probe thread, alongside the other probes.
+
+        Returns:
+            dict or None: The busy "percent" of all the cores, the busy percent of each of the "cores",
+            the current "frequency" in hertz and the 1, 5 and 15 minutes "load" averages
+            (None where not available), if successful; None otherwise.
+        """
+        try:
+            percents = cpu.utilization()
+        except Exception:
+            # Return None if an exception occurs
+            return None
+
+        return {
+            "percent": percents[0],
+            "cores": percents[1:],
+            "frequency": cpu.current_frequency(),
+            "load": cpu.load_average()
+        }
 
     @staticmethod
     def getRAM():
@@ -440,45 +486,21 @@ class System():
         Retrieves the system RAM usage.
 
         Returns:
-            str or None: A string representing the used and total RAM, in GB (Gigabytes), if successful; None otherwise.
+            dict or None: The "used" and "total" RAM in bytes, if successful; None otherwise.
         """
-        if system == "android":
-            try:
-                # For Android systems, read RAM information from /proc/meminfo
-                mem_path = "/proc/meminfo"
-                with open(mem_path) as f:
-                    mem_info = f.readlines()
-
-                # Extract relevant columns from the memory info
-                mem = getCols(mem_info)
-                total_ram_bits = int(findStr(mem, "MemTotal")[1]) * 1024
-                avail_ram_bits = int(findStr(mem, "MemAvailable")[1]) * 1024
-                total_ram, unitT = convert_size(total_ram_bits)
-
-                # Calculate used RAM by subtracting available RAM from total RAM
-                used_ram, unitU = convert_size(total_ram_bits - avail_ram_bits)
-            except Exception:
-                # Return None if an exception occurs
-                return None
-        else:
-            try:
-                # For non-Android systems, use psutil to retrieve virtual memory information
-                svmem = psutil.virtual_memory()
-
-                # Convert total and used RAM sizes to human-readable format
-                total_ram, unitT = convert_size(svmem.total)
-                used_ram, unitU = convert_size(svmem.used)
-            except Exception:
-                # Return None if an exception occurs
-                return None
+        try:
+            # On Linux and Android, read /proc/meminfo directly
+            return procfs.memory()
+        except (OSError, KeyError, ValueError):
+            pass
 
-        if args.text == "detailed":
-            # Format RAM usage as "used/total" and percent with appropriate units
-            ram = f"{used_ram:.1f}{unitU}B/{total_ram:.0f}{unitT}B ({int((used_ram/total_ram) * 100)}%)"
-        else:
-            # Format RAM usage as "used/total" with appropriate units
-            ram = f"{used_ram:.1f}{unitU}/{total_ram:.0f}{unitT}"
-        return ram
+        try:
+            # Elsewhere (or where /proc is hidden), use psutil to retrieve virtual memory information
+            svmem = psutil.virtual_memory()
+            return {"used": svmem.used, "total": svmem.total}
+        except Exception:
+            # Return None if an exception occurs
+            return None
 
     @staticmethod
     def getSHELL():
@@ -524,7 +546,7 @@ class System():
         Retrieves the battery status and percentage.
 
         Returns:
-            tuple or None: A tuple containing the battery level index (0-9) and the battery percentage,
+            dict or None: The battery "percent" and whether the power is "plugged" in,
             or None if battery information cannot be obtained.
         """
         try:
@@ -539,70 +561,48 @@ class System():
                 battery = psutil.sensors_battery()
                 percent = int(battery.percent)
                 power = battery.power_plugged
-                
-            if power:
-                # if Charging, sets index to -1
-                index = -1
-            else:
-                # else Discharging, sets index to ranges from 0 to 9
-                index = (percent // 10) -1
 
-            if args.text == "detailed":
-                if index == -1:
-                    status = f"{percent}% (charging)"
-                else:
-                    status = f"{percent}% (unplugged)"
-            else:
-                status = f"{percent}%"
-            return index, status  # Return battery status and icon index and percentage
+            return {"percent": percent, "plugged": bool(power)}
         except Exception:
             # Return None if an exception occurs while retrieving battery information
-            return None, None
+            return None
 
     @staticmethod
     def getDISK():
         """
-        Retrieves disk usage information.
+        Retrieves disk usage information, of the main disk and of the other mounts
+        (the ones configured under "storage", or the ones detected on Linux and macOS).
+
+        The mounts are read in parallel, a mount that doesn't answer in time
+        (a hung network file system) is reported as stale instead of holding up the probe.
 
         Returns:
-            tuple or None: A tuple containing available disk space and its unit,
+            dict or None: The "free" and "total" space of the main disk in bytes (None if it is stale),
+            the "volume" label on Windows and the "mounts", main disk first,
             or None if disk information cannot be obtained.
         """
+        settings = config_file.storage or {}
+
+        # On Android, the shared storage rather than the read-only system partition
+        path = ANDROID_STORAGE if system == "android" else "/"
+
+        mounts = settings.get("mounts")
+        if mounts is None:
+            # Android lists the mounts of every app, Windows only has drive letters
+            mounts = storage.detect_mounts() if system not in ("android", "windows") else []
+
         try:
-            if system == "android":
-                # For Android systems, retrieve disk usage information using 'df' command
-                df_path = "/system/bin/df"
-                df_info = subprocess.run(df_path, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, check=True).stdout.strip().split("\n")
+            mounts = storage.usage([path] + [mount for mount in mounts if mount != path], settings.get("timeout", storage.MOUNT_TIMEOUT))
 
-                # Extract relevant columns from the disk usage information
-                disk = getCols(df_info)
+            if not mounts or mounts[0]["mount"] != path:
+                # The main disk failed
+                return None
 
-                avail_bits = int(findStr(disk, "emulated")[3])*1024
-                used_bits = int(findStr(disk, "emulated")[2])*1024
+            disk = {"free": mounts[0]["free"], "total": mounts[0]["total"], "mounts": mounts}
 
-                # Convert available space to human-readable format
-                avail_space = convert_size(avail_bits)
-                total_space = convert_size(used_bits+avail_bits)
-            else:
-                # Get disk usage information for the root directory
-                disk_usage = psutil.disk_usage('/')
-                total_space = convert_size(disk_usage.total)
-
-                # Convert available space to human-readable format
-                avail_space = convert_size(disk_usage.free)
-
-            if system == "windows":
-                # For Windows systems, print which volume label is in use
-                volume_label = os.getcwd().split("\\")[0]  # Extract volume label from current directory
-                if args.text == "detailed":
-                    return f"{avail_space[0]:.1f} {avail_space[-1]}B free of {total_space[0]:.0f} {total_space[-1]}B ({volume_label})"  # Return available disk space with volume label
-                else:
-                    return f"{avail_space[0]:.1f}{avail_space[-1]} ({volume_label})"  # Return available disk space with volume label
-            else:
-                if args.text == "detailed":
-                    return f"{avail_space[0]:.1f} {avail_space[-1]}B free of {total_space[0]:.0f} {total_space[-1]}B"  # Return available disk space with volume label
-                else:
-                    return f"{avail_space[0]:.1f}{avail_space[-1]}"  # Return available disk space
+            # For Windows systems, the volume label in use
+            disk["volume"] = os.getcwd().split("\\")[0] if system == "windows" else None
+            return disk
         except Exception:
             # Return None if an exception occurs while retrieving disk information
             return None
@@ -613,52 +613,23 @@ class System():
         Retrieves the system uptime, i.e., the time since the system was last booted.
 
         Returns:
-            str: A formatted string representing the system uptime.
+            dict: The uptime in "seconds".
             Returns None if the uptime cannot be determined.
         """
-        # Check if the system is Android
-        if system == "android":
-            # Use ctypes to access system information on Android
-            import ctypes, struct
-            libc = ctypes.CDLL("libc.so")
-            buf = ctypes.create_string_buffer(128)
-
-            # Call sysinfo to get system information
-            if libc.sysinfo(buf) < 0:
+        try:
+            # On Linux and Android, read /proc/uptime directly
+            uptime_seconds = procfs.uptime()
+        except (OSError, ValueError, IndexError):
+            try:
+                # Get system boot time using psutil
+                boot_time_timestamp = psutil.boot_time()
+            except Exception:
                 return None
-            uptime_seconds = struct.unpack_from("@l", buf.raw)[0]
-        else:
-            # Get system boot time using psutil
-            boot_time_timestamp = psutil.boot_time()
-            
+
             # Calculate the uptime in seconds
             uptime_seconds = int(time()) - boot_time_timestamp
-        
-        # Calculate days, hours, and minutes
-        uptime_days = uptime_seconds // (24 * 3600)
-        uptime_hours = (uptime_seconds % (24 * 3600)) // 3600
-        uptime_minutes = (uptime_seconds % 3600) // 60
-        uptime_seconds = uptime_seconds % 60  # Remaining seconds
-
-        # Format the output
-        days_str = "day" if uptime_days == 1 else "days"
-        if args.text == "detailed":
-            hours_str = "hour" if uptime_hours < 1 else "hours"
-            mins_str = "min" if uptime_minutes < 2 else "mins"
-        else:
-            hours_str = "hr" if uptime_hours < 1 else "hrs"
 
-        if uptime_days == 0:
-            uptime_days = ""
-        else:
-            uptime_days = f"{int(uptime_days)} {days_str} "
-
-        if args.text == "detailed":
-            uptime = f"{uptime_days}{int(uptime_hours)} {hours_str} {int(uptime_minutes)} {mins_str}"
-        else:
-            uptime = f"{uptime_days}{int(uptime_hours)}.{int(uptime_minutes)//10} {hours_str}"
-
-        return uptime
+        return {"seconds": int(uptime_seconds)}
 
     @staticmethod
     def getWeather():
@@ -666,509 +637,1530 @@ class System():
         Retrieves weather information for a specified location using the OpenWeatherMap API.
 
         Returns:
-            tuple: A tuple containing weather type and temperature in Celsius if successful,
-            otherwise (None, None) if an error occurs.
+            dict: The weather "type", the temperature "temp" and the "feels_like" temperature
+            in Celsius if successful, otherwise None if an error occurs.
         """
 
         # Check if a location argument is provided
         if args.location:
-            # Replace spaces in the location string with URL encoding
-            area = args.location.replace(" ", "%20")
-            open_weather_api = args.weather_api
-            try:
-                # Send a GET request to OpenWeatherMap API
-                req = requests.get(f"https://api.openweathermap.org/data/2.5/weather?q={area}&appid={open_weather_api}&units=metric", timeout=3)
-            except Exception:
-                # If an exception occurs during the request, return None values
-                return None, None
-            
-            # Parse the JSON response
-            jq = req.json()
-            # print(json.dumps(jq, indent=4))
-
-            # Check if the request was successful (status code 200)
-            if req.status_code == 200:
-                # Extract weather type and temperature from the JSON response
-                weather_type = jq["weather"][0]["main"]
-                weather_temp = str(int(jq["main"]["temp"])) + "°C"
-
-                if args.text == "detailed":
-                    weather_feel = jq["main"].get("feels_like", "")
-                    feels_like = f"feels like {int(weather_feel)}" + "°C" if weather_feel else ""
-                    weather_temp = f"{weather_temp} {feels_like}"
-                # Return weather type and temperature
-                return weather_type, weather_temp
-            else:
-                # If the request was not successful, print the error message and exit
-                print_align(req.text, align=align)
-                sys.exit(1)
-        # If no location argument is provided, return None values
-        return None, None
+            settings = config_file.weather or {}
+
+            # Short runs show a stale report at once and refresh it in a detached process,
+            # long running modes fetch it right away through their pooled session
+            on_stale = None if args.watch or args.daemon or args.serve_metrics else refresh_weather_in_background
+
+            weather = get_weather(
+                args.location,
+                args.weather_api,
+                ttl=settings.get("cache_ttl", WEATHER_TTL),
+                stale_ttl=settings.get("stale_ttl", WEATHER_STALE_TTL),
+                refresh=args.refresh_cache or args.refresh_weather,
+                on_stale=on_stale
+            )
+
+            # Unavailable (offline, rate limited or rejected by the API), the widget is hidden
+            if not weather:
+                return None
 
-icon = Icon()
-badge = icon.badge
+            # Extract weather type and temperatures from the report
+            return {"type": weather["type"], "temp": weather["temp"], "feels_like": weather.get("feels_like")}
 
-def main():
-    global arch, cpu_info, color
+        # If no location argument is provided, return None
+        return None
 
-    try:
-        if not any(var for var in [args.stdout, args.json]):
-            if "logo" in args.show:
-                logo_ = "\n" * args.margin + logo
-                print_align(logo_, end="\n")
+class Display():
+    """
+    Formats the raw readings of the probes into the text of their widgets,
+    as set by the text mode. None is shown as no text, the widget is hidden.
+    """
 
-                if args.direction == "row":
-                    for _ in range(logo_len):
-                        sys.stdout.write("\033[F")  # Move cursor up one line
+    @staticmethod
+    def package(reading):
+        if not reading:
+            return None
+        return f"{reading['count']} {reading['manager']}"
 
-        if "logo" == args.show:
-            if args.direction == "row":
-                for _ in range(logo_len):
-                    print()
-            sys.exit(0)
-        
-        if not any(var for var in [args.stdout, args.json]):
-            # Construct the badge string
-            if args.direction == "row":
-                sys.stdout.write(f"\033[{alongside_width}C")  # Move right the cursor
-            
-            loading_info = badge(color=color.green, icon=icon.signal, text="getting info, wait")
-            
-            if args.direction == "row":
-                loading_info_len = print_align(loading_info, align="left", end="\r")
-            
-            else:
-                loading_info_len = print_align(loading_info, end="\r")
+    @staticmethod
+    def frequency(hertz):
+        # Shown in GHz, or MHz below a gigahertz
+        unit = "GHz" if hertz >= FREQUENCY_UNITS["GHz"] else "MHz"
+        return f"{round(hertz / FREQUENCY_UNITS[unit], 1)} {unit}"
 
-        if system == "android":
-            istermux = subprocess.run("pwd", shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, check=True).stdout.strip()
-            if not args.bypass_system_api and "com.termux" in istermux:
-                command = "am startservice -n com.termux.api/.KeepAliveService"
-                try:
-                    output = subprocess.run(command, shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, check=True).stderr.strip()
-                except Exception:
-                    output = None
+    @staticmethod
+    def cpu(reading):
+        if not reading:
+            return None
 
-                if output:
-                    console.print(badge(color=color.red, icon=icon.status[1], text="Termux:API not found, install to continue."))
-                    console.print("https://f-droid.org/en/packages/com.termux.api")
-                    sys.exit(1)
+        if args.text == "detailed":
+            if system == "android":
+                return f"{reading["hardware"]} {Display.frequency(reading["frequency"])}"
+            return f"{reading["brand"]}"
 
-                command = "dpkg -l"
+        # Concatenate frequency and unit to form CPU information string
+        return Display.frequency(reading["frequency"])
 
-                try:
-                    package = subprocess.run(command, shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, check=True).stdout.strip().split("\n")
-                    if any(pkg for pkg in package if "termux-api" in pkg):
-                        package = True
-                    else:
-                        package = False
-                except Exception:
-                    package = None
+    @staticmethod
+    def usage(reading):
+        if not reading:
+            return None
 
-                if not package:
-                    console.print(badge(color=color.red, icon=icon.status[1], text="termux-api package not found, install to continue."))
-                    sys.exit(1)
+        usage = f"{round(reading['percent'])}%"
 
-        # Get detailed CPU info
-        cpu_info = cpuinfo.get_cpu_info()
+        if args.text == "detailed":
+            if reading.get("frequency"):
+                usage = f"{usage} at {Display.frequency(reading['frequency'])}"
+            if reading.get("load"):
+                usage = f"{usage} (load {reading['load'][0]:.2f})"
 
-        try:
-            # Try to get the lowercase username of the current user
-            username = os.getlogin().lower()
-        except Exception:
-            # If unable to get the login name, fallback to the lowercase username from environment variables
-            username = os.environ.get('USER')
+        if args.heatmap and len(reading["cores"]) > 1:
+            # One block per core, as high as the core is busy
+            usage = f"{usage} {sparkline(reading['cores'], 0, 100)}"
 
-        if is_superuser():
-            username = "admin"
+        return usage
 
-        if args.text == "detailed":
-            arch = f"{arch} {cpu_info["bits"]} bits ({cpu_info["count"]})"
+    @staticmethod
+    def ram(reading):
+        if not reading:
+            return None
 
-        # package = System.getPackage()
-        # cpu = System.getCPU()
-        # ram = System.getRAM()
-        # shell = System.getSHELL()
-        # battery = System.getBATTERY()
-        # disk = System.getDISK()
-        # weather = System.getWeather()
+        # Convert total and used RAM sizes to human-readable format
+        total_ram, unitT = convert_size(reading["total"])
+        used_ram, unitU = convert_size(reading["used"])
 
-        sysinfo = {
-            "internet": System.getInternet,
-            "package": System.getPackage,
-            "cpu": System.getCPU,
-            "ram": System.getRAM,
-            "shell": System.getSHELL,
-            "battery": System.getBATTERY,
-            "disk": System.getDISK,
-            "uptime": System.getUPTIME,
-            "weather": System.getWeather
-        }
+        if args.text == "detailed":
+            # Format RAM usage as "used/total" and percent with appropriate units
+            return f"{used_ram:.1f}{unitU}B/{total_ram:.0f}{unitT}B ({int(reading['used'] / reading['total'] * 100)}%)"
 
-        # Create a dummy object to store results using dot notation
-        class InfoObject:
-            pass
+        # Format RAM usage as "used/total" with appropriate units
+        return f"{used_ram:.1f}{unitU}/{total_ram:.0f}{unitT}"
 
-        info = InfoObject()  # Create an instance of the InfoObject class
+    @staticmethod
+    def battery_level(reading):
+        """
+        Returns the battery level index: -1 while charging, else 0 to 9.
+        """
+        if not reading:
+            return None
 
-        with ThreadPoolExecutor(max_workers=len(sysinfo)) as executor:
-            # Submit each function to the executor using a loop
-            futures = {name: executor.submit(func) for name, func in sysinfo.items()}
+        if reading["plugged"]:
+            return -1
+        return (reading["percent"] // 10) - 1
 
-            # Retrieve results and store them in the sysinfo dictionary
-            for name, future in futures.items():
-                # sysinfo[name] = future.result()
-                setattr(info, name, future.result())
+    @staticmethod
+    def battery(reading):
+        if not reading:
+            return None
 
-        # setting network status using ternary operator
-        network = "online" if reqStatus else "offline"
+        percent = reading["percent"]
 
-        # setting network icon to the Class which depends on network status using ternary operator
-        icon.net = icon.online if reqStatus else icon.offline
-        
-        widgets_set = {
-            "username": {
-                "text": username,
-                "color": color.red if is_superuser() else color.green,
-                "icon": icon.user
-            },
-
-            "hostname": {
-                "text": hostname,
-                "color": color.green,
-                "icon": icon.host
-            },
-
-            "platform": {
-                "text": system + " " + release if args.text == "detailed" else system,
-                "color": color.cyan,
-                "icon": icon.os
-            },
-
-            "shell": {
-                "text": info.shell,
-                "color": color.red,
-                "icon": icon.shell
-            },
-
-            "python": {
-                "text": pyversion,
-                "color": color.sky,
-                "icon": icon.python
-            },
-
-            "internet": {
-                "text": network,
-                "color": color.cyan,
-                "icon": icon.net
-            },
-
-            "package": {
-                "text": info.package,
-                "color": color.purple,
-                "icon": icon.package
-            },
-
-            "window": {
-                "text": window_size,
-                "color": color.cyan,
-                "icon": icon.window
-            },
-
-            "arch": {
-                "text": arch,
-                "color": color.green,
-                "icon": icon.arch
-            },
-
-            "cpu": {
-                "text": info.cpu,
-                "color": color.yellow,
-                "icon": icon.cpu
-            },
-
-            "memory": {
-                "text": info.ram,
-                "color": color.cyan,
-                "icon": icon.ram
-            },
-
-            "storage": {
-                "text": info.disk,
-                "color": color.green,
-                "icon": icon.storage
-            },
-            
-            "battery": {
-                "text": info.battery[1],
-                "color": color.sky,
-                "icon": icon.battery.get(info.battery[0], None)
-            },
-
-            "uptime": {
-                "text": info.uptime,
-                "color": color.yellow,
-                "icon": icon.uptime
-            },
-
-            "weather": {
-                "text": info.weather[1],
-                "color": color.yellow,
-                "icon": icon.weather.get(info.weather[0], None)
-            },
-
-            "time": {
-                "text": cftime,
-                "color": color.cyan,
-                "icon": icon.time
-            },
-
-            "date": {
-                "text": today,
-                "color": color.green,
-                "icon": icon.date
-            }
-        }
+        if args.text == "detailed":
+            if reading["plugged"]:
+                return f"{percent}% (charging)"
+            return f"{percent}% (unplugged)"
+        return f"{percent}%"
 
-        if args.stdout:
-            # Iterate over the widgets set
-            for name, widget in widgets_set.items():
-                # Check if the widget has text
-                if widget["text"]:
-                    # Print the widget name and text
-                    print(f"{name.capitalize()}: {widget['text']}")
-            # Exit the program with a success status code
-            sys.exit(0)
+    @staticmethod
+    def size(size, detailed=False):
+        # A size in bytes, human-readable
+        value, unit = convert_size(size)
+        if detailed:
+            return f"{value:.1f} {unit}B"
+        return f"{value:.1f}{unit}"
 
-        try:
-            # Initialize widget_config variable
-            widget_config = None
-            
-            # Try to open the configuration file
-            with open(CONFIG_PATH) as f:
-                if f.read():
-                    # If the file is not empty, load the JSON content
-                    widget_config = json.load(open(CONFIG_PATH))["widgets"]
-        except Exception as err:
-            # Handle exceptions
-            if not "widgets" in str(err):
-                # Check if the error is not related to "widgets" property
-                # If so, print an error message
-                console.print(f"Expecting property name enclosed in double quotes at: {CONFIG_PATH}")
-                sys.exit(0)
+    @staticmethod
+    def disk(reading):
+        if not reading:
+            return None
 
-        if widget_config:
-            try:
-                # Iterate over each widget in the configuration
-                for name, widget in widget_config.items():
-                    try:
-                        # Attempt to retrieve the state of the widget
-                        state = widget["state"]
-                    except Exception:
-                        # If state is not provided, default to "active"
-                        state = "active"
+        if reading["free"] is None:
+            # The main disk didn't answer in time
+            disk = "stale"
+        elif args.text == "detailed":
+            # Convert available and total space to human-readable format
+            total_space = convert_size(reading["total"])
+            disk = f"{Display.size(reading['free'], True)} free of {total_space[0]:.0f} {total_space[-1]}B"
+        else:
+            disk = Display.size(reading["free"])
 
-                    try:
-                        # Retrieve the key 'index' of widget dict.
-                        index = widget["index"]
-
-                        # Retrieve the value associated with the specified name from the widgets_set
-                        value = widgets_set[name]
-
-                        widgets_set = insert_dict(widgets_set, index, name, value)
-                        index = None
-                    except Exception:
-                        pass
-                        # index = list(widgets_set.keys()).index(name)
-
-                    # Check if the widget is disabled
-                    if state == "disabled":
-                        # If disabled, remove the widget from the widgets_set
-                        widgets_set.pop(name)
-                        state = None  # Reset state to None
-                    else:
-                        # If not disabled, update widget properties
-                        # Get text, color, and icon from the widget configuration or use existing values if not provided
-                        text = widget.get("text", widgets_set[name]["text"])
-                        color = widget.get("color", widgets_set[name]["color"])
-                        addon_icon = widget.get("icon", widgets_set[name]["icon"])
-
-                        # Update the widget in the widgets_set if text, color, and icon are provided
-                        if text and color and addon_icon:
-                            widgets_set[name] = {
-                                "text": text,
-                                "color": color,
-                                "icon": addon_icon
-                            }
-            except Exception:
-                # Handle any unexpected errors during iteration
-                console.print(f"widgets not configured properly at: {CONFIG_PATH}")
-                sys.exit(0)
+        if reading.get("volume"):
+            # For Windows systems, show which volume label is in use
+            disk = f"{disk} ({reading['volume']})"
 
-        # Initialize an empty dictionary to store valid widgets
-        widgets = {}
-        # Iterate over the items in the widgets_set dictionary
-        for name, widget in widgets_set.items():
-            try:
-                # Attempt to extract the necessary properties from the widget
-                text = widget["text"]
-                color = widget["color"]
-                addon_icon = widget["icon"]
+        # The mounts other than the main disk
+        mounts = reading.get("mounts", [])[1:]
+        if not mounts:
+            return disk
 
-                # Check if all required properties are present and not empty
-                if text and icon and color:
-                    # Store the provided values in the widgets dictionary, associated with the specific widget name.
-                    widgets[name] = badge(color=color, icon=addon_icon, text=text)
-                    
-            except Exception:
-                # If any error occurs during extraction, continue to the next widget
-                pass
+        if args.text == "detailed":
+            # Every mount, with its free space
+            details = [f"{mount['mount']} stale" if mount["stale"] else f"{mount['mount']} {Display.size(mount['free'], True)} free" for mount in mounts]
+            return ", ".join([disk] + details)
 
-        try:
-            # Attempt to load the widget addons configuration from the specified path
-            widget_addons = json.load(open(CONFIG_PATH))["addons"]
-        except Exception:
-            # If an exception occurs (e.g., file not found, JSON parsing error), set widget_addons to None
-            widget_addons = None
+        # Only the fullest mount, the one likely to run out of space first
+        answered = [mount for mount in mounts if not mount["stale"] and mount["total"]]
+        stale = len(mounts) - len(answered)
+        details = []
 
-        if widget_addons:
-            try:
-                for name, widget in widget_addons.items():
-                    # Retrieve widget properties from the widget configuration or set default values if not provided
-                    text   = widget.get("text", None)
-                    addon_exec  = widget.get("exec", None)
-                    script = widget.get("script", None)
-                    addon_color  = widget.get("color", "na")
-                    addon_icon  = widget.get("icon", "na")
-                    index  = widget.get("index", len(widgets))
-
-                    if addon_exec:
-                        # Execute the command and capture the output
-                        process = subprocess.run(addon_exec, shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, check=True)
-                        if process.stdout:
-                            text = process.stdout.strip()
-                        else:
-                            # Print an error message indicating an invalid script
-                            console.print(f"invalid script for '{name}' widget addon at: {CONFIG_PATH}")
-                            sys.exit(1)
-                        
-                    elif script:
-                        # Check if the script path is absolute and if the file exists
-                        if os.path.isabs(script):
-                            if os.path.isfile(script):
-                                with open(script) as f:
-                                    script = f.read()
-                                    # Check if the script content is empty
-                                    if not script.strip():
-                                        # Print an error message and exit if the script file is empty
-                                        console.print(f"script file is empty for {name} widget addon at: {CONFIG_PATH}")
-                                        sys.exit(1)
-                            else:
-                                # Print an error message and exit if the script path is not found
-                                console.print(f"script path not found for {name} widget addon at: {CONFIG_PATH}")
-                                sys.exit(1)
-
-                        try:
-                            # Backup sys.stdout to preserve the original output stream
-                            stdout_backup = sys.stdout
-                            # Redirect sys.stdout to a StringIO object to capture script output
-                            sys.stdout = StringIO()
-                            # Execute the script
-                            exec(script)
-                            # Get the captured output and strip any leading/trailing whitespace
-                            text = sys.stdout.getvalue().strip()
-                            # Restore sys.stdout to its original value
-                            sys.stdout = stdout_backup
-                        except Exception:
-                            # If an exception occurs during script execution or output capture
-                            # Restore sys.stdout to its original value
-                            sys.stdout = stdout_backup
-                            # Print an error message indicating an invalid python code
-                            console.print(f"invalid python code for '{name}' widget addon at: {CONFIG_PATH}")
-                            # Exit the program with an error status code
-                            sys.exit(1)
-
-                    # Check if text is provided
-                    if text:
-                        # Check if icon is "na"
-                        if addon_icon == "na":
-                            # Construct the widget value with default icon
-                            value = badge(color=addon_color, text=text)
-                            # Insert the widget into the widgets dictionary at the specified index
-                            widgets = insert_dict(widgets, index, name, value)
-
-                        # Check if text, addon_color, and addon_icon are provided
-                        elif not addon_color == "na" and not addon_icon == "na":
-                            # Construct the widget value with provided icon
-                            value = badge(color=addon_color, icon=addon_icon, text=text)
-                            # Insert the widget into the widgets dictionary at the specified index
-                            widgets = insert_dict(widgets, index, name, value)
-                        else:
-                            # Print an error message if the addon widget is not properly configured
-                            console.print(f"'{name}' addon widget not configured properly at: {CONFIG_PATH}")
-                            # Exit the program with an error status code
-                            sys.exit(1)
-
-                        # Insert the widget into the widgets_set dictionary with its properties
-                        widgets_set = insert_dict(widgets_set, len(widgets_set), name, {"text": text, "color": addon_color, "icon": addon_icon})
+        if answered:
+            fullest = max(answered, key=lambda mount: 1 - mount["free"] / mount["total"])
+            details.append(f"{fullest['mount']} {int((1 - fullest['free'] / fullest['total']) * 100)}%")
+        if stale:
+            details.append(f"{stale} stale")
 
+        return f"{disk} ({', '.join(details)})" if details else disk
+
+    @staticmethod
+    def uptime(reading):
+        if not reading:
+            return None
+
+        uptime_seconds = reading["seconds"]
+
+        # Calculate days, hours, and minutes
+        uptime_days = uptime_seconds // (24 * 3600)
+        uptime_hours = (uptime_seconds % (24 * 3600)) // 3600
+        uptime_minutes = (uptime_seconds % 3600) // 60
+
+        # Format the output
+        days_str = "day" if uptime_days == 1 else "days"
+        if args.text == "detailed":
+            hours_str = "hour" if uptime_hours < 1 else "hours"
+            mins_str = "min" if uptime_minutes < 2 else "mins"
+        else:
+            hours_str = "hr" if uptime_hours < 1 else "hrs"
+
+        if uptime_days == 0:
+            uptime_days = ""
+        else:
+            uptime_days = f"{int(uptime_days)} {days_str} "
+
+        if args.text == "detailed":
+            return f"{uptime_days}{int(uptime_hours)} {hours_str} {int(uptime_minutes)} {mins_str}"
+        return f"{uptime_days}{int(uptime_hours)}.{int(uptime_minutes)//10} {hours_str}"
+
+    @staticmethod
+    def weather(reading):
+        if not reading:
+            return None
+
+        weather_temp = str(int(reading["temp"])) + "°C"
+
+        if args.text == "detailed":
+            weather_feel = reading.get("feels_like")
+            feels_like = f"feels like {int(weather_feel)}" + "°C" if weather_feel else ""
+            weather_temp = f"{weather_temp} {feels_like}"
+
+        return weather_temp
+
+icon = Icon()
+badge = icon.badge
+
+# Each probe with the widget it feeds, the value used when the widget is disabled
+# and how often (in seconds) the daemon refreshes it
+sysinfo = {
+    "internet": (System.getInternet, "internet", None, 30),
+    "package": (System.getPackage, "package", None, 300),
+    "cpu": (System.getCPU, "cpu", None, 3600),
+    "usage": (System.getUsage, "usage", None, 5),
+    "ram": (System.getRAM, "memory", None, 5),
+    "shell": (System.getSHELL, "shell", None, None),  # depends on the terminal, never served by the daemon
+    "battery": (System.getBATTERY, "battery", None, 30),
+    "disk": (System.getDISK, "storage", None, 30),
+    "uptime": (System.getUPTIME, "uptime", None, 30),
+    "weather": (System.getWeather, "weather", None, 600)
+}
+
+# Each widget with a sparkline: the probe feeding it and the function
+# returning the value recorded in the history from the probe reading
+HISTORY_METRICS = {
+    "usage": ("usage", lambda reading: reading["percent"]),
+    "memory": ("ram", lambda reading: reading["used"] / reading["total"] * 100),
+    "storage": ("disk", lambda reading: (reading["total"] - reading["free"]) / reading["total"] * 100)
+}
+
+# The unit of each raw value in the readings of the probes, see `build_snapshot`
+READING_UNITS = {
+    "internet": {"online": None},
+    "package": {"count": None, "manager": None},
+    "cpu": {"brand": None, "hardware": None, "frequency": "hertz", "bits": None, "count": None},
+    "usage": {"percent": "percent", "cores": "percent", "frequency": "hertz", "load": None},
+    "ram": {"used": "bytes", "total": "bytes"},
+    "battery": {"percent": "percent", "plugged": None},
+    "disk": {"free": "bytes", "total": "bytes", "volume": None, "mounts": None},
+    "uptime": {"seconds": "seconds"},
+    "weather": {"type": None, "temp": "celsius", "feels_like": "celsius"}
+}
+
+def load_widget_config():
+    """
+    Loads the built-in widgets configuration from the configuration file.
+
+    Returns:
+        dict or None: The "widgets" configuration, or None if not configured.
+    """
+    if config_file.invalid:
+        # The configuration file is not valid JSON
+        console.print(f"Expecting property name enclosed in double quotes at: {CONFIG_PATH}")
+        sys.exit(0)
+
+    if "widgets" in config_file.errors:
+        console.print(f"widgets not configured properly at: {CONFIG_PATH}")
+        sys.exit(0)
+
+    return config_file.widgets
+
+def get_disabled(widget_config):
+    try:
+        # Collect the widgets disabled in the configuration, their probes are skipped
+        disabled = [name for name, widget in (widget_config or {}).items() if widget.get("state") == "disabled"]
+        # Along with the ones disabled by default and not activated
+        return disabled + [name for name in DEFAULT_DISABLED if (widget_config or {}).get(name, {}).get("state") != "active"]
+    except Exception:
+        console.print(f"widgets not configured properly at: {CONFIG_PATH}")
+        sys.exit(0)
+
+def probe_settings(disabled):
+    # The arguments that change what the probes return, a daemon snapshot
+    # is only used when it was collected with the same settings
+    return {"readings": READINGS_VERSION, "location": args.location, "disabled": sorted(disabled)}
+
+def collected_probes(disabled):
+    # Probes that depend on the terminal, or whose widget is disabled, are left to the client
+    return {
+        name: (func, default, interval)
+        for name, (func, widget, default, interval) in sysinfo.items()
+        if interval and widget not in disabled
+    }
+
+def run_daemon():
+    disabled = get_disabled(load_widget_config())
+
+    on_refresh = None
+    if args.sparkline:
+        # Keep the history of the metrics for the runs showing sparklines
+        history.load()
+
+        def on_refresh(name, value):
+            record_history(name, value)
+            history.save()
+
+    console.print(badge(color=color.green, icon=icon.signal, text=f"daemon serving at: {SOCKET_PATH}"))
+    try:
+        serve(collected_probes(disabled), probe_settings(disabled), on_refresh)
+    except (OSError, RuntimeError) as err:
+        console.print(badge(color=color.red, icon=icon.status[1], text=str(err)))
+        sys.exit(1)
+
+def run_metrics_server():
+    """
+    Serves the raw readings of the probes as OpenMetrics over HTTP, each probe
+    refreshed on its own interval, until interrupted.
+    """
+    from .metrics import serve as serve_metrics, parse_address
+
+    disabled = get_disabled(load_widget_config())
+
+    try:
+        host, port = parse_address(args.serve_metrics)
+    except ValueError:
+        console.print(badge(color=color.red, icon=icon.status[1], text=f"invalid metrics address: {args.serve_metrics}"))
+        sys.exit(1)
+
+    url = f"http://[{host}]:{port}/metrics" if ":" in host else f"http://{host}:{port}/metrics"
+    console.print(badge(color=color.green, icon=icon.signal, text=f"metrics serving at: {url}"))
+    try:
+        serve_metrics((host, port), collected_probes(disabled))
+    except OSError as err:
+        console.print(badge(color=color.red, icon=icon.status[1], text=str(err)))
+        sys.exit(1)
+
+def run_textfile():
+    """
+    Writes the raw readings of the probes as OpenMetrics to `args.textfile`,
+    atomically, once or every `args.watch` seconds.
+    """
+    from .metrics import render, write_textfile
+
+    disabled = get_disabled(load_widget_config())
+    # The shell widget has no metrics, its probe is skipped
+    info = probe(disabled, names=list(collected_probes(disabled)))
+    last_run = {name: time() for name in sysinfo}
+
+    while True:
+        try:
+            write_textfile(args.textfile, render(vars(info)))
+        except OSError as err:
+            console.print(badge(color=color.red, icon=icon.status[1], text=str(err)))
+            sys.exit(1)
+
+        if not args.watch:
+            return
+
+        sleep(args.watch)
+        probe(disabled, info, due_probes(last_run))
+
+# Create a dummy object to store results using dot notation
+class InfoObject:
+    pass
+
+def get_username():
+    try:
+        # Try to get the lowercase username of the current user
+        username = os.getlogin().lower()
+    except Exception:
+        # If unable to get the login name, fallback to the lowercase username from environment variables
+        username = os.environ.get('USER')
+
+    if is_superuser():
+        username = "admin"
+
+    return username
+
+def new_info():
+    info = InfoObject()  # Create an instance of the InfoObject class
+
+    for name, (func, widget, default, interval) in sysinfo.items():
+        # Disabled widgets keep their default value and their probe never runs
+        setattr(info, name, default)
+
+    return info
+
+def start_probes(disabled, info, names=None):
+    """
+    Stores the results a running daemon has in `info` and starts the remaining
+    probes of the shown widgets concurrently.
+
+    Args:
+        disabled (list): The disabled widgets, their probes are skipped.
+        info (InfoObject): The results to update.
+        names (list): Only run these probes, all of them if not provided.
+
+    Returns:
+        dict: The probe name of each running probe, by its future.
+    """
+    if names is None:
+        names = list(sysinfo)
+
+    # Use the results of a running daemon when it has them
+    results = {name: value for name, value in (fetch(probe_settings(disabled)) or {}).items() if name in names}
+
+    for name, value in results.items():
+        setattr(info, name, value)
+
+    # Run the remaining probes whose widget is shown
+    probes = [
+        name for name in names
+        if any(widget not in disabled for widget in fed_widgets(name)) and name not in results and can_read(name)
+    ]
+
+    for name in [name for name in probes if name in INSTANT_PROBES]:
+        # Done at once, no cell is reserved for them
+        set_result(info, name, profiler.task(f"probe:{name}", sysinfo[name][0])())
+        probes.remove(name)
+
+    if not probes:
+        return {}
+
+    executor = ThreadPoolExecutor(max_workers=len(probes))
+    running = {executor.submit(profiler.task(f"probe:{name}", sysinfo[name][0])): name for name in probes}
+
+    # The worker threads exit on their own once every probe is done
+    executor.shutdown(wait=False)
+    return running
+
+def fed_widgets(name):
+    # The widgets shown from the reading of the probe `name`
+    widgets = [sysinfo[name][1]]
+
+    if name == "cpu" and args.text == "detailed":
+        # The detailed arch shows the bits and cores of the CPU
+        widgets.append("arch")
+
+    return widgets
+
+def can_read(name):
+    """
+    Returns whether the probe `name` may have a reading on this system, the ones
+    that can't are neither run nor given a placeholder cell.
+    """
+    if name == "weather":
+        # Only shown for the location given with --weather
+        return bool(args.location)
+
+    if name == "battery" and system == "linux":
+        try:
+            # Desktops and servers have no battery
+            return bool(procfs.batteries())
+        except OSError:
+            return True
+
+    return True
+
+def set_result(info, name, value):
+    # Stores the result of a probe run by this process, its metrics feed the history
+    setattr(info, name, value)
+
+    if args.sparkline:
+        record_history(name, value)
+
+def record_history(name, value):
+    """
+    Records the metrics of the widgets fed by the probe `name` in the history.
+    """
+    for widget, (probe_name, metric) in HISTORY_METRICS.items():
+        if probe_name == name and value:
+            try:
+                history.record(widget, metric(value))
+            except (KeyError, TypeError, ZeroDivisionError):
+                pass
+
+def probe(disabled, info=None, names=None):
+    """
+    Runs the probes of the shown widgets and stores their results in `info`.
+
+    Args:
+        disabled (list): The disabled widgets, their probes are skipped.
+        info (InfoObject): The results to update, a new one is created if not provided.
+        names (list): Only run these probes, all of them if not provided.
+
+    Returns:
+        InfoObject: The probe results, accessible by probe name.
+    """
+    if info is None:
+        info = new_info()
+
+    running = start_probes(disabled, info, names)
+    for future in as_completed(running):
+        set_result(info, running[future], future.result())
+
+    return info
+
+def reserve(widgets_set, running):
+    """
+    Fills the cells of the widgets whose probe is still running with a
+    placeholder, so they keep their place in the layout until their result arrives.
+    """
+    for name in running.values():
+        for widget in fed_widgets(name):
+            widget = widgets_set.get(widget)
+
+            if widget is not None:
+                widget["text"] = PENDING
+                # Widgets like battery or weather only get their icon from the result
+                widget["icon"] = widget["icon"] or icon.signal
+
+    return widgets_set
+
+def build_widgets_set(info, username, disabled):
+    """
+    Builds the built-in widgets from the probe results.
+
+    Returns:
+        dict: The text, color and icon of each built-in widget.
+    """
+    arch_text = arch
+
+    if args.text == "detailed" and info.cpu:
+        # The bits and cores probed along with the cpu widget
+        arch_text = f"{arch} {info.cpu["bits"]} bits ({info.cpu["count"]})"
+
+    # setting network status using ternary operator
+    network = "online" if info.internet else "offline"
+
+    # setting network icon to the Class which depends on network status using ternary operator
+    icon.net = icon.online if info.internet else icon.offline
+
+    # The time and date are read on every build, so they stay current in watch mode
+    cftime, today = clock()
+
+    return {
+        "username": {
+            "text": username,
+            "color": color.red if is_superuser() else color.green,
+            "icon": icon.user
+        },
+
+        "hostname": {
+            "text": hostname,
+            "color": color.green,
+            "icon": icon.host
+        },
+
+        "platform": {
+            "text": system + " " + release if args.text == "detailed" else system,
+            "color": color.cyan,
+            "icon": icon.os
+        },
+
+        "shell": {
+            "text": info.shell,
+            "color": color.red,
+            "icon": icon.shell
+        },
+
+        "python": {
+            "text": pyversion,
+            "color": color.sky,
+            "icon": icon.python
+        },
+
+        "internet": {
+            "text": network,
+            "color": color.cyan,
+            "icon": icon.net
+        },
+
+        "package": {
+            "text": Display.package(info.package),
+            "color": color.purple,
+            "icon": icon.package
+        },
+
+        "window": {
+            "text": window_size,
+            "color": color.cyan,
+            "icon": icon.window
+        },
+
+        "arch": {
+            "text": arch_text,
+            "color": color.green,
+            "icon": icon.arch
+        },
+
+        "cpu": {
+            "text": Display.cpu(info.cpu),
+            "color": color.yellow,
+            "icon": icon.cpu
+        },
+
+        "usage": {
+            "text": Display.usage(info.usage),
+            "color": color.red,
+            "icon": icon.usage
+        },
+
+        "memory": {
+            "text": Display.ram(info.ram),
+            "color": color.cyan,
+            "icon": icon.ram
+        },
+
+        "storage": {
+            "text": Display.disk(info.disk),
+            "color": color.green,
+            "icon": icon.storage
+        },
+        
+        "battery": {
+            "text": Display.battery(info.battery),
+            "color": color.sky,
+            "icon": icon.battery.get(Display.battery_level(info.battery), None)
+        },
+
+        "uptime": {
+            "text": Display.uptime(info.uptime),
+            "color": color.yellow,
+            "icon": icon.uptime
+        },
+
+        "weather": {
+            "text": Display.weather(info.weather),
+            "color": color.yellow,
+            "icon": icon.weather.get((info.weather or {}).get("type"), None)
+        },
+
+        "time": {
+            "text": cftime,
+            "color": color.cyan,
+            "icon": icon.time
+        },
+
+        "date": {
+            "text": today,
+            "color": color.green,
+            "icon": icon.date
+        }
+    }
+
+def configure_widgets(widgets_set, widget_config):
+    """
+    Applies the "widgets" configuration (index, state, text, color, icon) to the built-in widgets.
+    """
+    if widget_config:
+        # Where each widget goes, the order is resolved once all of them are placed
+        layout = Layout(widgets_set)
+
+        try:
+            # Iterate over each widget in the configuration
+            for name, widget in widget_config.items():
+                try:
+                    # Attempt to retrieve the state of the widget
+                    state = widget["state"]
+                except Exception:
+                    # If state is not provided, default to "active"
+                    state = "active"
+
+                try:
+                    # Retrieve the key 'index' of widget dict.
+                    index = widget["index"]
+
+                    # Only the widgets in the widgets_set can be moved
+                    if name in layout:
+                        layout.move(name, index)
+                    index = None
+                except Exception:
+                    pass
+                    # index = list(widgets_set.keys()).index(name)
+
+                # Check if the widget is disabled
+                if state == "disabled":
+                    # If disabled, remove the widget from the widgets_set
+                    widgets_set.pop(name)
+                    layout.remove(name)
+                    state = None  # Reset state to None
+                else:
+                    # If not disabled, update widget properties
+                    # Get text, color, and icon from the widget configuration or use existing values if not provided
+                    text = widget.get("text", widgets_set[name]["text"])
+                    widget_color = widget.get("color", widgets_set[name]["color"])
+                    addon_icon = widget.get("icon", widgets_set[name]["icon"])
+
+                    # Update the widget in the widgets_set if text, color, and icon are provided
+                    if text and widget_color and addon_icon:
+                        widgets_set[name] = {
+                            "text": text,
+                            "color": widget_color,
+                            "icon": addon_icon
+                        }
+        except Exception:
+            # Handle any unexpected errors during iteration
+            console.print(f"widgets not configured properly at: {CONFIG_PATH}")
+            sys.exit(0)
+
+        widgets_set = {name: widgets_set[name] for name in layout.resolve()}
+
+    return widgets_set
+
+def build_badges(widgets_set):
+    """
+    Builds the badge of every widget that has text, color and icon.
+
+    Returns:
+        dict: The badge markup of each widget.
+    """
+    # Initialize an empty dictionary to store valid widgets
+    widgets = {}
+
+    with profiler.phase("badges"):
+        # Iterate over the items in the widgets_set dictionary
+        for name, widget in widgets_set.items():
+            try:
+                # Attempt to extract the necessary properties from the widget
+                text = widget["text"]
+                widget_color = widget["color"]
+                addon_icon = widget["icon"]
+
+                # The recent trend of the widget, if it has one
+                spark = sparkline(history.values(name, SPARK_WIDTH), min_span=SPARK_MIN_SPAN) if args.sparkline and text != PENDING else None
+
+                # Check if all required properties are present and not empty
+                if text and icon and widget_color:
+                    # Store the provided values in the widgets dictionary, associated with the specific widget name.
+                    widgets[name] = badge(color=widget_color, icon=addon_icon, text=text, spark=spark)
+                    
             except Exception:
-                # Handle any exceptions that occur during addon widget configuration
-                console.print(f"addons not configured properly at: {CONFIG_PATH}")
-                # Exit the program with an error status code
+                # If any error occurs during extraction, continue to the next widget
+                pass
+
+    return widgets
+
+def run_exec(command, timeout):
+    """
+    Runs the shell command of an exec addon and returns its output.
+
+    On timeout the command is killed along with everything it started,
+    so nothing is left holding the output pipe, and TimeoutExpired is raised.
+    """
+    process = subprocess.Popen(command, shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, start_new_session=True)
+
+    try:
+        stdout, stderr = process.communicate(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        if hasattr(os, "killpg"):
+            # The shell runs in its own session, kill the whole process group
+            os.killpg(process.pid, signal.SIGKILL)
+        else:
+            process.kill()
+        process.communicate()
+        raise
+
+    if process.returncode:
+        raise subprocess.CalledProcessError(process.returncode, command, stdout, stderr)
+
+    return stdout
+
+def load_script(name, script):
+    """
+    Reads the Python code of a script addon, or the script file it points to, and compiles it.
+
+    Returns:
+        bytes: The compiled code, as expected by `ScriptPool.run`.
+    """
+    # Check if the script path is absolute and if the file exists
+    if os.path.isabs(script):
+        if os.path.isfile(script):
+            with open(script) as f:
+                script = f.read()
+                # Check if the script content is empty
+                if not script.strip():
+                    # Print an error message and exit if the script file is empty
+                    console.print(f"script file is empty for {name} widget addon at: {CONFIG_PATH}")
+                    sys.exit(1)
+        else:
+            # Print an error message and exit if the script path is not found
+            console.print(f"script path not found for {name} widget addon at: {CONFIG_PATH}")
+            sys.exit(1)
+
+    try:
+        return compile_script(script, name)
+    except Exception:
+        # Print an error message indicating an invalid python code
+        console.print(f"invalid python code for '{name}' widget addon at: {CONFIG_PATH}")
+        # Exit the program with an error status code
+        sys.exit(1)
+
+def addon_cache_name(name, addon):
+    # Editing the command or script of an addon starts a new cache
+    digest = hashlib.sha1(json.dumps([name, addon.get("exec"), addon.get("script")]).encode()).hexdigest()
+    return f"addon-{digest[:16]}"
+
+def cache_addon(name, addon, output):
+    # Only addons with a cache_ttl keep their output
+    if addon.get("cache_ttl"):
+        store(addon_cache_name(name, addon), {"time": time(), "output": output})
+
+def spawn_detached(options):
+    """
+    Starts a detached twidgets process with the given options, it keeps
+    running after this one exits and never writes to the terminal.
+    """
+    try:
+        subprocess.Popen(
+            [sys.executable, "-m", "twidgets", *options, "--config", CONFIG_PATH],
+            stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+            start_new_session=True
+        )
+    except Exception:
+        # The stale value stays until a run that can refresh it
+        pass
+
+def refresh_in_background(name, addon, cached):
+    """
+    Starts a detached twidgets process that runs the addon again and caches its
+    output, so the next run shows a fresh value while this one doesn't wait.
+    """
+    now = time()
+    # A refresh already started recently, don't run the addon twice
+    if now - cached.get("refreshing", 0) < addon.get("timeout", ADDON_TIMEOUT):
+        return
+
+    cached["refreshing"] = now
+    store(addon_cache_name(name, addon), cached)
+
+    spawn_detached(["--refresh-addon", name])
+
+def refresh_weather_in_background():
+    # Fetches the weather report for the next run in a detached process
+    options = ["--refresh-weather", "--weather", args.location]
+
+    # Only an API key given on the command line has to be passed on, keep it off the process list otherwise
+    if args.weather_api != config_file.weather_api:
+        options += ["--weather-api", args.weather_api]
+
+    spawn_detached(options)
+
+def cached_addon(name, addon):
+    """
+    Returns the cached output of an addon with a cache_ttl, if it may still be shown.
+
+    An output older than cache_ttl is still shown for stale_ttl more seconds,
+    while it is refreshed in the background for the next run.
+
+    Returns:
+        str or None: The cached output, or None if the addon has to run.
+    """
+    cache_ttl = addon.get("cache_ttl")
+    if not cache_ttl or args.refresh_cache:
+        return None
+
+    cached = load(addon_cache_name(name, addon))
+    if not cached:
+        return None
+
+    age = time() - cached["time"]
+    if age < cache_ttl:
+        return cached["output"]
+
+    if age < cache_ttl + addon.get("stale_ttl", 0):
+        refresh_in_background(name, addon, cached)
+        return cached["output"]
+
+    return None
+
+def exec_addon(name, addon):
+    # Runs the command of an exec addon and caches its output
+    output = run_exec(addon["exec"], addon.get("timeout", ADDON_TIMEOUT))
+    cache_addon(name, addon, output)
+    return output
+
+def script_addon(name, addon, code):
+    # Runs the code of a script addon in the worker pool and caches its output
+    output = script_pool.run(code, addon.get("timeout", ADDON_TIMEOUT))
+    cache_addon(name, addon, output)
+    return output
+
+def refresh_addon(name):
+    """
+    Runs a single addon and caches its output, for `--refresh-addon`.
+    """
+    addon = (config_file.addons or {}).get(name)
+    if not addon:
+        return
+
+    if addon.get("exec"):
+        exec_addon(name, addon)
+    elif addon.get("script"):
+        script_addon(name, addon, load_script(name, addon["script"]))
+
+def start_addons():
+    """
+    Starts the exec and script addons in the background, so they run
+    concurrently with the system probes instead of after them.
+
+    Returns:
+        dict: The pending output (a future) of each exec and script addon,
+        and the output of each addon with a cached value, by name.
+    """
+    pending = {}
+    commands = {}
+    scripts = {}
+
+    for name, addon in (config_file.addons or {}).items():
+        output = cached_addon(name, addon)
+
+        if output is not None:
+            pending[name] = Future()
+            pending[name].set_result(output)
+        elif addon.get("exec"):
+            commands[name] = addon
+        elif addon.get("script"):
+            scripts[name] = addon
+
+    if scripts:
+        # Fork the script workers first, before any thread is running
+        script_pool.start(len(scripts))
+        scripts = {name: (addon, load_script(name, addon["script"])) for name, addon in scripts.items()}
+
+    if commands or scripts:
+        # Each thread waits on a command or on a script running in the worker pool
+        executor = ThreadPoolExecutor(max_workers=len(commands) + len(scripts))
+        for name, addon in commands.items():
+            pending[name] = executor.submit(profiler.task(f"addon:{name}", exec_addon, name, addon))
+        for name, (addon, code) in scripts.items():
+            pending[name] = executor.submit(profiler.task(f"addon:{name}", script_addon, name, addon, code))
+
+        # The worker threads exit on their own once every command is done
+        executor.shutdown(wait=False)
+
+    return pending
+
+def run_addons(widgets, widgets_set, pending=None, wait=True):
+    """
+    Runs the configured addons and inserts their badges among the widgets.
+
+    Args:
+        pending (dict): The addons already started by `start_addons`, started here if not provided.
+        wait (bool): Wait for the started addons, otherwise the ones not done yet show a placeholder.
+
+    Returns:
+        tuple: The updated widgets badges and widgets set.
+    """
+    if pending is None:
+        pending = start_addons()
+
+    if "addons" in config_file.errors:
+        console.print(f"addons not configured properly at: {CONFIG_PATH}")
+        sys.exit(1)
+
+    # The addons configuration, already validated when the configuration file was loaded
+    widget_addons = config_file.addons
+
+    if widget_addons:
+        # Where each addon goes among the widgets, the order is resolved once all of them are placed
+        layout = Layout(widgets)
+
+        try:
+            for name, widget in widget_addons.items():
+                # Retrieve widget properties from the widget configuration or set default values if not provided
+                text   = widget.get("text", None)
+                addon_exec  = widget.get("exec", None)
+                script = widget.get("script", None)
+                addon_color  = widget.get("color", "na")
+                addon_icon  = widget.get("icon", "na")
+                # Without an index, the addon goes after the others
+                index  = widget.get("index", None)
+
+                if (addon_exec or script) and not wait and not pending[name].done():
+                    # Keep its cell until the addon is done
+                    text = PENDING
+
+                elif addon_exec:
+                    try:
+                        # Wait for the command started along with the probes (or its cached output)
+                        output = pending[name].result()
+                    except subprocess.TimeoutExpired:
+                        # A hung or slow command must not stall the render, show a placeholder instead
+                        output = ADDON_PLACEHOLDER
+
+                    if output:
+                        text = output.strip()
+                    else:
+                        # Print an error message indicating an invalid script
+                        console.print(f"invalid script for '{name}' widget addon at: {CONFIG_PATH}")
+                        sys.exit(1)
+                    
+                elif script:
+                    try:
+                        # Wait for the script started along with the probes (or its cached output)
+                        output = pending[name].result()
+                    except TimeoutError:
+                        # A hung or slow script must not stall the render, show a placeholder instead
+                        output = ADDON_PLACEHOLDER
+                    except ScriptError:
+                        # Print an error message indicating an invalid python code
+                        console.print(f"invalid python code for '{name}' widget addon at: {CONFIG_PATH}")
+                        # Exit the program with an error status code
+                        sys.exit(1)
+
+                    # Strip any leading/trailing whitespace of the captured output
+                    text = output.strip()
+
+                # Check if text is provided
+                if text:
+                    # Check if icon is "na"
+                    if addon_icon == "na":
+                        # Construct the widget value with default icon
+                        widgets[name] = badge(color=addon_color, text=text)
+                        # Place the widget at the specified index
+                        layout.add(name, index)
+
+                    # Check if text, addon_color, and addon_icon are provided
+                    elif not addon_color == "na" and not addon_icon == "na":
+                        # Construct the widget value with provided icon
+                        widgets[name] = badge(color=addon_color, icon=addon_icon, text=text)
+                        # Place the widget at the specified index
+                        layout.add(name, index)
+                    else:
+                        # Print an error message if the addon widget is not properly configured
+                        console.print(f"'{name}' addon widget not configured properly at: {CONFIG_PATH}")
+                        # Exit the program with an error status code
+                        sys.exit(1)
+
+                    # Add the widget to the end of the widgets_set dictionary with its properties
+                    widgets_set.pop(name, None)
+                    widgets_set[name] = {"text": text, "color": addon_color, "icon": addon_icon}
+
+        except Exception:
+            # Handle any exceptions that occur during addon widget configuration
+            console.print(f"addons not configured properly at: {CONFIG_PATH}")
+            # Exit the program with an error status code
+            sys.exit(1)
+
+        widgets = {name: widgets[name] for name in layout.resolve()}
+
+    return widgets, widgets_set
+
+def split_rows(widgets):
+    # Extract the values (widget information) from the widgets dictionary and convert them into a list
+    widget_values = list(widgets.values())
+    # Divide the widget values into rows based on the specified number of columns
+    return [widget_values[i:i+args.column] for i in range(0, len(widget_values), args.column)]
+
+def to_ansi(renderable):
+    """
+    Renders rich markup (or a rich Text) to a string with its ANSI codes, without writing it.
+    """
+    with console.capture() as capture:
+        console.print(renderable, end="", soft_wrap=True)
+    return capture.get()
+
+def render_markup(markup):
+    # The badges markup as rich Text, styled and highlighted as console.print would
+    return console.render_str(markup)
+
+@lru_cache(maxsize=1024)
+def parse_badge(markup):
+    # A badge as rich Text, parsed once, the same badges come back on every refresh
+    return render_markup(markup)
+
+@lru_cache(maxsize=1024)
+def badge_ansi(markup):
+    # A badge with its ANSI codes, rendered once
+    return to_ansi(parse_badge(markup))
+
+def join_badges(badges):
+    # The badges of a row, pre-parsed, as a single rich Text
+    return rich_text.Text(" " * args.row_gap).join(parse_badge(badge) for badge in badges)
+
+def get_logo_lines():
+    """
+    Returns the lines of the logo as rich Text, parsed only once per run.
+    """
+    global logo_lines
+
+    if logo_lines is None:
+        with profiler.phase("logo"):
+            if contains_escape_code(logo):
+                logo_lines = list(rich_text.Text.from_ansi(logo).split("\n"))
+            else:
+                logo_lines = list(render_markup(logo).split("\n"))
+
+            # Blank lines at the end of the art are not part of the logo
+            logo_lines = logo_lines[:logo_asset.height]
+    return logo_lines
+
+def compose(widget_rows, full=True):
+    """
+    Lays out the logo and the widget rows into a single frame, the position of
+    every row computed from the measured width of the logo and of the rows.
+
+    Args:
+        widget_rows (list): The badges of each row.
+        full (bool): The whole frame, or only from the line of the first row on,
+        to draw the rows again in place (the logo above them is left out).
+
+    Returns:
+        tuple: The frame, as a string with its ANSI codes, and for each row the
+        number of lines above the final cursor position and the column where the row starts.
+    """
+    Text = rich_text.Text
+    rows = [join_badges(widget) for widget in widget_rows]
+    show_logo = "logo" in args.show
+
+    lines = []
+    # Line and column of each row in the frame
+    positions = []
+
+    if full and show_logo:
+        lines += [Text()] * args.margin
+
+    if args.direction == "row":
+        # The rows are placed right of the logo, one every column gap lines
+        art = get_logo_lines() if show_logo else []
+        height = max(logo_len, len(rows) * args.column_gap)
+
+        for index in range(height):
+            line = art[index].copy() if index < len(art) else Text()
+            row, gap = divmod(index, args.column_gap)
+
+            if not gap and row < len(rows):
+                # Pad (or cut) the logo line to where the widgets start
+                line.truncate(alongside_width, pad=True)
+                positions.append([len(lines), alongside_width])
+                line.append_text(rows[row])
+
+            lines.append(line)
+    else:
+        if full and show_logo:
+            art = get_logo_lines()
+            padding = " " * get_padding(logo_asset.width)
+            lines += [Text(padding) + line for line in art]
+
+        for row in rows:
+            column = get_padding(row.cell_len)
+            positions.append([len(lines), column])
+            lines.append(Text(" " * column) + row)
+            lines += [Text()] * (args.column_gap - 1)
+
+    # The margin below the frame, at least the line the cursor ends on
+    final = len(lines) + max(args.margin, 1)
+    frame = to_ansi(Text("\n").join(lines)) + "\n" * (final - len(lines) + 1)
+
+    return frame, [[final - line, column] for line, column in positions]
+
+def render_frame(widget_rows, full=True):
+    """
+    Prints the logo and the widget rows, composed into a single frame, in a single write.
+
+    Returns:
+        list: For each row, the number of lines above the final cursor position
+        and the column where the row starts, used to redraw it in place.
+    """
+    frame, layout = compose(widget_rows, full)
+    sys.stdout.write(frame)
+    sys.stdout.flush()
+    return layout
+
+def redraw(layout, old_rows, new_rows):
+    """
+    Redraws in place only the widgets that changed since the previous frame.
+
+    Within a row, the first changed badge and the ones after it (which may have
+    moved) are re-emitted, using cursor addressing relative to the final cursor
+    position. The logo and unchanged rows are left untouched. Every change is
+    written at once.
+    """
+    row_gap = " " * args.row_gap
+    out = []
+
+    for position, old, new in zip(layout, old_rows, new_rows):
+        if old == new:
+            continue
+
+        up, column = position
+        old_widths = [display_width(item) for item in old]
+        new_widths = [display_width(item) for item in new]
+        # Where each badge of the new row starts
+        offsets = [column + sum(new_widths[:index]) + len(row_gap) * index for index in range(len(new))]
+
+        out.append(f"\033[{up}A")  # Move up to the row
+
+        if old_widths == new_widths:
+            # Nothing moved, re-emit only the badges whose text changed
+            for index, (before, after) in enumerate(zip(old, new)):
+                if before != after:
+                    out.append(f"\033[{offsets[index] + 1}G" + badge_ansi(after))
+
+        elif args.direction == "column" and align == "center":
+            # A centered row moves when its width changes, redraw it entirely
+            position[1] = get_padding(sum(new_widths) + len(row_gap) * (len(new) - 1))
+            out.append(f"\r\033[2K\033[{position[1] + 1}G" + row_gap.join(map(badge_ansi, new)))
+
+        else:
+            # Index of the first badge that differs, the ones after it may have moved
+            first = next(index for index, (before, after) in enumerate(zip_longest(old, new)) if before != after)
+            if first < len(new):
+                out.append(f"\033[{offsets[first] + 1}G" + row_gap.join(map(badge_ansi, new[first:])))
+            else:
+                # Badges were only removed from the end of the row
+                out.append(f"\033[{column + sum(new_widths) + len(row_gap) * (len(new) - 1) + 1}G")
+            out.append("\033[K")  # Clear what's left of the previous, longer row
+
+        out.append(f"\033[{up}B\r")  # Move back down to the final cursor position
+
+    sys.stdout.write("".join(out))
+    sys.stdout.flush()
+
+def build_frame(info, username, disabled, widget_config, pending, running=None):
+    """
+    Builds the widget rows from the probe results and the addons.
+
+    Args:
+        pending (dict): The started addons, see `start_addons`.
+        running (dict): The probes still running, see `start_probes`. If provided, their
+        widgets and the addons not done yet show a placeholder instead of waiting for them.
+
+    Returns:
+        list: The badges of each row.
+    """
+    widgets_set = configure_widgets(reserve(build_widgets_set(info, username, disabled), running or {}), widget_config)
+    widgets, widgets_set = run_addons(build_badges(widgets_set), widgets_set, pending, wait=running is None)
+
+    if args.color_bars:
+        widgets["color_bars"] = badge(text=color_bars())
+
+    return split_rows(widgets)
+
+def repaint(layout, new_rows):
+    """
+    Draws the widget rows again in place, when rows were added or removed.
+    The rest of the screen above the first row is left untouched.
+
+    Returns:
+        list: The layout of the new rows, see `render_frame`.
+    """
+    # Lines between the first row and the final cursor position
+    top = layout[0][0]
+
+    # Clear from the first row down, the frame is drawn again from there on
+    # (in row direction along with the logo lines beside the rows)
+    sys.stdout.write(f"\033[{top}A\r\033[J")
+
+    return render_frame(new_rows, full=False)
+
+def update_frame(layout, old_rows, new_rows):
+    """
+    Updates the widgets on screen from the previous frame to the new one.
+
+    Returns:
+        list: The layout of the rows now on screen.
+    """
+    with profiler.phase("redraw"):
+        if len(new_rows) != len(old_rows):
+            # The number of rows changed, every row has to be drawn again
+            return repaint(layout, new_rows)
+
+        redraw(layout, old_rows, new_rows)
+        return layout
+
+def watch(widget_rows, layout, widget_config, username, disabled, info):
+    """
+    Keeps probing on a schedule and redraws the widgets that changed, every `args.watch` seconds.
+
+    Each probe runs again only once its own refresh interval has elapsed,
+    the others keep their previous result.
+    """
+    last_run = {name: time() for name in sysinfo}
+
+    while True:
+        sleep(args.watch)
+
+        # Exec addons run again on every refresh, alongside the due probes
+        pending = start_addons()
+        probe(disabled, info, due_probes(last_run))
+
+        if args.sparkline:
+            history.save()
+
+        new_rows = build_frame(info, username, disabled, widget_config, pending)
+        layout = update_frame(layout, widget_rows, new_rows)
+        widget_rows = new_rows
+
+def due_probes(last_run):
+    """
+    Returns the probes whose refresh interval elapsed since their last run
+    (the shell never changes), and marks them as run now.
+    """
+    now = time()
+    due = [name for name, (func, widget, default, interval) in sysinfo.items() if interval and now - last_run[name] >= max(interval, args.watch)]
+    for name in due:
+        last_run[name] = now
+
+    return due
+
+def build_snapshot(info, widgets_set, order=()):
+    """
+    Builds a machine-readable snapshot of the widgets, along with the text
+    each widget shows the raw reading of its probe, if it has one.
+
+    Args:
+        info (InfoObject): The probe results.
+        widgets_set (dict): The widgets and addons.
+        order (iterable): The names of the widgets in the order they are shown, the
+        hidden ones (without text) follow in the order of `widgets_set`.
+
+    Returns:
+        dict: The "time" of the snapshot, the "hostname" and the "widgets" in
+        their order, each with its "text" and for the widgets fed by a probe its
+        raw "values" (None when unavailable) and the "units" of the numeric ones.
+    """
+    # The probe feeding each widget
+    probes = {widget: name for name, (func, widget, default, interval) in sysinfo.items()}
+    widgets = {}
+
+    for name in dict.fromkeys([*order, *widgets_set]):
+        widget = widgets_set[name]
+        entry = {"text": widget["text"]}
+        probe_name = probes.get(name)
+
+        if probe_name in READING_UNITS:
+            reading = getattr(info, probe_name)
+
+            if probe_name == "internet":
+                reading = {"online": bool(reading)}
+
+            entry["values"] = reading
+            entry["units"] = {key: unit for key, unit in READING_UNITS[probe_name].items() if unit}
+
+        widgets[name] = entry
+
+    return {"time": time(), "hostname": hostname, "widgets": widgets}
+
+def write_snapshot(info, username, disabled, widget_config, pending):
+    """
+    Prints the snapshot of the widgets and the addons as a single JSON line.
+    """
+    widgets_set = configure_widgets(build_widgets_set(info, username, disabled), widget_config)
+    widgets, widgets_set = run_addons(build_badges(widgets_set), widgets_set, pending)
+
+    with profiler.phase("output"):
+        try:
+            # The badges are in the order the widgets are shown
+            sys.stdout.write(json.dumps(build_snapshot(info, widgets_set, widgets)) + "\n")
+            sys.stdout.flush()
+        except BrokenPipeError:
+            # The reader of the stream went away, nothing left to write to
+            os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+            sys.exit(0)
+
+def stream_snapshots(info, username, disabled, widget_config):
+    """
+    Keeps probing on a schedule and prints a snapshot every `args.watch` seconds,
+    as newline delimited JSON.
+    """
+    last_run = {name: time() for name in sysinfo}
+
+    while True:
+        sleep(args.watch)
+
+        # Exec addons run again on every refresh, alongside the due probes
+        pending = start_addons()
+        probe(disabled, info, due_probes(last_run))
+        write_snapshot(info, username, disabled, widget_config, pending)
+
+def color_bars():
+    return "".join([f"[{color}]━━[/]" for color in color_codes])
+
+def main():
+    try:
+        if args.profile:
+            # Printed on exit, whichever way the run ends
+            atexit.register(profiler.report, args.profile)
+
+        if args.daemon:
+            run_daemon()
+            sys.exit(0)
+
+        if args.serve_metrics:
+            run_metrics_server()
+            sys.exit(0)
+
+        if args.textfile:
+            run_textfile()
+            sys.exit(0)
+
+        if args.refresh_addon:
+            refresh_addon(args.refresh_addon)
+            sys.exit(0)
+
+        if args.refresh_weather:
+            System.getWeather()
+            sys.exit(0)
+
+        if "logo" == args.show:
+            if not any(var for var in [args.stdout, args.json, args.snapshot]):
+                render_frame([])
+            sys.exit(0)
+
+        if system == "android":
+            istermux = subprocess.run("pwd", shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, check=True).stdout.strip()
+            if not args.bypass_system_api and "com.termux" in istermux:
+                command = "am startservice -n com.termux.api/.KeepAliveService"
+                try:
+                    output = subprocess.run(command, shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, check=True).stderr.strip()
+                except Exception:
+                    output = None
+
+                if output:
+                    console.print(badge(color=color.red, icon=icon.status[1], text="Termux:API not found, install to continue."))
+                    console.print("https://f-droid.org/en/packages/com.termux.api")
+                    sys.exit(1)
+
+                command = "dpkg -l"
+
+                try:
+                    package = subprocess.run(command, shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, check=True).stdout.strip().split("\n")
+                    if any(pkg for pkg in package if "termux-api" in pkg):
+                        package = True
+                    else:
+                        package = False
+                except Exception:
+                    package = None
+
+                if not package:
+                    console.print(badge(color=color.red, icon=icon.status[1], text="termux-api package not found, install to continue."))
+                    sys.exit(1)
+
+        widget_config = load_widget_config()
+        disabled = get_disabled(widget_config)
+
+        for section in ["internet", "weather", "storage"]:
+            if section in config_file.errors:
+                console.print(f"{section} not configured properly at: {CONFIG_PATH}")
                 sys.exit(1)
+        username = get_username()
 
-        if args.json:
-            # Convert the widgets_set dictionary to JSON format with indentation for readability
-            output = json.dumps(widgets, indent=2)
-            # Print the JSON output
-            print(output)
+        # package = System.getPackage()
+        # cpu = System.getCPU()
+        # ram = System.getRAM()
+        # shell = System.getSHELL()
+        # battery = System.getBATTERY()
+        # disk = System.getDISK()
+        # weather = System.getWeather()
+
+        # Exec addons only show up in badges, start them now so they run alongside the probes
+        pending = {} if args.stdout else start_addons()
+
+        if args.sparkline:
+            # Go on with the trend of the previous runs, saved again on exit
+            history.load()
+            atexit.register(history.save)
+
+        info = new_info()
+        running = start_probes(disabled, info)
+
+        if args.stdout or args.json or args.snapshot:
+            # Printed once, with every result
+            for future in as_completed(running):
+                set_result(info, running.pop(future), future.result())
+
+            widgets_set = build_widgets_set(info, username, disabled)
+
+            if args.stdout:
+                with profiler.phase("output"):
+                    # Iterate over the widgets set
+                    for name, widget in widgets_set.items():
+                        # Check if the widget has text
+                        if widget["text"]:
+                            # Print the widget name and text
+                            print(f"{name.capitalize()}: {widget['text']}")
+                # Exit the program with a success status code
+                sys.exit(0)
+
+            if args.snapshot:
+                write_snapshot(info, username, disabled, widget_config, pending)
+
+                if args.watch:
+                    stream_snapshots(info, username, disabled, widget_config)
+                # Exit the program with a success status code
+                sys.exit(0)
+
+            widgets_set = configure_widgets(widgets_set, widget_config)
+            widgets = build_badges(widgets_set)
+            widgets, widgets_set = run_addons(widgets, widgets_set, pending)
+
+            with profiler.phase("output"):
+                # Convert the widgets_set dictionary to JSON format with indentation for readability
+                output = json.dumps(widgets, indent=2)
+                # Print the JSON output
+                print(output)
             # Exit the program with a success status code
             sys.exit(0)
 
-        if args.color_bars:
-            color_bars = "".join([f"[{color}]━━[/]" for color in color_codes])
-            widgets["color_bars"] = badge(text=color_bars)
-
-        # Extract the values (widget information) from the widgets dictionary and convert them into a list
-        widget_values = list(widgets.values())
-        # Divide the widget values into rows based on the specified number of columns
-        widget_rows = [widget_values[i:i+args.column] for i in range(0, len(widget_values), args.column)]
-
-        if args.direction == "column":
-            print(loading_info_len, end="\r")
-            if align == "center":
-                sys.stdout.write("\033[F")  # Move cursor up one line
-
-        # Iterate over each row of widgets
-        for index, (widget, line) in enumerate(zip_longest(widget_rows, logo.splitlines(), fillvalue="")):
-            sleep(0.005)
-            if widget:
-                row_gap = " " * args.row_gap
-                widget = row_gap.join(widget)
-
-                if args.direction == "row":
-                    sys.stdout.write(f"\033[{alongside_width}C")  # Move right (40 columns) and print info
-                    if index == 0:
-                        spaces = " " * len(cleaned_string(loading_info))
-                    else:
-                        spaces = ""
-                    print_align(widget + spaces, align="left")
+        # Draw the logo and the widgets that are ready, with the cells of the others reserved
+        widget_rows = build_frame(info, username, disabled, widget_config, pending, running)
 
-                else:
-                    # Print each widget in the row, with provided spaces padding on the left, following alignment, and provided newline after each row
-                    print_align(widget, align=align)
-                print(end="\n" * args.column_gap)
+        with profiler.phase("output"):
+            layout = render_frame(widget_rows)
 
-            else:
-                if args.direction == "row":
-                    sys.stdout.write(f"\033[{alongside_width}C\n")
+        # Fill in each cell as soon as its probe or addon is done
+        waiting = set(running) | {future for future in pending.values() if not future.done()}
+        while waiting:
+            done, waiting = wait(waiting, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future in running:
+                    set_result(info, running.pop(future), future.result())
+
+            new_rows = build_frame(info, username, disabled, widget_config, pending, running)
+            layout = update_frame(layout, widget_rows, new_rows)
+            widget_rows = new_rows
 
-        # Print additional whitespace as specified by the user (args.margin - 1) times
-        print("\n"*(args.margin-1))
+        if args.watch:
+            watch(widget_rows, layout, widget_config, username, disabled, info)
 
     except (EOFError, KeyboardInterrupt):
         print_align(badge(color=color.red, icon=icon.status[1], text="Program interrupted."), align=align, end="\n\n")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,79 @@
+import os, json, tempfile
+from .lazy import lazy_module
+from .path import CACHE_DIR
+
+psutil = lazy_module("psutil")
+
+def cache_path(name:str) -> str:
+    # Each cache lives in its own JSON file inside the cache directory
+    return os.path.join(CACHE_DIR, f"{name}.json")
+
+def load(name:str):
+    """
+    Loads the cache stored under `name`.
+
+    Returns:
+    dict or None: The cached data, or None if it is missing or unreadable.
+    """
+    try:
+        with open(cache_path(name), encoding="utf-8") as f:
+            return json.load(f)
+    except Exception:
+        return None
+
+def store(name:str, data) -> None:
+    """
+    Atomically writes `data` as the cache stored under `name`, so a concurrent
+    run never reads a half written file. Errors are ignored, caching is best effort.
+    """
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, prefix=f".{name}.", suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, cache_path(name))
+    except Exception:
+        try:
+            os.remove(tmp_path)
+        except Exception:
+            pass
+
+def remember(name:str, key, func, refresh:bool = False):
+    """
+    Returns the value cached under `name` if it was stored with the same `key`,
+    otherwise calls `func` and caches its result along with `key`.
+
+    Args:
+    name (str): The cache name.
+    key: A JSON serializable value identifying when the cached value is valid.
+    func (callable): Computes the value when the cache is missing or outdated.
+    refresh (bool): Ignore the cached value and recompute it.
+    """
+    if not refresh:
+        cached = load(name)
+        if cached and cached.get("key") == key:
+            return cached["value"]
+
+    value = func()
+    store(name, {"key": key, "value": value})
+    return value
+
+def boot_session():
+    """
+    Returns an identifier of the current boot, which changes after every reboot.
+
+    Returns:
+    str or None: The kernel boot id, or the boot time, or None if neither is available.
+    """
+    try:
+        # Linux and Android expose a random id generated on every boot
+        with open("/proc/sys/kernel/random/boot_id") as f:
+            return f.read().strip()
+    except Exception:
+        pass
+
+    try:
+        # Elsewhere the boot time identifies the session
+        return str(int(psutil.boot_time()))
+    except Exception:
+        return None
@@ -0,0 +1,118 @@
+import re, unicodedata
+from functools import lru_cache
+from collections import namedtuple
+
+# One token per match, in a single pass over the text:
+# an ANSI escape sequence, a rich markup tag, an escaped bracket or visible text.
+# Tags follow rich's grammar: a lowercase letter, "#", "/" or "@" after the bracket,
+# so "[ERROR]" is printed as is
+TOKENS = re.compile(r"""
+    (?P<escape>\x1B\[[0-?]*[ -/]*[@-~]|\x1B[@-Z\\-_])
+  | (?P<markup>\[[a-z#/@][^\[]*?\])
+  | (?P<bracket>\\\[)
+  | (?P<text>[^\x1B\[\\]+|.)
+""", re.VERBOSE | re.DOTALL)
+
+# The measure of a text, see `measure`
+Measure = namedtuple("Measure", ["plain", "width", "escape", "markup"])
+
+@lru_cache(maxsize=4096)
+def char_width(char:str) -> int:
+    """
+    Returns the number of terminal cells a character takes: 2 for wide (East Asian)
+    glyphs, 0 for combining marks, format and control characters, 1 otherwise.
+    Private use characters, like the Nerd Font icons, take a single cell.
+    """
+    if unicodedata.combining(char) or unicodedata.category(char) in ("Mn", "Me", "Cf", "Cc"):
+        return 0
+
+    if unicodedata.east_asian_width(char) in ("W", "F"):
+        return 2
+
+    return 1
+
+def tokenize(text:str):
+    """
+    Splits a text into its tokens, walking it once.
+
+    Yields:
+    tuple: The kind of token ("escape", "markup" or "text") and its value. The
+    value of an escaped bracket is the bracket, as a "text" token.
+    """
+    for match in TOKENS.finditer(text):
+        kind = match.lastgroup
+
+        if kind == "bracket":
+            yield "text", "["
+        else:
+            yield kind, match.group()
+
+@lru_cache(maxsize=4096)
+def measure(text:str) -> Measure:
+    """
+    Measures a text as it appears in the terminal, its codes and markup left out.
+    Repeated texts (badges, logo lines) are only measured once.
+
+    Returns:
+    Measure: The visible "plain" text, its display "width" in cells (of the
+    longest line) and whether it has ANSI "escape" codes or rich "markup".
+    """
+    plain = []
+    escape = markup = False
+
+    for kind, value in tokenize(text):
+        if kind == "text":
+            plain.append(value)
+        elif kind == "escape":
+            escape = True
+        else:
+            markup = True
+
+    plain = "".join(plain)
+    width = max((sum(char_width(char) for char in line) for line in plain.split("\n")), default=0)
+
+    return Measure(plain, width, escape, markup)
+
+def display_width(text:str) -> int:
+    # Cells taken by the longest line of the text
+    return measure(text).width
+
+@lru_cache(maxsize=1024)
+def truncate(text:str, width:int, ellipsis:str = "…") -> str:
+    """
+    Cuts a text down to `width` cells, ending with an ellipsis if it was cut.
+
+    Codes and markup are never cut in half, and the ones after the cut are
+    kept so every style opened before it is still closed.
+    """
+    if measure(text).width <= width:
+        return text
+
+    # Room left for the text, the ellipsis is always shown
+    room = width - sum(char_width(char) for char in ellipsis)
+    out = []
+    cut = False
+
+    for match in TOKENS.finditer(text):
+        kind, value = match.lastgroup, match.group()
+
+        if kind in ("escape", "markup"):
+            out.append(value)
+            continue
+
+        if cut:
+            continue
+
+        # An escaped bracket is a single visible character
+        chars = "[" if kind == "bracket" else value
+
+        for index, char in enumerate(chars):
+            room -= char_width(char)
+            if room < 0:
+                out.append(chars[:index] + ellipsis)
+                cut = True
+                break
+        else:
+            out.append(value)
+
+    return "".join(out)
@@ -1,25 +1,46 @@
 from .logo import Logo
 from .system import system
-from rich import print_json
 from .path import CONFIG_PATH
-from rich.console import Console
+from .configfile import load_config
+from .profiler import profiler
+from .lazy import Lazy, lazy_module
 from  datetime import datetime, date
-from rich_argparse import RichHelpFormatter
-import argparse, os, sys, json, random, shlex, subprocess
+import argparse, os, sys, random, shlex, shutil, subprocess
 
 logo = Logo()
-console = Console()  # Create a Console object for rich console output
+console = Lazy(lambda: lazy_module("rich.console").Console())  # Create a Console object for rich console output on first use
 pyversion = sys.version.split()[0]  # Get the Python version
-window_rows, window_columns = os.get_terminal_size()  # Get the size of the terminal window
+window_rows, window_columns = shutil.get_terminal_size()  # Get the size of the terminal window (falls back to 80x24 when piped)
 window_size = f"{window_rows}×{window_columns}"
 
-# Define custom color using hex code
-RichHelpFormatter.styles = {
-    "argparse.args": "#60bfff bold",
-    "argparse.help": "#d2ddff",
-    "argparse.metavar": "#9e9e9e",
-    "argparse.text": "underline"
-}
+def help_formatter(prog):
+    """
+    Builds the rich help formatter on demand, so rich_argparse (and rich)
+    is only imported when help or usage text is actually rendered.
+    """
+    from rich_argparse import RichHelpFormatter
+
+    # Define custom color using hex code
+    RichHelpFormatter.styles = {
+        "argparse.args": "#60bfff bold",
+        "argparse.help": "#d2ddff",
+        "argparse.metavar": "#9e9e9e",
+        "argparse.text": "underline"
+    }
+    return RichHelpFormatter(prog)
+
+class VersionAction(argparse.Action):
+    """
+    Prints the program version and exits, without building the help formatter.
+    """
+
+    def __init__(self, option_strings, version, dest=argparse.SUPPRESS, default=argparse.SUPPRESS, help=None):
+        super().__init__(option_strings=option_strings, dest=dest, default=default, nargs=0, help=help)
+        self.version = version
+
+    def __call__(self, parser, namespace, values, option_string=None):
+        print(self.version)
+        parser.exit()
 
 # Check if the configuration file exists
 if not os.path.isfile(CONFIG_PATH):
@@ -28,10 +49,9 @@ if not os.path.isfile(CONFIG_PATH):
         # Open the configuration file in write mode and write an empty string to it
         f.write("")
 
-try:
-    weather_api = json.load(open(CONFIG_PATH))["weather_api"]
-except Exception:
-    weather_api = None
+# Parse and validate the configuration file once, every part of the program reads its sections from here
+config_file = load_config(CONFIG_PATH)
+weather_api = config_file.weather_api
 
 text_mode = {
     "detailed": "includes extended information",
@@ -44,13 +64,12 @@ direction_mode = ["row", "column"]
 
 parser = argparse.ArgumentParser(
     description="A fully functional program for Terminal to show information about system, display, shell, package and many more.",
-    epilog="See full documentation at: https://github.com/imegeek/terminal-widgets",
-    formatter_class=RichHelpFormatter
+    epilog="See full documentation at: https://github.com/imegeek/terminal-widgets"
 )
 
 parser.add_argument(
     "-v", "--version",
-    action='version',
+    action=VersionAction,
     version="1.25",
     help="Show the program version."
 )
@@ -73,6 +92,12 @@ parser.add_argument(
     help="Shows widgets output as JSON object."
 )
 
+parser.add_argument(
+    "--snapshot",
+    action='store_true',
+    help="Shows widgets with their raw values as a JSON line, one line every refresh with --watch."
+)
+
 parser.add_argument(
     "--stdout",
     action='store_true',
@@ -164,6 +189,72 @@ parser.add_argument(
     help="Turn off API checking for required system."
 )
 
+parser.add_argument(
+    "--refresh-cache",
+    action='store_true',
+    help="Ignore cached system info and probe it again."
+)
+
+parser.add_argument(
+    "--daemon",
+    action='store_true',
+    help="Run as a background collector that keeps system info fresh for other runs."
+)
+
+parser.add_argument(
+    "--serve-metrics",
+    metavar="address",
+    help="Serve system info as OpenMetrics over HTTP at 'port' or 'address:port'. (default address: 127.0.0.1)"
+)
+
+parser.add_argument(
+    "--textfile",
+    metavar="file",
+    help="Write system info as OpenMetrics to a file, for node-exporter's textfile collector."
+)
+
+# Used internally to refresh a stale addon cache in the background
+parser.add_argument(
+    "--refresh-addon",
+    metavar="name",
+    help=argparse.SUPPRESS
+)
+
+# Used internally to refresh a stale weather report in the background
+parser.add_argument(
+    "--refresh-weather",
+    action='store_true',
+    help=argparse.SUPPRESS
+)
+
+parser.add_argument(
+    "--watch",
+    type=float,
+    metavar="seconds",
+    help="Keep running and refresh the widgets in place every given seconds."
+)
+
+parser.add_argument(
+    "--sparkline",
+    action='store_true',
+    help="Show the recent trend of CPU, memory and storage usage as a sparkline in their widgets."
+)
+
+parser.add_argument(
+    "--heatmap",
+    action='store_true',
+    help="Show how busy each core of the CPU is in the usage widget."
+)
+
+parser.add_argument(
+    "--profile",
+    nargs="?",
+    const="text",
+    choices=["text", "json"],
+    metavar="format",
+    help="Print how long each part of the run took to stderr, as a table or 'json'."
+)
+
 parser.add_argument(
     "--column",
     type=int,
@@ -196,8 +287,12 @@ parser.add_argument(
     help="Specify the number of whitespaces line that will be displayed before and after execute."
 )
 
+# Attach the rich formatter only after the arguments are added, argparse builds a
+# formatter on every add_argument() call and it is only needed to print help or usage
+parser.formatter_class = help_formatter
+
 try:
-    arg_data = json.load(open(CONFIG_PATH))["args"]
+    arg_data = config_file.args
     arg_list = shlex.split(arg_data)
 except Exception:
     arg_data = None
@@ -211,6 +306,9 @@ try:
 except Exception:
     args = parser.parse_args(arg_list)  # Parse the command-line arguments from json
 
+# The phases are only recorded for the report of --profile
+profiler.enable(bool(args.profile))
+
 if args.update:
     try:
         console.print(f"[green b]Updating terminal-widgets...[/]")
@@ -225,6 +323,10 @@ if args.update:
         console.print(f"[red]An unexpected error occurred:[/] {e}")
     sys.exit(0)
 
+if args.watch is not None and args.watch <= 0:
+    print("Ensure that the watch interval is greater than zero.")
+    sys.exit(1)
+
 if args.column < 1:
     print("Ensure that the length of the column is atleast one.")
     sys.exit(1)
@@ -257,22 +359,32 @@ if args.config:
     if os.path.isfile(file):
         # If the file exists, update the CONFIG_PATH variable with the provided file path
         CONFIG_PATH = file
+        config_file = load_config(CONFIG_PATH)
     else:
         # If the file does not exist, print an error message and exit the program
         print(f"'{file}' does not exist.\nPlease provide a valid file path.")
         sys.exit(1)
 
-current_time = datetime.now()  # Get the current time
+def clock():
+    """
+    Returns the current time and today's date, formatted for the selected text mode.
 
-if args.text == "detailed":
-    # Format the current time to include AM/PM
-    cftime = current_time.strftime("%I:%M %p")
-    # Get today's date and format it as "Day of the week, Month Day"
-    today = date.today().strftime("%a, %D")
-else:
-    cftime = f"{current_time.hour}:{current_time.minute}"  # Format the current time as hours:minutes
-    # Get today's date and format it as "Day of the week, Month Day"
-    today = date.today().strftime("%a, %b %d")
+    Returns:
+    tuple: The formatted time and date.
+    """
+    current_time = datetime.now()  # Get the current time
+
+    if args.text == "detailed":
+        # Format the current time to include AM/PM
+        cftime = current_time.strftime("%I:%M %p")
+        # Get today's date and format it as "Day of the week, Month Day"
+        today = date.today().strftime("%a, %D")
+    else:
+        cftime = f"{current_time.hour}:{current_time.minute}"  # Format the current time as hours:minutes
+        # Get today's date and format it as "Day of the week, Month Day"
+        today = date.today().strftime("%a, %b %d")
+
+    return cftime, today
 
 def generate_random_color(colors, min_distance=100):
     while True:
@@ -351,7 +463,7 @@ elif args.color == "random":
 elif args.color == "custom":
     try:
         # Load custom colors from the configuration file
-        ncolors = json.load(open(CONFIG_PATH))["colors"]
+        ncolors = config_file.colors
 
         # Update custom_colors and global variables with the loaded custom colors
         for name in ncolors:
@@ -372,17 +484,16 @@ elif args.color == "custom":
 # Check if the 'configs' argument is provided
 if args.configs:
     # Open the configuration file and read its contents
-    with open(CONFIG_PATH, encoding="utf-8") as f:
-        config = f.read().strip()
-
-        # Check if the configuration exists
-        if config:
-            # Print the json configuration
-            print_json(config)
-            console.print(f"\n[b]file located at:[/] [yellow u]{CONFIG_PATH}[/]")
-        else:
-            # Print a message if no configuration is found
-            print("No configuration found.")
+    config = config_file.read()
+
+    # Check if the configuration exists
+    if config:
+        # Print the json configuration
+        lazy_module("rich").print_json(config)
+        console.print(f"\n[b]file located at:[/] [yellow u]{CONFIG_PATH}[/]")
+    else:
+        # Print a message if no configuration is found
+        print("No configuration found.")
     sys.exit(0)
 
 class Color:
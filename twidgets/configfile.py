@@ -0,0 +1,219 @@
+import os, json
+from .cache import remember
+from .network import parse_endpoint
+from .profiler import profiler
+
+# Bump when the compiled form changes, so configs compiled by older versions are parsed again
+COMPILED_VERSION = 6
+
+class ConfigError(ValueError):
+    """
+    Raised when a section of the configuration file does not match its schema.
+    """
+
+def check_fields(item, fields:dict, message:str) -> None:
+    # Every item must be an object whose known fields have the expected type
+    if not isinstance(item, dict):
+        raise ConfigError(message)
+
+    for field, types in fields.items():
+        if field in item and not isinstance(item[field], types):
+            raise ConfigError(message)
+
+def compile_args(value):
+    if not isinstance(value, str):
+        raise ConfigError("'args' must be a string")
+    return value
+
+def compile_weather_api(value):
+    if not isinstance(value, str):
+        raise ConfigError("'weather_api' must be a string")
+    return value
+
+def compile_colors(value):
+    if not isinstance(value, dict) or not all(isinstance(color, str) for color in value.values()):
+        raise ConfigError("colors not configured properly")
+    return value
+
+def compile_logo(value):
+    if not isinstance(value, dict):
+        raise ConfigError("'logo' not configured properly")
+
+    logos = {}
+    for name, art in value.items():
+        if not isinstance(art, list) or not all(isinstance(line, str) for line in art):
+            raise ConfigError("'logo' not configured properly")
+
+        # Combine all lines of the 'art' list into a single string.
+        # Replace '\33' with '\033' to correctly format ANSI color codes for terminal output.
+        logos[name] = "\n".join([line.replace('\\33', '\033') for line in art])
+        if not logos[name]:
+            raise ConfigError("'logo' art cannot be empty")
+
+    return logos
+
+def compile_widgets(value):
+    if not isinstance(value, dict):
+        raise ConfigError("widgets not configured properly")
+
+    fields = {"text": str, "color": str, "icon": str, "state": str, "index": int}
+    for widget in value.values():
+        check_fields(widget, fields, "widgets not configured properly")
+
+    return value
+
+def compile_addons(value):
+    if not isinstance(value, dict):
+        raise ConfigError("addons not configured properly")
+
+    fields = {"text": str, "exec": str, "script": str, "color": str, "icon": str, "index": int, "timeout": (int, float), "cache_ttl": (int, float), "stale_ttl": (int, float)}
+    for addon in value.values():
+        check_fields(addon, fields, "addons not configured properly")
+
+    return value
+
+def compile_internet(value):
+    message = "internet not configured properly"
+    check_fields(value, {"endpoints": list, "timeout": (int, float), "cache_ttl": (int, float)}, message)
+
+    compiled = dict(value)
+    if "endpoints" in value:
+        try:
+            # Parsed once here, the compiled form keeps the [host, port] pairs
+            compiled["endpoints"] = [parse_endpoint(endpoint) for endpoint in value["endpoints"]]
+        except (TypeError, ValueError, OSError):
+            raise ConfigError(message)
+
+    return compiled
+
+def compile_weather(value):
+    check_fields(value, {"cache_ttl": (int, float), "stale_ttl": (int, float)}, "weather not configured properly")
+    return value
+
+def compile_storage(value):
+    message = "storage not configured properly"
+    check_fields(value, {"mounts": list, "timeout": (int, float)}, message)
+
+    if not all(isinstance(mount, str) for mount in value.get("mounts", [])):
+        raise ConfigError(message)
+
+    return value
+
+# section: function validating it and returning its compiled form
+SECTIONS = {
+    "args": compile_args,
+    "weather_api": compile_weather_api,
+    "colors": compile_colors,
+    "logo": compile_logo,
+    "widgets": compile_widgets,
+    "addons": compile_addons,
+    "internet": compile_internet,
+    "weather": compile_weather,
+    "storage": compile_storage
+}
+
+def compile_config(path:str) -> dict:
+    """
+    Parses and validates the configuration file.
+
+    Returns:
+    dict: The compiled "sections", the validation "errors" by section and
+    whether the file is "invalid" JSON.
+    """
+    with open(path, encoding="utf-8") as f:
+        content = f.read()
+
+    compiled = {"sections": {}, "errors": {}, "invalid": False}
+
+    if not content.strip():
+        # An empty configuration file configures nothing
+        return compiled
+
+    try:
+        data = json.loads(content)
+    except ValueError:
+        compiled["invalid"] = True
+        return compiled
+
+    if not isinstance(data, dict):
+        compiled["invalid"] = True
+        return compiled
+
+    for section, compile_section in SECTIONS.items():
+        if section in data:
+            try:
+                compiled["sections"][section] = compile_section(data[section])
+            except ConfigError as err:
+                # Reported by the part of the program that uses the section
+                compiled["errors"][section] = str(err)
+
+    return compiled
+
+class Config:
+    """
+    The configuration file, parsed and validated once per run.
+
+    Sections that are missing or not configured properly are None, the
+    reason of the latter is kept in `errors` under the section name.
+    """
+    args: str
+    weather_api: str
+    colors: dict
+    logo: dict
+    widgets: dict
+    addons: dict
+    internet: dict
+    weather: dict
+    storage: dict
+
+    def __init__(self, path:str, sections:dict = None, errors:dict = None, invalid:bool = False):
+        self.path = path
+        self.errors = errors or {}
+        self.invalid = invalid
+
+        for section in SECTIONS:
+            setattr(self, section, (sections or {}).get(section))
+
+    def read(self) -> str:
+        # The raw contents of the file, only needed to show it as is
+        with open(self.path, encoding="utf-8") as f:
+            return f.read().strip()
+
+loaded = {}
+
+def load_config(path:str, refresh:bool = False) -> Config:
+    """
+    Loads the configuration file at `path`, at most once per run.
+
+    The compiled form is cached on disk along with the file's modification time
+    and size, so an unchanged configuration is never parsed and validated again.
+
+    Args:
+    path (str): The configuration file path.
+    refresh (bool): Ignore the compiled form cached on disk.
+
+    Returns:
+    Config: The loaded configuration.
+    """
+    path = os.path.abspath(path)
+
+    if path in loaded and not refresh:
+        return loaded[path]
+
+    try:
+        stat = os.stat(path)
+    except OSError:
+        # A missing configuration file configures nothing
+        loaded[path] = Config(path)
+        return loaded[path]
+
+    key = [COMPILED_VERSION, path, stat.st_mtime_ns, stat.st_size]
+
+    with profiler.phase("config"):
+        try:
+            compiled = remember("config", key, lambda: compile_config(path), refresh=refresh)
+        except OSError:
+            compiled = {}
+
+    loaded[path] = Config(path, **compiled)
+    return loaded[path]
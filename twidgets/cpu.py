@@ -0,0 +1,175 @@
+import os, glob
+from time import time, sleep
+from . import procfs
+from .cache import load, store, boot_session
+from .lazy import lazy_module
+
+psutil = lazy_module("psutil")
+
+# Seconds between the two samples of a run without a recent previous sample,
+# the probe sleeps in its own thread so the sample overlaps with the other probes
+SAMPLE_SECONDS = 0.1
+
+# Seconds the CPU times stored by a previous run are used as the start of the
+# next run's window, instead of sampling
+PREVIOUS_MAX_AGE = 300
+
+STAT_PATH = "/proc/stat"
+SELF_STAT_PATH = "/proc/self/stat"
+CPUINFO_PATH = "/proc/cpuinfo"
+# One file per frequency policy (a group of cores), in kHz
+FREQUENCY_GLOB = "/sys/devices/system/cpu/cpufreq/policy*/scaling_cur_freq"
+
+# The CPU times of the previous run of `utilization`, reused by the next one
+# in long running modes (watch, daemon)
+previous = None
+
+def read_times() -> list:
+    """
+    Reads the busy and total CPU times, of all the cores and of each core.
+
+    Returns:
+    list: The (busy, total) times, in clock ticks, of all the cores first, then of each core.
+    """
+    try:
+        with open(STAT_PATH, "rb") as f:
+            data = f.read()
+    except OSError:
+        return psutil_times()
+
+    times = []
+
+    for line in data.splitlines():
+        # The cpu lines come first
+        if not line.startswith(b"cpu"):
+            break
+
+        # user nice system idle iowait irq softirq steal, guest time is already counted in user
+        fields = [int(field) for field in line.split()[1:9]]
+        total = sum(fields)
+        idle = sum(fields[3:5])
+        times.append((total - idle, total))
+
+    return times
+
+def own_ticks() -> int:
+    """
+    Returns the clock ticks this process spent on the CPU (user and system time),
+    in the unit of /proc/stat, or 0 where it isn't available.
+    """
+    try:
+        # The fields after the command name, which may hold spaces and parentheses
+        fields = procfs.read(SELF_STAT_PATH).rpartition(b")")[2].split()
+        return int(fields[11]) + int(fields[12])
+    except (OSError, IndexError, ValueError):
+        return 0
+
+def load_previous() -> list:
+    # The CPU times stored by a previous run, if recent and taken since the last boot
+    cached = load("cpu_times")
+
+    try:
+        if time() - cached["time"] > PREVIOUS_MAX_AGE or cached["boot"] != boot_session():
+            return None
+        return [tuple(times) for times in cached["times"]]
+    except (KeyError, TypeError):
+        return None
+
+def psutil_times() -> list:
+    # Where /proc/stat doesn't exist, the same times from psutil (in seconds)
+    def busy_total(times):
+        total = sum(times)
+        idle = times.idle + getattr(times, "iowait", 0)
+        return total - idle, total
+
+    return [busy_total(psutil.cpu_times())] + [busy_total(times) for times in psutil.cpu_times(percpu=True)]
+
+def utilization(sample:float = SAMPLE_SECONDS) -> list:
+    """
+    Returns how busy the CPU was since the previous call, or since a recent
+    previous run. Without either, a short sample is taken, leaving out the
+    time this process spent on the CPU meanwhile so the run doesn't measure itself.
+
+    Returns:
+    list: The busy percent of all the cores first, then of each core.
+    """
+    global previous
+
+    current = read_times()
+    # Busy ticks of the window spent by this process, not counted
+    own = 0
+
+    if previous is not None:
+        before = previous
+    else:
+        before = load_previous()
+        # The window started in a previous run, before this process did
+        own = own_ticks()
+
+    if before is None or len(before) != len(current):
+        # No previous sample (or the cores changed), sample now
+        before = current
+        own = own_ticks()
+        sleep(sample)
+        current = read_times()
+        own = own_ticks() - own
+
+    if not isinstance(current[0][0], int):
+        # Only /proc/stat counts in clock ticks, like /proc/self/stat
+        own = 0
+
+    previous = current
+    store("cpu_times", {"time": time(), "boot": boot_session(), "times": current})
+
+    busy_all = current[0][0] - before[0][0]
+    # The share of the busy time of each core that wasn't this process's
+    share = max(busy_all - own, 0) / busy_all if busy_all > 0 else 1
+    percents = []
+
+    for (busy_before, total_before), (busy, total) in zip(before, current):
+        elapsed = total - total_before
+        percents.append(min(max((busy - busy_before) * share / elapsed * 100, 0), 100) if elapsed > 0 else 0.0)
+
+    return percents
+
+def current_frequency() -> float:
+    """
+    Returns the current frequency of the CPU in hertz, averaged over its cores,
+    or None if it isn't available.
+    """
+    frequencies = []
+
+    for path in glob.glob(FREQUENCY_GLOB):
+        try:
+            with open(path, "rb") as f:
+                frequencies.append(int(f.read()) * 1e3)
+        except (OSError, ValueError):
+            continue
+
+    if not frequencies:
+        try:
+            # Virtual machines and containers often only have /proc/cpuinfo
+            with open(CPUINFO_PATH, "rb") as f:
+                frequencies = [float(line.partition(b":")[2]) * 1e6 for line in f if line.startswith(b"cpu MHz")]
+        except (OSError, ValueError):
+            frequencies = []
+
+    if not frequencies:
+        try:
+            return psutil.cpu_freq().current * 1e6
+        except Exception:
+            return None
+
+    return sum(frequencies) / len(frequencies)
+
+def load_average() -> list:
+    # The 1, 5 and 15 minutes load averages, None where the system has none
+    try:
+        return procfs.loadavg()
+    except (OSError, ValueError):
+        pass
+
+    try:
+        return list(os.getloadavg())
+    except (AttributeError, OSError):
+        return None
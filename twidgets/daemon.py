@@ -0,0 +1,136 @@
+import os, sys, json, signal, socket, threading, socketserver
+from .path import SOCKET_PATH
+from time import time, sleep
+
+def fetch(settings:dict, timeout:float = 0.25):
+    """
+    Fetches the latest probe results from a running daemon.
+
+    Args:
+    settings (dict): The settings the probes must have been run with.
+    timeout (float): Seconds to wait for the daemon before giving up.
+
+    Returns:
+    dict or None: The probe results by name, or None if no daemon is running
+    or it was started with different settings.
+    """
+    if not hasattr(socket, "AF_UNIX") or not os.path.exists(SOCKET_PATH):
+        return None
+
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.settimeout(timeout)
+            client.connect(SOCKET_PATH)
+
+            # The daemon sends the whole snapshot and closes the connection
+            chunks = []
+            while chunk := client.recv(65536):
+                chunks.append(chunk)
+
+        snapshot = json.loads(b"".join(chunks))
+    except Exception:
+        # No daemon listening (stale socket) or an incomplete answer, probe in-process
+        return None
+
+    if snapshot.get("settings") != settings:
+        return None
+
+    return snapshot["values"]
+
+def is_running() -> bool:
+    # A daemon is running if something accepts connections on the socket
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.settimeout(0.25)
+            client.connect(SOCKET_PATH)
+        return True
+    except Exception:
+        return False
+
+def collect(probes:dict, on_refresh=None) -> tuple:
+    """
+    Refreshes every probe on its own interval in a background thread, so
+    the latest results are always at hand without running a probe inline.
+
+    Args:
+    probes (dict): Probe name mapped to a (function, default value, interval in seconds) tuple.
+    on_refresh (callable): Called with the name and the new value of a probe after each of its runs.
+
+    Returns:
+    tuple: The dict of the latest result of each probe, filled in as they
+    finish their first run, and the lock to hold while reading it.
+    """
+    values = {}
+    lock = threading.Lock()
+
+    def refresh(name, func, default, interval):
+        while True:
+            try:
+                value = func()
+            except (Exception, SystemExit):
+                value = default
+
+            with lock:
+                values[name] = value
+
+            if on_refresh:
+                on_refresh(name, value)
+            sleep(interval)
+
+    for name, (func, default, interval) in probes.items():
+        threading.Thread(target=refresh, args=(name, func, default, interval), daemon=True).start()
+
+    return values, lock
+
+class SnapshotHandler(socketserver.BaseRequestHandler):
+    def handle(self):
+        # Reply with the latest snapshot, no request is needed
+        self.request.sendall(self.server.snapshot())
+
+def serve(probes:dict, settings:dict, on_refresh=None) -> None:
+    """
+    Runs the collector daemon: refreshes every probe on its own interval and
+    serves the latest results over a Unix domain socket until interrupted.
+
+    Args:
+    probes (dict): Probe name mapped to a (function, default value, interval in seconds) tuple.
+    settings (dict): The settings the probes run with, sent along with the results
+    so clients started with other settings fall back to probing in-process.
+    on_refresh (callable): Called with the name and the new value of a probe after each of its runs.
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        raise OSError("Unix domain sockets are not supported on this system.")
+
+    if os.path.exists(SOCKET_PATH):
+        if is_running():
+            raise RuntimeError(f"daemon already running at: {SOCKET_PATH}")
+        # Left over by a daemon that did not shut down cleanly
+        os.remove(SOCKET_PATH)
+
+    os.makedirs(os.path.dirname(SOCKET_PATH), exist_ok=True)
+
+    values, lock = collect(probes, on_refresh)
+
+    def snapshot():
+        with lock:
+            # Probes that haven't finished their first run yet are left out
+            return json.dumps({"time": time(), "settings": settings, "values": values}).encode()
+
+    server = socketserver.ThreadingUnixStreamServer(SOCKET_PATH, SnapshotHandler)
+    server.daemon_threads = True
+    server.snapshot = snapshot
+
+    # Only the current user may read the snapshot
+    os.chmod(SOCKET_PATH, 0o600)
+
+    # Shut down cleanly (removing the socket) when stopped by a service manager or kill
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+        try:
+            os.remove(SOCKET_PATH)
+        except OSError:
+            pass
@@ -0,0 +1,137 @@
+import threading
+from time import time
+from array import array
+from .cache import load, store
+
+# Samples kept for each metric, memory stays the same however long the process runs
+HISTORY_SIZE = 60
+
+# A persisted history older than this (in seconds) is not continued
+HISTORY_MAX_AGE = 3600
+
+# The eight heights of a sparkline, lowest first
+SPARK_BLOCKS = "▁▂▃▄▅▆▇█"
+
+class Series:
+    """
+    A fixed-size ring buffer of float samples, the oldest ones overwritten once full.
+    """
+
+    def __init__(self, size:int = HISTORY_SIZE):
+        self.buffer = array("d", bytes(8 * size))
+        self.start = 0
+        self.count = 0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def append(self, value:float) -> None:
+        size = len(self.buffer)
+        self.buffer[(self.start + self.count) % size] = value
+
+        if self.count < size:
+            self.count += 1
+        else:
+            # Full, the oldest sample was overwritten
+            self.start = (self.start + 1) % size
+
+    def values(self, last:int = None) -> list:
+        """
+        Returns the samples from the oldest to the newest, only the `last` ones if given.
+        """
+        count = self.count if last is None else min(last, self.count)
+        size = len(self.buffer)
+        first = self.start + self.count - count
+
+        return [self.buffer[index % size] for index in range(first, first + count)]
+
+def sparkline(values:list, low:float = None, high:float = None, min_span:float = 0) -> str:
+    """
+    Draws the values as a sparkline, one block per value.
+
+    Args:
+    values (list): The values, oldest first.
+    low (float): The value of the lowest block, the smallest value if not given.
+    high (float): The value of the highest block, the largest value if not given.
+    min_span (float): The least difference between the lowest and the highest
+    block, so small variations don't look like large swings.
+
+    Returns:
+    str: The sparkline, empty without values.
+    """
+    if not values:
+        return ""
+
+    low = min(values) if low is None else low
+    high = max(values) if high is None else high
+    high = max(high, low + min_span)
+    span = high - low
+    top = len(SPARK_BLOCKS) - 1
+
+    if span <= 0:
+        # A flat line, drawn at the middle
+        return SPARK_BLOCKS[top // 2] * len(values)
+
+    return "".join(SPARK_BLOCKS[min(max(round((value - low) / span * top), 0), top)] for value in values)
+
+class History:
+    """
+    The recent values of the numeric metrics, one Series each, optionally
+    persisted in the cache so the next run goes on with the same trend.
+
+    Recording is thread safe, the daemon records from one thread per probe.
+    """
+
+    def __init__(self, size:int = HISTORY_SIZE):
+        self.size = size
+        self.series = {}
+        self.lock = threading.Lock()
+        # Whether samples were recorded since the history was last loaded or saved
+        self.changed = False
+
+    def record(self, name:str, value:float) -> None:
+        if value is None:
+            return
+
+        with self.lock:
+            if name not in self.series:
+                self.series[name] = Series(self.size)
+            self.series[name].append(value)
+            self.changed = True
+
+    def values(self, name:str, last:int = None) -> list:
+        with self.lock:
+            series = self.series.get(name)
+            return series.values(last) if series else []
+
+    def load(self) -> None:
+        """
+        Continues the history persisted by a previous run, unless it is too old.
+        """
+        cached = load("history")
+
+        try:
+            if time() - cached["time"] > HISTORY_MAX_AGE:
+                return
+
+            for name, values in cached["series"].items():
+                for value in values[-self.size:]:
+                    self.record(name, float(value))
+        except (KeyError, TypeError, ValueError):
+            # Missing, or written by another version
+            pass
+
+        self.changed = False
+
+    def save(self) -> None:
+        """
+        Persists the history in the cache, if samples were recorded since it was loaded.
+        """
+        with self.lock:
+            if not self.changed:
+                return
+
+            series = {name: series.values() for name, series in self.series.items()}
+            self.changed = False
+
+        store("history", {"time": time(), "series": series})
@@ -0,0 +1,81 @@
+from itertools import count
+
+class Layout:
+    """
+    The order of the widgets, resolved once from where each of them is placed.
+
+    Widgets are added in their natural order, the ones given an index are
+    pinned to that position of the final order. Placing or removing a widget
+    only records it, the order is computed in a single pass by `resolve`,
+    however many widgets are placed.
+
+    Pinned widgets sharing an index keep the order they were pinned in,
+    the others keep their natural order in the positions left.
+    """
+
+    def __init__(self, names=()):
+        # The widgets in natural order, as an ordered set
+        self.names = dict.fromkeys(names)
+        # name: (index, sequence) of the pinned widgets
+        self.pins = {}
+        self.sequence = count()
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __contains__(self, name) -> bool:
+        return name in self.names
+
+    def add(self, name:str, index:int = None) -> None:
+        """
+        Adds a widget after the others, pinned to `index` if given.
+        A widget already added is moved, as if it was added again.
+        """
+        self.names.pop(name, None)
+        self.names[name] = None
+        self.pins.pop(name, None)
+
+        if index is not None:
+            self.move(name, index)
+
+    def move(self, name:str, index:int) -> None:
+        # Pins a widget to `index` of the final order
+        self.pins[name] = (index, next(self.sequence))
+
+    def remove(self, name:str) -> None:
+        del self.names[name]
+        self.pins.pop(name, None)
+
+    def resolve(self) -> list:
+        """
+        Returns:
+        list: The names of the widgets in their final order.
+        """
+        total = len(self.names)
+        pinned = []
+
+        for name, (index, sequence) in self.pins.items():
+            # Negative indexes count from the end, as with list.insert on the other
+            # widgets: -1 is before the last of them
+            if index < 0:
+                index = max(total - 1 + index, 0)
+            pinned.append((index, sequence, name))
+
+        # Ties on the index are broken by the order the widgets were pinned in
+        pinned.sort()
+        loose = [name for name in self.names if name not in self.pins]
+
+        order = []
+        next_pinned = next_loose = 0
+
+        while len(order) < total:
+            # A pinned widget takes its position once reached, or the positions left
+            # once the loose ones ran out (an index past the end is the end)
+            if next_pinned < len(pinned) and (pinned[next_pinned][0] <= len(order) or next_loose == len(loose)):
+                order.append(pinned[next_pinned][2])
+                next_pinned += 1
+            else:
+                order.append(loose[next_loose])
+                next_loose += 1
+
+        return order
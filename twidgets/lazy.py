@@ -0,0 +1,34 @@
+from importlib import import_module
+
+class Lazy:
+    """
+    Proxy that builds its target object on first attribute access.
+
+    Heavy dependencies (rich, requests, psutil, cpuinfo) are wrapped in a Lazy
+    so that each mode only pays for the modules it actually touches.
+    """
+
+    def __init__(self, factory):
+        self._factory = factory
+        self._target = None
+
+    def __getattr__(self, name):
+        # Only called for attributes missing on the proxy itself
+        if self._target is None:
+            self._target = self._factory()
+        return getattr(self._target, name)
+
+    @property
+    def loaded(self) -> bool:
+        # True once the underlying object has been created
+        return self._target is not None
+
+def lazy_module(name:str) -> Lazy:
+    """
+    Returns a proxy for the module `name` that imports it on first use.
+
+    Example:
+    >>> requests = lazy_module("requests")
+    >>> requests.get(...)  # 'requests' is imported here
+    """
+    return Lazy(lambda: import_module(name))
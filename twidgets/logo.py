@@ -1,142 +1,104 @@
+import os
 from .path import CONFIG_PATH
-from rich.console import Console
-from json import load as jsload
+from .cells import measure
+from .lazy import Lazy, lazy_module
+from .configfile import load_config
 from sys import exit
 
-console = Console()
-
-logo_list = {
-"pacman" :
-r"""[b]
-[{yellow}]    ▄███████▄  [{green}]   ▄██████▄   [{sky}]   ▄██████▄   [{red}]   ▄██████▄   [{cyan}]   ▄██████▄   
-[{yellow}]  ▄█████████▀▀ [{green}] ▄[{white}]█▀█[{green}]██[{white}]█▀█[{green}]██▄ [{sky}] ▄[{white}]█▀█[{sky}]██[{white}]█▀█[{sky}]██▄ [{red}] ▄[{white}]█▀█[{red}]██[{white}]█▀█[{red}]██▄ [{cyan}] ▄[{white}]█▀█[{cyan}]██[{white}]█▀█[{cyan}]██▄   
-[{yellow}] ████████▀     [{green}] █[{white}]▄▄█[{green}]██[{white}]▄▄█[{green}]███ [{sky}] █[{white}]▄▄█[{sky}]██[{white}]▄▄█[{sky}]███ [{red}] █[{white}]▄▄█[{red}]██[{white}]▄▄█[{red}]███ [{cyan}] █[{white}]▄▄█[{cyan}]██[{white}]▄▄█[{cyan}]███   
-[{yellow}] ████████▄     [{green}] ████████████ [{sky}] ████████████ [{red}] ████████████ [{cyan}] ████████████   
-[{yellow}]  ▀█████████▄▄ [{green}] ██▀██▀▀██▀██ [{sky}] ██▀██▀▀██▀██ [{red}] ██▀██▀▀██▀██ [{cyan}] ██▀██▀▀██▀██   
-[{yellow}]    ▀███████▀  [{green}] ▀   ▀  ▀   ▀ [{sky}] ▀   ▀  ▀   ▀ [{red}] ▀   ▀  ▀   ▀ [{cyan}] ▀   ▀  ▀   ▀   
-[/]""",
-
-"linux" :
-"""\33[49m             \33[38;2;185;185;185;49m▄\33[38;2;179;179;179;49m▄\33[38;2;144;144;144;48;2;170;166;166m▄\33[38;2;100;100;100;48;2;149;149;149m▄\33[38;2;86;86;86;48;2;142;142;142m▄\33[38;2;98;98;98;49m▄\33[38;2;103;103;103;49m▄\33[49m           \33[m
-\33[49m            \33[38;2;178;178;178;48;2;181;181;181m▄\33[38;2;156;156;156;48;2;208;208;208m▄\33[38;2;61;61;61;48;2;146;146;146m▄\33[38;2;15;15;15;48;2;67;67;67m▄\33[38;2;4;4;4;48;2;29;29;29m▄\33[38;2;2;2;2;48;2;16;16;16m▄\33[38;2;3;3;3;48;2;25;25;25m▄\33[38;2;17;17;17;48;2;63;63;63m▄\33[38;2;69;69;69;48;2;97;97;97m▄\33[49m          \33[m
-\33[49m           \33[38;2;166;166;166;48;2;161;161;161m▄\33[38;2;156;156;156;48;2;160;161;161m▄\33[38;2;74;74;74;48;2;86;86;86m▄\33[38;2;5;5;5;48;2;20;19;19m▄\33[48;2;2;2;2m \33[38;2;20;20;20;48;2;6;6;6m▄\33[38;2;103;103;103;48;2;25;25;25m▄\33[38;2;57;56;56;48;2;13;13;13m▄\33[38;2;12;12;12;48;2;4;4;4m▄\33[38;2;33;32;32;48;2;43;43;43m▄\33[38;2;94;94;94;49m▄\33[49m         \33[m
-\33[49m           \33[38;2;139;139;139;48;2;157;157;157m▄\33[38;2;153;153;153;48;2;208;208;208m▄\33[38;2;55;54;54;48;2;170;170;170m▄\33[48;2;2;2;2m  \33[38;2;114;114;114;48;2;189;189;189m▄\33[38;2;24;24;24;48;2;207;207;207m▄\33[38;2;177;177;177;48;2;170;170;170m▄\33[38;2;8;8;8;48;2;10;10;10m▄\33[48;2;31;30;30m \33[38;2;87;87;81;48;2;87;87;87m▄\33[49m         \33[m
-\33[49m           \33[38;2;104;104;104;48;2;123;123;123m▄\33[38;2;165;148;89;48;2;148;148;147m▄\33[38;2;252;217;97;48;2;85;64;25m▄\33[38;2;252;213;82;48;2;208;150;2m▄\33[38;2;253;196;2;48;2;212;148;2m▄\33[38;2;253;196;0;48;2;102;80;25m▄\33[38;2;251;192;4;48;2;82;60;34m▄\33[38;2;202;138;15;48;2;145;145;144m▄\33[38;2;4;4;3;48;2;2;2;2m▄\33[38;2;24;23;23;48;2;27;27;27m▄\33[38;2;69;69;69;48;2;85;85;85m▄\33[49m         \33[m
-\33[49m           \33[38;2;97;97;97;48;2;103;103;99m▄\33[38;2;113;90;65;48;2;225;161;26m▄\33[38;2;209;129;8;48;2;252;214;82m▄\33[38;2;193;125;8;48;2;253;212;62m▄\33[38;2;183;115;7;48;2;254;197;2m▄\33[38;2;171;98;6;48;2;250;188;0m▄\33[38;2;136;80;18;48;2;216;140;3m▄\33[38;2;106;93;79;48;2;146;84;13m▄\33[38;2;40;39;39;48;2;24;21;19m▄\33[38;2;117;117;117;48;2;41;40;40m▄\33[38;2;56;56;56;48;2;62;62;62m▄\33[38;2;71;71;71;49m▄\33[49m        \33[m
-\33[49m          \33[38;2;116;116;116;49m▄\33[38;2;55;55;55;48;2;81;81;80m▄\33[38;2;152;152;152;48;2;118;117;117m▄\33[38;2;209;209;209;48;2;174;161;147m▄\33[38;2;157;157;157;48;2;113;71;28m▄\33[38;2;112;112;111;48;2;107;63;18m▄\33[38;2;120;120;120;48;2;108;78;46m▄\33[38;2;156;157;157;48;2;112;110;107m▄\33[38;2;198;198;198;48;2;175;175;175m▄\33[38;2;105;105;105;48;2;37;36;36m▄\33[38;2;37;37;37;48;2;119;119;118m▄\33[38;2;47;47;47;48;2;65;65;65m▄\33[38;2;58;58;58;48;2;76;76;74m▄\33[38;2;86;86;86;49m▄\33[49m       \33[m
-\33[49m         \33[38;2;116;116;113;49m▄\33[38;2;49;49;49;48;2;86;86;86m▄\33[38;2;151;151;151;48;2;40;40;40m▄\33[38;2;235;235;235;48;2;234;234;234m▄\33[38;2;233;233;233;48;2;225;225;225m▄\33[38;2;225;225;225;48;2;201;201;201m▄\33[38;2;211;211;211;48;2;169;169;169m▄\33[38;2;207;207;207;48;2;163;164;164m▄\33[38;2;220;220;220;48;2;190;190;190m▄\33[38;2;230;230;230;48;2;219;219;219m▄\33[38;2;233;233;233;48;2;188;188;188m▄\33[38;2;62;62;62;48;2;4;4;4m▄\33[38;2;6;6;6;48;2;10;10;10m▄\33[38;2;7;7;7;48;2;26;26;26m▄\33[38;2;41;41;41;48;2;76;76;76m▄\33[38;2;81;80;80;48;2;95;95;95m▄\33[49m      \33[m
-\33[49m        \33[38;2;117;117;117;48;2;107;107;107m▄\33[38;2;41;41;41;48;2;81;81;81m▄\33[38;2;191;191;191;48;2;38;38;38m▄\33[38;2;243;243;243;48;2;229;229;229m▄\33[38;2;247;247;247;48;2;239;239;239m▄\33[38;2;249;249;249;48;2;241;241;241m▄\33[38;2;250;250;250;48;2;240;240;240m▄\33[38;2;249;249;249;48;2;236;236;236m▄\33[38;2;245;245;245;48;2;234;234;234m▄\33[38;2;242;242;242;48;2;234;234;234m▄\33[38;2;235;235;235;48;2;233;233;233m▄\33[38;2;227;227;227;48;2;230;230;230m▄\33[38;2;219;219;219;48;2;203;203;203m▄\33[38;2;96;96;96;48;2;34;34;34m▄\33[38;2;52;51;51;48;2;20;19;19m▄\33[38;2;19;19;19;48;2;16;16;16m▄\33[38;2;28;28;28;48;2;54;54;54m▄\33[38;2;76;76;74;48;2;87;85;85m▄\33[38;2;98;98;98;49m▄\33[49m    \33[m
-\33[49m       \33[38;2;129;129;129;48;2;133;133;133m▄\33[38;2;75;75;74;48;2;82;82;82m▄\33[38;2;212;212;212;48;2;98;98;98m▄\33[38;2;246;246;246;48;2;239;239;239m▄\33[38;2;253;253;253;48;2;250;250;250m▄\33[38;2;255;255;255;48;2;253;253;253m▄\33[48;2;253;253;253m \33[38;2;252;252;252;48;2;253;253;253m▄\33[38;2;254;254;254;48;2;253;253;253m▄\33[38;2;255;255;255;48;2;252;252;252m▄\33[38;2;252;252;252;48;2;249;249;249m▄\33[38;2;247;247;247;48;2;242;242;242m▄\33[38;2;236;236;236;48;2;229;229;229m▄\33[38;2;214;214;214;48;2;212;212;212m▄\33[38;2;196;196;196;48;2;208;208;208m▄\33[38;2;106;106;106;48;2;83;83;83m▄\33[38;2;103;103;103;48;2;52;51;51m▄\33[38;2;27;27;27;48;2;19;18;18m▄\33[38;2;33;33;33;48;2;55;55;55m▄\33[38;2;92;92;92;48;2;98;98;98m▄\33[38;2;99;99;99;49m▄\33[49m   \33[m
-\33[49m      \33[38;2;149;149;149;48;2;163;163;159m▄\33[38;2;107;107;106;48;2;111;111;110m▄\33[38;2;128;128;128;48;2;108;108;108m▄\33[38;2;233;233;233;48;2;228;228;228m▄\33[38;2;252;252;252;48;2;250;250;250m▄\33[38;2;255;255;255;48;2;254;254;254m▄\33[48;2;255;255;255m \33[48;2;252;252;252m  \33[48;2;253;253;253m \33[48;2;255;255;255m \33[38;2;254;254;254;48;2;253;253;253m▄\33[38;2;251;251;251;48;2;250;250;250m▄\33[38;2;242;242;242;48;2;241;241;241m▄\33[38;2;222;222;222;48;2;220;220;220m▄\33[38;2;187;187;187;48;2;190;190;190m▄\33[38;2;186;186;186;48;2;164;164;164m▄\33[38;2;83;83;83;48;2;127;127;127m▄\33[38;2;35;35;35;48;2;41;40;40m▄\33[38;2;7;7;7;48;2;18;18;18m▄\33[38;2;54;54;54;48;2;73;73;73m▄\33[38;2;134;134;134;48;2;128;128;128m▄\33[49m   \33[m
-\33[49m     \33[38;2;166;166;166;49m▄\33[38;2;135;135;135;48;2;143;143;143m▄\33[38;2;93;93;92;48;2;110;111;110m▄\33[38;2;134;134;134;48;2;130;130;130m▄\33[38;2;216;216;216;48;2;229;229;229m▄\33[38;2;246;246;246;48;2;250;250;250m▄\33[38;2;253;253;253;48;2;254;254;254m▄\33[48;2;255;255;255m \33[38;2;251;251;251;48;2;252;252;252m▄\33[38;2;248;248;248;48;2;251;251;251m▄\33[38;2;252;252;252;48;2;253;253;253m▄\33[48;2;255;255;255m \33[38;2;252;252;252;48;2;253;253;253m▄\33[38;2;247;247;247;48;2;250;250;250m▄\33[38;2;237;237;237;48;2;242;242;242m▄\33[38;2;210;210;210;48;2;218;218;218m▄\33[38;2;169;169;169;48;2;180;180;180m▄\33[38;2;164;164;164;48;2;176;176;176m▄\33[38;2;39;39;39;48;2;56;55;55m▄\33[38;2;65;65;65;48;2;16;15;15m▄\33[38;2;37;37;37;48;2;6;6;6m▄\33[38;2;56;55;55;48;2;48;48;47m▄\33[38;2;141;141;141;48;2;137;138;138m▄\33[49m   \33[m
-\33[49m     \33[38;2;248;200;44;48;2;227;200;116m▄\33[38;2;252;193;0;48;2;227;176;57m▄\33[38;2;246;181;0;48;2;191;128;26m▄\33[38;2;178;116;25;48;2;102;102;102m▄\33[38;2;75;74;73;48;2;186;186;185m▄\33[38;2;194;194;194;48;2;234;234;234m▄\33[38;2;236;236;236;48;2;249;249;249m▄\33[38;2;246;246;246;48;2;252;252;252m▄\33[38;2;244;244;244;48;2;249;249;249m▄\33[38;2;239;239;239;48;2;244;244;244m▄\33[38;2;245;245;245;48;2;251;251;251m▄\33[38;2;246;246;246;48;2;252;252;252m▄\33[38;2;242;242;242;48;2;248;248;248m▄\33[38;2;234;234;234;48;2;242;242;242m▄\33[38;2;213;213;213;48;2;228;228;228m▄\33[38;2;170;170;170;48;2;195;195;195m▄\33[38;2;236;186;58;48;2;165;159;143m▄\33[38;2;249;189;5;48;2;181;169;130m▄\33[38;2;242;176;11;48;2;65;63;54m▄\33[38;2;224;153;9;48;2;29;29;29m▄\33[38;2;220;152;12;48;2;45;45;45m▄\33[38;2;225;164;25;48;2;85;85;85m▄\33[38;2;232;168;41;48;2;134;132;132m▄\33[38;2;225;165;45;49m▄\33[49m  \33[m
-\33[49m \33[38;2;228;146;11;49m▄\33[38;2;244;177;3;48;2;240;209;100m▄\33[38;2;252;193;0;48;2;244;207;80m▄\33[38;2;253;196;0;48;2;251;212;80m▄\33[38;2;254;196;0;48;2;253;197;2m▄\33[38;2;254;197;0;48;2;254;197;1m▄\33[38;2;254;197;0;48;2;253;195;0m▄\33[38;2;250;189;0;48;2;240;167;1m▄\33[38;2;228;140;3;48;2;68;47;16m▄\33[38;2;28;20;9;48;2;44;43;43m▄\33[38;2;18;18;18;48;2;191;191;191m▄\33[38;2;191;191;191;48;2;231;231;231m▄\33[38;2;222;222;222;48;2;236;236;236m▄\33[38;2;226;226;226;48;2;231;231;231m▄\33[38;2;226;226;226;48;2;235;235;235m▄\33[38;2;223;223;223;48;2;237;237;237m▄\33[38;2;210;210;210;48;2;231;231;231m▄\33[38;2;183;183;183;48;2;216;216;216m▄\33[38;2;145;145;145;48;2;184;184;184m▄\33[38;2;121;119;114;48;2;141;141;140m▄\33[38;2;238;164;11;48;2;239;173;25m▄\33[38;2;251;190;0;48;2;253;195;0m▄\33[38;2;250;189;0;48;2;252;193;0m▄\33[38;2;248;184;0;48;2;251;190;0m▄\33[38;2;247;181;1;48;2;250;189;0m▄\33[38;2;246;179;1;48;2;250;188;0m▄\33[38;2;241;166;0;48;2;241;164;0m▄\33[38;2;228;147;19;48;2;217;137;19m▄\33[49m  \33[m
-\33[49m \33[38;2;247;185;31;48;2;238;168;6m▄\33[38;2;249;187;0;48;2;250;188;0m▄\33[38;2;251;190;0;48;2;252;194;0m▄\33[38;2;248;184;0;48;2;251;191;0m▄\33[38;2;247;181;0;48;2;251;190;0m▄\33[38;2;247;182;0;48;2;251;190;0m▄\33[38;2;248;183;0;48;2;251;192;0m▄\33[38;2;249;187;0;48;2;251;192;0m▄\33[38;2;248;185;0;48;2;243;173;0m▄\33[38;2;231;145;2;48;2;162;98;11m▄\33[38;2;92;68;39;48;2;2;2;2m▄\33[38;2;113;113;113;48;2;79;79;79m▄\33[38;2;129;129;129;48;2;182;182;182m▄\33[38;2;140;140;140;48;2;194;194;194m▄\33[38;2;141;141;141;48;2;196;196;196m▄\33[38;2;131;131;131;48;2;184;184;184m▄\33[38;2;118;118;118;48;2;163;163;163m▄\33[38;2;106;106;106;48;2;135;135;135m▄\33[38;2;61;61;61;48;2;115;115;115m▄\33[38;2;28;22;9;48;2;97;93;84m▄\33[38;2;240;165;3;48;2;239;163;5m▄\33[38;2;246;180;0;48;2;248;185;0m▄\33[38;2;243;172;0;48;2;246;180;0m▄\33[38;2;241;164;0;48;2;244;174;0m▄\33[38;2;239;160;0;48;2;243;169;0m▄\33[38;2;239;160;0;48;2;243;168;0m▄\33[38;2;241;163;0;48;2;242;167;0m▄\33[38;2;243;169;0;48;2;242;164;0m▄\33[38;2;238;161;2;48;2;235;167;28m▄\33[38;2;221;141;27;49m\33[0m
-\33[49m \33[38;2;243;189;49;48;2;242;188;47m▄\33[38;2;247;182;0;48;2;249;187;0m▄\33[38;2;248;184;0;48;2;249;186;0m▄\33[38;2;245;177;0;48;2;246;179;0m▄\33[38;2;243;170;0;48;2;244;174;0m▄\33[38;2;242;166;0;48;2;243;172;0m▄\33[38;2;242;166;0;48;2;244;173;0m▄\33[38;2;243;170;0;48;2;246;177;0m▄\33[38;2;245;175;0;48;2;247;181;0m▄\33[38;2;245;175;0;48;2;242;167;0m▄\33[38;2;223;134;3;48;2;195;113;10m▄\33[38;2;145;89;23;48;2;74;66;51m▄\33[38;2;14;14;14;48;2;76;76;76m▄\33[38;2;6;6;6;48;2;103;103;103m▄\33[38;2;7;7;7;48;2;106;106;106m▄\33[38;2;4;4;4;48;2;100;100;99m▄\33[38;2;7;7;7;48;2;73;73;72m▄\33[38;2;14;14;14;48;2;33;33;33m▄\33[38;2;24;24;24;48;2;3;3;3m▄\33[38;2;77;60;30;48;2;41;31;12m▄\33[38;2;242;170;0;48;2;242;168;1m▄\33[38;2;243;172;0;48;2;244;175;0m▄\33[38;2;240;163;0;48;2;241;165;0m▄\33[38;2;238;158;0;48;2;239;159;0m▄\33[48;2;238;158;1m \33[38;2;237;157;1;48;2;238;158;0m▄\33[38;2;232;144;1;48;2;239;161;0m▄\33[38;2;191;108;4;48;2;237;155;0m▄\33[38;2;90;49;0;48;2;213;124;4m▄\33[0m
-\33[49m \33[49;38;2;224;131;0m▀\33[49;38;2;237;152;1m▀\33[49;38;2;241;164;0m▀\33[38;2;220;124;3;48;2;241;165;0m▄\33[38;2;221;127;3;48;2;241;163;0m▄\33[38;2;229;134;2;48;2;240;162;0m▄\33[38;2;234;142;2;48;2;240;162;0m▄\33[38;2;236;152;1;48;2;241;165;0m▄\33[38;2;241;163;0;48;2;243;171;0m▄\33[38;2;242;167;0;48;2;245;177;0m▄\33[38;2;231;141;1;48;2;234;149;1m▄\33[38;2;167;93;9;48;2;179;99;12m▄\33[38;2;0;0;0;48;2;35;35;35m▄\33[38;2;0;0;0;48;2;33;32;32m▄\33[38;2;5;5;5;48;2;32;32;32m▄\33[38;2;3;3;3;48;2;36;35;35m▄\33[38;2;0;0;0;48;2;42;42;42m▄\33[38;2;0;0;0;48;2;48;47;47m▄\33[38;2;0;0;0;48;2;47;47;47m▄\33[38;2;142;85;4;48;2;149;108;33m▄\33[38;2;242;168;0;48;2;245;175;1m▄\33[38;2;243;172;0;48;2;243;173;0m▄\33[38;2;240;161;0;48;2;241;165;0m▄\33[38;2;231;142;2;48;2;239;160;0m▄\33[38;2;190;106;5;48;2;236;153;1m▄\33[38;2;23;12;0;48;2;220;130;2m▄\33[0m
-\33[49m      \33[49;38;2;49;29;0m▀\33[38;2;0;0;0;48;2;100;54;0m▄\33[38;2;0;0;0;48;2;178;100;5m▄\33[38;2;40;20;0;48;2;210;119;5m▄\33[38;2;82;43;0;48;2;213;120;5m▄\33[38;2;17;6;0;48;2;168;94;5m▄\33[38;2;0;0;0;48;2;18;9;0m▄\33[48;2;0;0;0m       \33[38;2;0;0;0;48;2;66;36;0m▄\33[38;2;47;26;0;48;2;229;135;1m▄\33[38;2;94;51;2;48;2;231;138;1m▄\33[38;2;70;37;2;48;2;214;121;4m▄\33[0m\n
-""",
-
-"windows" :
-[
-    "\33[48;5;32m                 \33[49m \33[48;5;32m                 \33[m",
-    "\33[48;5;32m                 \33[49m \33[48;5;32m                 \33[m",
-    "\33[48;5;32m                 \33[49m \33[48;5;32m                 \33[m",
-    "\33[48;5;32m                 \33[49m \33[48;5;32m                 \33[m",
-    "\33[48;5;32m                 \33[49m \33[48;5;32m                 \33[m",
-    "\33[48;5;32m                 \33[49m \33[48;5;32m                 \33[m",
-    "\33[48;5;32m                 \33[49m \33[48;5;32m                 \33[m",
-    "\33[48;5;32m                 \33[49m \33[48;5;32m                 \33[m",
-    "\33[49;38;5;32m▀▀▀▀▀▀▀▀▀▀▀▀▀▀▀▀▀\33[49m \33[49;38;5;32m▀▀▀▀▀▀▀▀▀▀▀▀▀▀▀▀▀\33[m",
-    "\33[48;5;32m                 \33[49m \33[48;5;32m                 \33[m",
-    "\33[48;5;32m                 \33[49m \33[48;5;32m                 \33[m",
-    "\33[48;5;32m                 \33[49m \33[48;5;32m                 \33[m",
-    "\33[48;5;32m                 \33[49m \33[48;5;32m                 \33[m",
-    "\33[48;5;32m                 \33[49m \33[48;5;32m                 \33[m",
-    "\33[48;5;32m                 \33[49m \33[48;5;32m                 \33[m",
-    "\33[48;5;32m                 \33[49m \33[48;5;32m                 \33[m",
-    "\33[48;5;32m                 \33[49m \33[48;5;32m                 \33[m",
-    "\33[49;38;5;32m▀▀▀▀▀▀▀▀▀▀▀▀▀▀▀▀▀\33[49m \33[49;38;5;32m▀▀▀▀▀▀▀▀▀▀▀▀▀▀▀▀▀\33[m"
-],
-
-"macos" :
-"""\33[49m                   \33[38;2;102;194;61;49m▄\33[38;2;97;185;70;49m▄\33[38;2;97;186;70;48;2;96;181;64m▄\33[38;2;97;185;71;48;2;95;177;69m▄\33[38;2;94;179;67;48;2;94;189;66m▄\33[49m\33[m     
-\33[49m                 \33[38;2;98;185;73;49m▄\33[38;2;97;187;71;48;2;98;186;72m▄\33[38;2;97;187;70;48;2;97;186;71m▄\33[48;2;98;187;71m  \33[48;2;97;187;71m \33[38;2;97;188;67;48;2;95;184;71m▄\33[49m\33[m     
-\33[49m                \33[38;2;97;186;72;48;2;96;183;67m▄\33[48;2;98;187;71m    \33[38;2;97;187;70;48;2;98;187;71m▄\33[38;2;96;188;72;48;2;98;186;70m▄\33[49m\33[m     
-\33[49m               \33[38;2;96;187;71;48;2;98;183;72m▄\33[38;2;98;187;70;48;2;98;187;71m▄\33[48;2;98;187;71m  \33[38;2;97;187;71;48;2;98;187;71m▄\33[38;2;98;187;71;48;2;97;187;71m▄\33[38;2;99;184;71;48;2;99;188;71m▄\33[49m\33[m     
-\33[49m      \33[38;2;92;184;71;49m▄\33[38;2;95;184;68;49m▄\33[38;2;98;185;70;49m▄\33[38;2;96;184;71;49m▄▄▄\33[38;2;96;185;70;49m▄\33[38;2;99;184;71;49m▄\33[49m \33[38;2;98;189;73;48;2;96;188;70m▄\33[38;2;97;185;72;48;2;98;187;71m▄\33[38;2;96;186;71;48;2;98;187;71m▄\33[38;2;93;185;70;48;2;98;187;70m▄\33[0m \33[38;2;96;187;68;49m▄\33[38;2;95;184;71;49m▄\33[38;2;99;186;71;49m▄\33[38;2;97;183;70;49m▄\33[38;2;98;187;70;49m▄\33[38;2;97;186;71;49m▄\33[38;2;98;184;71;49m▄\33[38;2;102;191;77;49m▄\33[49m\33[m     
-\33[49m   \33[38;2;90;180;75;49m▄\33[38;2;98;185;71;49m▄\33[38;2;98;187;71;48;2;97;185;70m▄\33[38;2;98;187;71;48;2;97;186;71m▄\33[48;2;98;187;71m       \33[38;2;98;187;71;48;2;97;187;70m▄\33[38;2;98;187;71;48;2;96;183;69m▄\33[38;2;98;187;71;48;2;96;182;70m▄\33[38;2;98;187;71;48;2;97;185;70m▄\33[38;2;98;187;71;48;2;98;185;70m▄\33[38;2;98;187;71;48;2;97;186;70m▄\33[38;2;98;187;71;48;2;98;186;71m▄\33[38;2;98;187;71;48;2;97;187;70m▄\33[48;2;98;187;71m   \33[38;2;98;187;71;48;2;97;187;70m▄\33[48;2;98;187;71m  \33[38;2;98;187;71;48;2;98;189;70m▄\33[38;2;97;187;70;49m▄\33[49m\33[m     
-\33[49m  \33[38;2;111;184;68;48;2;91;182;64m▄\33[38;2;106;187;68;48;2;97;185;70m▄\33[38;2;106;186;68;48;2;98;187;71m▄▄▄▄▄▄▄▄▄▄▄▄▄▄▄▄▄▄▄▄▄▄▄▄▄\33[38;2;105;187;70;48;2;98;186;71m▄\33[38;2;100;185;70;48;2;97;186;71m▄\33[49m\33[m     
-\33[49m \33[38;2;251;183;40;48;2;238;181;40m▄\33[38;2;252;184;39;48;2;249;183;40m▄\33[48;2;252;184;39m                        \33[38;2;252;183;39;48;2;252;184;38m▄\33[38;2;247;181;37;48;2;250;184;39m▄\33[49;38;2;232;178;39m▀\33[49m\33[m     
-\33[49m\33[38;2;249;181;39;48;2;242;177;39m▄\33[38;2;251;184;39;48;2;252;184;38m▄\33[48;2;252;184;39m                        \33[38;2;251;183;38;48;2;252;184;39m▄\33[38;2;239;175;40;48;2;248;181;39m▄\33[49m\33[m     
-\33[49m\33[38;2;234;125;31;48;2;243;153;36m▄\33[38;2;244;130;31;48;2;248;155;34m▄\33[38;2;246;130;31;48;2;249;156;34m▄▄▄▄▄▄▄▄▄▄▄▄▄▄▄▄▄▄▄▄▄▄▄▄\33[38;2;246;128;29;48;2;245;156;36m▄\33[49m\33[m     
-\33[49m\33[38;2;233;124;33;48;2;235;123;30m▄\33[38;2;244;130;31;48;2;245;130;30m▄\33[48;2;246;130;31m                        \33[38;2;244;130;32;48;2;246;130;30m▄\33[49m\33[m     
-\33[49m\33[38;2;226;74;55;48;2;238;123;32m▄\33[38;2;228;72;56;48;2;244;125;33m▄\33[38;2;228;72;55;48;2;244;125;32m▄▄▄▄▄▄▄▄▄▄▄▄▄▄▄▄▄▄▄▄▄▄▄▄\33[38;2;228;72;55;48;2;244;125;33m▄\33[38;2;226;67;59;48;2;230;115;41m▄\33[49m\33[m     
-\33[49m\33[49;38;2;212;54;60m▀\33[38;2;222;58;62;48;2;223;58;62m▄\33[48;2;224;58;62m                         \33[38;2;224;57;61;48;2;225;58;61m▄\33[38;2;224;59;63;48;2;228;58;63m▄\33[38;2;226;58;66;49m▄\33[49m\33[m     
-\33[49m \33[38;2;216;59;59;48;2;219;57;61m▄\33[38;2;210;59;79;48;2;224;58;62m▄\33[38;2;207;58;82;48;2;224;58;62m▄▄▄▄▄▄▄▄▄▄▄▄▄▄▄▄▄▄▄▄▄▄▄▄▄\33[38;2;207;58;82;48;2;224;57;61m▄\33[38;2;207;58;82;48;2;225;58;63m▄\33[38;2;206;58;82;48;2;225;59;64m▄\33[38;2;206;59;86;49m▄\33[49m\33[m     
-\33[49m  \33[38;2;151;60;148;48;2;162;61;137m▄\33[38;2;150;61;151;48;2;156;60;143m▄▄▄▄▄▄▄▄▄▄▄▄▄▄▄▄▄▄▄▄▄▄▄▄▄▄▄\33[38;2;150;61;150;48;2;156;61;143m▄\33[38;2;150;61;150;48;2;161;59;136m▄\33[49m\33[m     
-\33[49m  \33[49;38;2;146;61;146m▀\33[38;2;152;63;152;48;2;151;61;151m▄\33[48;2;150;61;151m                         \33[38;2;150;61;152;48;2;150;61;151m▄\33[49;38;2;151;61;151m▀\33[49m\33[m     
-\33[49m    \33[38;2;12;146;206;48;2;119;81;166m▄\33[38;2;1;156;219;48;2;86;102;179m▄\33[38;2;0;157;220;48;2;84;102;180m▄▄▄▄▄▄▄▄▄▄▄▄▄▄▄▄▄▄▄▄▄▄\33[38;2;2;155;218;48;2;93;97;177m▄\33[49;38;2;125;76;161m▀\33[49m\33[m     
-\33[49m     \33[49;38;2;4;155;218m▀\33[38;2;3;155;220;48;2;0;157;220m▄\33[48;2;0;157;220m        \33[38;2;0;155;218;48;2;0;157;220m▄\33[38;2;0;156;219;48;2;0;157;220m▄\33[38;2;0;156;220;48;2;0;157;220m▄\33[48;2;0;157;220m \33[38;2;0;156;220;48;2;0;157;220m▄\33[48;2;0;157;220m     \33[38;2;0;156;219;48;2;0;157;220m▄▄\33[38;2;0;151;209;48;2;0;157;221m▄\33[49m\33[m     
-\33[49m       \33[49;38;2;0;154;217m▀\33[49;38;2;1;156;219m▀\33[38;2;4;154;215;48;2;0;157;220m▄\33[38;2;5;154;217;48;2;0;157;220m▄\33[38;2;0;154;215;48;2;0;157;220m▄\33[38;2;0;156;213;48;2;0;157;220m▄\33[49;38;2;0;156;219m▀\33[49;38;2;0;155;218m▀\33[49;38;2;0;157;216m▀\33[49;38;2;0;156;213m▀\33[49;38;2;0;148;215m▀\33[49;38;2;0;155;219m▀\33[49;38;2;0;151;217m▀\33[49;38;2;2;155;218m▀\33[38;2;7;152;214;48;2;0;156;219m▄\33[38;2;5;157;215;48;2;0;157;220m▄\33[38;2;6;157;219;48;2;0;157;220m▄\33[38;2;0;158;211;48;2;0;157;220m▄\33[49;38;2;2;156;218m▀\33[49;38;2;0;151;220m▀\33[49m\33[m\n     
-""",
-
-"android" :
-"""\33[49m        \33[38;2;133;197;138;49m▄\33[38;2;137;197;139;49m▄\33[38;2;133;197;139;49m▄\33[49m                      \33[38;2;134;197;139;49m▄\33[38;2;135;197;138;49m▄\33[38;2;130;196;136;49m▄\33[49m          \33[m
-\33[49m       \33[38;2;41;138;65;48;2;75;162;90m▄\33[38;2;33;139;61;48;2;71;164;87m▄\33[38;2;31;144;61;48;2;67;167;85m▄\33[38;2;49;156;73;48;2;81;174;95m▄\33[38;2;62;164;82;48;2;93;179;103m▄\33[38;2;74;170;96;49m▄\33[49m                  \33[38;2;82;173;91;49m▄\33[38;2;61;164;82;48;2;93;180;104m▄\33[38;2;43;152;69;48;2;81;173;95m▄\33[38;2;33;143;62;48;2;68;166;86m▄\33[38;2;35;143;63;48;2;73;167;89m▄\33[38;2;55;141;71;48;2;75;168;87m▄\33[49m         \33[m
-\33[49m       \33[49;38;2;18;121;54m▀\33[38;2;10;126;50;48;2;16;130;53m▄\33[38;2;15;137;54;48;2;26;143;60m▄\33[38;2;33;147;64;48;2;41;150;68m▄\33[38;2;46;157;71;48;2;54;161;77m▄\33[38;2;60;166;81;48;2;74;170;90m▄\33[38;2;81;168;94;49m▄\33[49m                \33[38;2;73;170;89;49m▄\33[38;2;59;165;80;48;2;66;166;82m▄\33[38;2;42;153;68;48;2;53;160;75m▄\33[38;2;34;146;65;48;2;37;147;65m▄\33[38;2;22;139;58;48;2;29;142;62m▄\33[38;2;30;132;58;48;2;27;137;60m▄\33[49;38;2;44;132;62m▀\33[49m         \33[m
-\33[49m        \33[49;38;2;13;114;47m▀\33[38;2;8;126;48;48;2;9;131;52m▄\33[38;2;11;139;55;48;2;23;143;60m▄\33[38;2;32;150;65;48;2;39;152;68m▄\33[38;2;45;159;72;48;2;53;164;77m▄\33[38;2;66;172;87;48;2;67;172;86m▄\33[38;2;98;179;109;48;2;78;177;98m▄▄\33[38;2;119;184;126;49m\33[38;2;124;189;129;48;2;102;170;119m▄\33[38;2;124;188;130;48;2;117;182;124m▄\33[38;2;128;191;132;48;2;118;184;123m▄\33[38;2;130;193;134;48;2;124;188;128m▄\33[38;2;132;196;137;48;2;126;190;129m▄\33[38;2;134;196;137;48;2;124;188;131m▄\33[38;2;133;195;137;48;2;123;187;129m▄\33[38;2;132;194;135;48;2;124;186;128m▄\33[38;2;128;191;132;48;2;122;184;126m▄\33[38;2;127;190;131;48;2;120;182;125m▄\33[38;2;124;185;129;48;2;118;182;118m▄▄▄\33[38;2;88;179;102;48;2;77;166;89m▄\33[38;2;62;171;84;48;2;62;168;83m▄\33[38;2;41;157;70;48;2;48;160;74m▄\33[38;2;34;150;66;48;2;37;150;66m▄\33[38;2;20;141;58;48;2;26;143;61m▄\33[38;2;26;129;59;48;2;24;137;58m▄\33[49;38;2;28;128;57m▀\33[49m          \33[m
-\33[49m         \33[49;38;2;11;117;42m▀\33[38;2;42;139;72;48;2;8;136;53m▄\33[38;2;46;152;75;48;2;23;146;60m▄\33[38;2;73;174;93;48;2;43;159;72m▄\33[38;2;113;191;121;48;2;83;180;100m▄\33[38;2;135;198;138;48;2;114;187;122m▄\33[38;2;144;200;146;48;2;126;192;131m▄\33[38;2;149;201;150;48;2;135;197;138m▄\33[38;2;150;202;152;48;2;141;200;144m▄\33[38;2;151;202;152;48;2;146;202;148m▄\33[38;2;151;202;152;48;2;149;202;151m▄\33[38;2;150;202;152;48;2;151;203;153m▄\33[38;2;149;202;152;48;2;153;203;154m▄\33[38;2;149;202;152;48;2;152;203;153m▄\33[38;2;150;202;152;48;2;151;203;153m▄\33[38;2;151;202;152;48;2;149;202;150m▄\33[38;2;151;202;152;48;2;145;201;147m▄\33[38;2;150;202;152;48;2;140;199;143m▄\33[38;2;147;201;149;48;2;132;195;136m▄\33[38;2;141;199;144;48;2;123;190;129m▄\33[38;2;130;197;135;48;2;107;185;117m▄\33[38;2;101;187;112;48;2;68;174;87m▄\33[38;2;62;168;85;48;2;38;156;69m▄\33[38;2;49;156;76;48;2;25;147;61m▄\33[38;2;52;139;76;48;2;24;139;59m▄\33[49m            \33[m
-\33[49m       \33[38;2;90;150;105;49m▄\33[38;2;97;164;106;49m▄\33[38;2;103;175;110;48;2;96;163;109m▄\33[38;2;112;184;120;48;2;100;169;109m▄\33[38;2;126;192;131;48;2;106;181;114m▄\33[38;2;135;196;139;48;2;121;193;127m▄\33[38;2;139;197;142;48;2;136;198;140m▄\33[38;2;138;197;141;48;2;144;199;146m▄\33[38;2;135;196;139;48;2;146;200;148m▄\33[38;2;131;195;135;48;2;145;200;147m▄\33[38;2;127;194;132;48;2;143;199;145m▄\33[38;2;124;193;129;48;2;140;198;143m▄\33[38;2;121;192;127;48;2;138;198;141m▄\33[38;2;120;191;125;48;2;137;197;140m▄\33[38;2;118;191;124;48;2;136;197;140m▄\33[38;2;118;191;125;48;2;136;197;140m▄\33[38;2;120;191;126;48;2;137;197;140m▄\33[38;2;121;192;127;48;2;138;198;141m▄\33[38;2;124;193;130;48;2;141;199;144m▄\33[38;2;128;193;132;48;2;143;199;145m▄\33[38;2;132;195;136;48;2;145;200;147m▄\33[38;2;136;196;139;48;2;145;199;147m▄\33[38;2;138;196;141;48;2;142;199;144m▄\33[38;2;138;196;142;48;2;133;197;136m▄\33[38;2;133;195;137;48;2;114;190;121m▄\33[38;2;122;191;128;48;2;102;180;111m▄\33[38;2;110;180;117;48;2;100;167;108m▄\33[38;2;101;169;110;48;2;95;160;107m▄\33[38;2;99;165;107;49m▄\33[49m          \33[m
-\33[49m      \33[38;2;97;161;103;48;2;105;165;105m▄\33[38;2;96;171;104;48;2;99;166;106m▄\33[38;2;101;178;110;48;2;99;173;108m▄\33[38;2;113;185;120;48;2;108;182;116m▄\33[38;2;121;188;127;48;2;122;190;128m▄\33[38;2;123;189;128;48;2;130;192;134m▄\33[38;2;120;188;126;48;2;131;193;136m▄\33[38;2;114;187;121;48;2;128;192;133m▄\33[38;2;108;185;116;48;2;123;191;129m▄\33[38;2;102;183;111;48;2;118;189;125m▄\33[38;2;96;181;107;48;2;113;188;121m▄\33[38;2;92;180;103;48;2;109;187;117m▄\33[38;2;89;179;100;48;2;106;186;114m▄\33[38;2;87;178;98;48;2;104;185;112m▄\33[38;2;85;178;97;48;2;102;185;111m▄\33[38;2;84;178;97;48;2;101;185;110m▄\33[38;2;84;178;97;48;2;101;185;111m▄\33[38;2;85;178;97;48;2;102;185;111m▄\33[38;2;87;178;99;48;2;104;185;112m▄\33[38;2;90;180;101;48;2;107;186;114m▄\33[38;2;93;180;104;48;2;111;187;118m▄\33[38;2;98;181;107;48;2;115;188;122m▄\33[38;2;104;183;113;48;2;120;189;126m▄\33[38;2;110;185;118;48;2;125;191;130m▄\33[38;2;116;187;123;48;2;129;192;134m▄\33[38;2;121;189;127;48;2;131;193;136m▄\33[38;2;124;189;129;48;2;129;192;133m▄\33[38;2;120;188;126;48;2;118;188;124m▄\33[38;2;109;184;117;48;2;105;180;113m▄\33[38;2;100;177;109;48;2;99;172;108m▄\33[38;2;96;170;105;48;2;98;165;105m▄\33[38;2;97;162;107;49m▄\33[49m        \33[m
-\33[49m    \33[38;2;93;155;100;49m▄\33[38;2;88;161;99;48;2;94;161;102m▄\33[38;2;87;168;98;48;2;92;167;101m▄\33[38;2;91;174;101;48;2;95;175;104m▄\33[38;2;98;178;107;48;2;104;181;112m▄\33[38;2;103;180;111;48;2;113;184;119m▄\33[38;2;101;178;109;48;2;115;185;121m▄\33[38;2;82;145;89;48;2;112;184;119m▄\33[38;2;55;99;60;48;2;106;182;114m▄\33[38;2;58;109;64;48;2;99;180;108m▄\33[38;2;71;152;82;48;2;92;178;103m▄\33[38;2;73;170;87;48;2;86;177;98m▄\33[38;2;70;169;85;48;2;81;175;94m▄\33[38;2;68;168;83;48;2;78;173;91m▄\33[38;2;66;168;82;48;2;75;173;89m▄\33[38;2;65;168;81;48;2;73;172;88m▄\33[38;2;65;167;81;48;2;72;172;87m▄\33[38;2;64;168;81;48;2;71;172;87m▄\33[38;2;65;167;81;48;2;72;172;87m▄\33[38;2;65;167;81;48;2;72;172;88m▄\33[38;2;65;167;81;48;2;74;172;88m▄\33[38;2;66;167;82;48;2;76;173;90m▄\33[38;2;67;168;83;48;2;78;173;91m▄\33[38;2;69;168;85;48;2;82;174;94m▄\33[38;2;74;170;88;48;2;88;176;99m▄\33[38;2;76;157;87;48;2;94;178;103m▄\33[38;2;70;113;75;48;2;101;180;110m▄\33[38;2;80;128;85;48;2;109;183;116m▄\33[38;2;93;163;101;48;2;113;185;120m▄\33[38;2;101;180;110;48;2;115;185;121m▄\33[38;2;102;180;110;48;2;110;184;118m▄\33[38;2;97;178;106;48;2;102;180;111m▄\33[38;2;90;174;101;48;2;94;173;104m▄\33[38;2;87;168;98;48;2;94;166;103m▄\33[38;2;91;162;99;48;2;99;162;104m▄\33[38;2;89;153;102;49m▄\33[49m      \33[m
-\33[49m   \33[38;2;90;151;99;48;2;91;146;91m▄\33[38;2;80;156;92;48;2;86;156;95m▄\33[38;2;72;162;85;48;2;81;162;92m▄\33[38;2;72;165;86;48;2;78;167;91m▄\33[38;2;74;166;88;48;2;82;170;94m▄\33[38;2;76;167;89;48;2;86;172;97m▄\33[38;2;74;165;88;48;2;87;172;98m▄\33[38;2;43;96;52;48;2;74;144;83m▄\33[38;2;16;22;17;48;2;54;85;58m▄\33[38;2;7;6;7;48;2;22;27;23m▄\33[38;2;1;3;1;48;2;13;23;14m▄\33[38;2;31;100;45;48;2;46;115;57m▄\33[38;2;51;159;72;48;2;61;164;79m▄\33[38;2;52;159;73;48;2;60;163;78m▄\33[38;2;52;159;73;48;2;59;163;77m▄\33[38;2;51;159;72;48;2;58;163;76m▄\33[38;2;50;158;71;48;2;57;162;76m▄\33[38;2;50;158;71;48;2;57;162;75m▄▄▄▄▄\33[38;2;50;158;72;48;2;57;162;76m▄\33[38;2;51;159;72;48;2;58;163;77m▄\33[38;2;52;158;72;48;2;60;162;78m▄\33[38;2;45;140;64;48;2;59;152;75m▄\33[38;2;19;66;30;48;2;44;97;53m▄\33[38;2;0;0;0;48;2;21;25;21m▄\33[38;2;7;6;7;48;2;37;47;38m▄\33[38;2;26;47;29;48;2;65;107;71m▄\33[38;2;58;130;69;48;2;81;163;92m▄\33[38;2;76;168;90;48;2;88;173;99m▄\33[38;2;77;168;90;48;2;86;173;98m▄\33[38;2;75;167;88;48;2;82;171;94m▄\33[38;2;74;166;87;48;2;80;168;92m▄\33[38;2;77;163;89;48;2;84;163;94m▄\33[38;2;86;158;96;48;2;88;156;99m▄\33[38;2;88;149;97;49m▄\33[49m     \33[m
-\33[49m  \33[38;2;85;147;93;49m▄\33[38;2;76;148;86;48;2;83;150;93m▄\33[38;2;60;152;76;48;2;71;156;85m▄\33[38;2;58;156;75;48;2;64;159;80m▄\33[38;2;60;158;77;48;2;66;162;81m▄\33[38;2;60;158;77;48;2;66;162;82m▄\33[38;2;58;158;76;48;2;67;163;82m▄\33[38;2;55;157;74;48;2;63;161;80m▄\33[38;2;39;129;58;48;2;31;85;41m▄\33[38;2;15;74;30;48;2;1;5;2m▄\33[38;2;11;62;26;48;2;5;4;5m▄\33[38;2;25;107;46;48;2;12;31;17m▄\33[38;2;37;143;62;48;2;32;113;50m▄\33[38;2;43;154;67;48;2;47;156;69m▄\33[38;2;44;154;67;48;2;48;157;70m▄\33[38;2;44;154;68;48;2;48;157;69m▄\33[38;2;45;154;68;48;2;47;156;70m▄▄\33[38;2;46;154;69;48;2;47;156;70m▄\33[38;2;46;154;69;48;2;47;157;70m▄\33[38;2;46;154;69;48;2;48;156;70m▄\33[38;2;45;154;68;48;2;47;156;70m▄\33[38;2;44;153;68;48;2;47;156;69m▄\33[38;2;43;153;67;48;2;46;156;69m▄\33[38;2;42;153;66;48;2;46;156;69m▄\33[38;2;42;153;66;48;2;47;156;69m▄\33[38;2;40;152;65;48;2;42;148;65m▄\33[38;2;35;140;61;48;2;29;104;49m▄\33[38;2;23;95;43;48;2;23;27;24m▄\33[38;2;10;57;23;48;2;1;0;1m▄\33[38;2;24;89;39;48;2;13;35;18m▄\33[38;2;49;147;68;48;2;48;125;62m▄\33[38;2;56;159;75;48;2;66;163;82m▄\33[38;2;59;159;77;48;2;68;164;83m▄\33[38;2;62;160;79;48;2;68;164;83m▄\33[38;2;63;160;79;48;2;68;163;83m▄\33[38;2;63;159;79;48;2;69;161;84m▄\33[38;2;68;156;83;48;2;78;157;90m▄\33[38;2;81;151;92;48;2;85;153;95m▄\33[38;2;88;147;98;49m▄\33[49m    \33[m
-\33[49m \33[38;2;85;136;85;49m▄\33[38;2;77;140;88;48;2;81;143;90m▄\33[38;2;57;145;73;48;2;65;146;79m▄\33[38;2;53;149;71;48;2;54;150;72m▄\33[38;2;57;152;74;48;2;56;153;74m▄\33[38;2;61;154;77;48;2;59;155;76m▄\33[38;2;57;153;74;48;2;58;155;75m▄\33[38;2;51;153;71;48;2;53;155;72m▄\33[38;2;45;152;68;48;2;48;154;69m▄\33[38;2;42;151;66;48;2;44;151;66m▄\33[38;2;40;151;65;48;2;36;141;60m▄\33[38;2;38;150;64;48;2;32;137;58m▄\33[38;2;37;150;64;48;2;35;146;62m▄\33[48;2;38;151;65m \33[38;2;38;151;65;48;2;40;152;65m▄\33[38;2;39;151;65;48;2;41;152;66m▄\33[38;2;42;151;66;48;2;41;152;66m▄\33[38;2;45;151;67;48;2;43;152;67m▄\33[38;2;46;152;68;48;2;45;153;68m▄\33[38;2;48;153;69;48;2;46;153;68m▄\33[38;2;49;153;70;48;2;47;153;69m▄▄\33[38;2;47;153;69;48;2;45;153;68m▄\33[38;2;45;151;68;48;2;44;152;67m▄\33[38;2;43;151;66;48;2;42;152;66m▄\33[38;2;39;150;65;48;2;40;151;65m▄\33[38;2;38;150;64;48;2;39;151;65m▄\33[38;2;36;150;64;48;2;38;151;65m▄\33[38;2;36;150;64;48;2;37;149;64m▄\33[38;2;36;149;63;48;2;33;143;60m▄\33[38;2;37;150;64;48;2;32;135;57m▄\33[38;2;40;151;65;48;2;38;143;62m▄\33[38;2;43;152;67;48;2;46;153;69m▄\33[38;2;47;153;69;48;2;50;155;71m▄\33[38;2;52;154;72;48;2;54;156;73m▄\33[38;2;59;156;76;48;2;60;157;77m▄\33[38;2;64;157;80;48;2;63;158;79m▄\33[38;2;63;155;79;48;2;62;157;78m▄\33[38;2;61;153;77;48;2;63;154;78m▄\33[38;2;70;149;83;48;2;77;149;88m▄\33[38;2;77;145;89;48;2;83;147;93m▄\33[49m    \33[m
-\33[49m \33[38;2;78;133;83;48;2;71;133;82m▄\33[38;2;67;137;78;48;2;74;138;84m▄\33[38;2;48;142;67;48;2;52;143;70m▄\33[38;2;53;147;71;48;2;53;148;71m▄\33[38;2;63;151;78;48;2;60;152;76m▄\33[38;2;64;152;79;48;2;62;154;77m▄\33[38;2;55;151;73;48;2;56;153;74m▄\33[38;2;46;149;68;48;2;49;151;69m▄\33[38;2;41;149;65;48;2;43;150;66m▄\33[38;2;38;149;64;48;2;40;150;65m▄\33[38;2;36;149;63;48;2;38;150;64m▄\33[38;2;35;149;63;48;2;37;150;64m▄▄\33[38;2;36;149;64;48;2;37;150;64m▄\33[38;2;38;150;64;48;2;38;150;65m▄\33[38;2;41;150;65;48;2;40;151;65m▄\33[38;2;44;151;67;48;2;43;151;66m▄\33[38;2;49;152;70;48;2;47;151;69m▄\33[38;2;52;152;72;48;2;49;152;70m▄\33[38;2;56;153;74;48;2;51;153;71m▄\33[38;2;58;154;75;48;2;53;153;72m▄\33[38;2;57;154;74;48;2;52;153;72m▄\33[38;2;54;153;73;48;2;49;153;70m▄\33[38;2;51;152;71;48;2;48;152;69m▄\33[38;2;47;151;69;48;2;45;150;67m▄\33[38;2;42;149;66;48;2;41;150;65m▄\33[38;2;38;149;64;48;2;37;150;64m▄\33[38;2;36;149;63;48;2;36;150;64m▄\33[38;2;34;149;63;48;2;36;150;64m▄▄▄\33[38;2;36;149;63;48;2;38;150;64m▄\33[38;2;39;149;64;48;2;41;151;66m▄\33[38;2;43;150;67;48;2;45;152;68m▄\33[38;2;49;152;70;48;2;51;153;71m▄\33[38;2;60;154;76;48;2;60;155;76m▄\33[38;2;69;156;83;48;2;66;157;81m▄\33[38;2;71;156;84;48;2;67;156;81m▄\33[38;2;64;152;79;48;2;62;153;77m▄\33[38;2;61;147;76;48;2;65;149;78m▄\33[38;2;75;144;85;48;2;78;147;86m▄\33[38;2;85;142;85;48;2;80;143;80m▄\33[49m   \33[m
-\33[49m \33[49;38;2;75;131;85m▀\33[49;38;2;58;134;72m▀\33[49;38;2;45;140;66m▀\33[49;38;2;55;146;72m▀\33[49;38;2;66;151;80m▀\33[49;38;2;64;152;79m▀\33[49;38;2;55;151;73m▀\33[49;38;2;45;149;67m▀\33[49;38;2;38;148;64m▀\33[49;38;2;36;148;62m▀\33[49;38;2;34;148;62m▀\33[49;38;2;33;149;62m▀\33[49;38;2;34;149;62m▀\33[49;38;2;35;149;63m▀\33[49;38;2;38;150;64m▀\33[49;38;2;41;150;65m▀\33[49;38;2;47;151;68m▀\33[49;38;2;53;153;72m▀\33[49;38;2;57;154;74m▀\33[49;38;2;61;155;77m▀\33[49;38;2;64;156;79m▀\33[49;38;2;63;156;79m▀\33[49;38;2;60;155;76m▀\33[49;38;2;56;153;73m▀\33[49;38;2;50;152;71m▀\33[49;38;2;43;150;66m▀\33[49;38;2;38;149;64m▀\33[49;38;2;35;148;63m▀\33[49;38;2;33;148;62m▀\33[49;38;2;32;148;62m▀▀\33[49;38;2;34;148;62m▀\33[49;38;2;37;149;63m▀\33[49;38;2;41;149;65m▀\33[49;38;2;48;151;69m▀\33[49;38;2;59;153;76m▀\33[49;38;2;70;156;83m▀\33[49;38;2;73;156;86m▀\33[49;38;2;66;152;80m▀\33[49;38;2;59;146;74m▀\33[49;38;2;73;141;83m▀\33[49;38;2;76;138;83m▀\33[49m   \33[m
-"""
-}
-
-
-# Checks for logo object in json file
-try:
-    custom_logo_path = jsload(open(CONFIG_PATH, encoding="utf-8"))["logo"]
-except Exception:
-    custom_logo_path = None
-
-if custom_logo_path:
-    try:
-        custom_logo = {
-            # Combine all lines of the 'art' list into a single string and attach to the name object.
-            # Replace '\33' with '\033' to correctly format ANSI color codes for terminal output.
-            name: "\n".join([line.replace('\\33', '\033') for line in art])
-            # Iterate through the custom_logo_path dictionary to extract 'name' as key and 'art' as value.
-            for name, art in custom_logo_path.items()
-        }
-        
-        # Iterate through the custom_logo dictionary to extract (name, art) and add it to the logo_list
-        for name, art in custom_logo.items():
-            if not art:
-                raise ValueError("'logo' art cannot be empty")
-            logo_list[name] = art
-    except ValueError as err:
-        console.print(f"{err} at: {CONFIG_PATH}")
-        exit(1)
-    except Exception:
-        console.print(f"'logo' not configured properly at {CONFIG_PATH}")
-        exit(1)
+console = Lazy(lambda: lazy_module("rich.console").Console())
+
+# The built-in logo arts, one file each, only the one shown is ever read
+LOGO_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "logos")
+
+# The built-in logos, in the order they are listed
+BUILTIN_LOGOS = ["pacman", "linux", "windows", "macos", "android"]
+
+class LogoAsset:
+    """
+    A logo art along with its metrics, measured once when the logo is loaded.
+
+    Attributes:
+    name (str): The logo name.
+    art (str): The art, with its ANSI codes or rich markup.
+    text (str): The art stripped of its codes and markup, as it appears on screen.
+    lines (list): The lines of the art, without the blank lines at its end.
+    width (int): The width of the longest line, in cells.
+    height (int): The number of lines.
+    """
+
+    def __init__(self, name:str, art:str):
+        self.name = name
+        self.art = art
+        self.text = measure(art).plain
+
+        lines = art.splitlines()
+        # Display widths in cells, the codes and markup of each line left out
+        widths = [measure(line).width for line in lines]
+
+        # Blank lines at the end of the art are not part of the logo
+        while widths and not widths[-1]:
+            widths.pop()
+
+        self.lines = lines[:len(widths)]
+        self.height = len(widths)
+        # The longest line, not the last one in alphabetical order
+        self.width = max(widths, default=0)
+
+# Checks for logo object in json file, the arts are already joined and validated by load_config
+config_file = load_config(CONFIG_PATH)
+
+if "logo" in config_file.errors:
+    console.print(f"{config_file.errors['logo']} at: {CONFIG_PATH}")
+    exit(1)
+
+# name: the art of a custom logo, or None for a built-in one, read from its file on first use
+logo_list = {name: None for name in BUILTIN_LOGOS}
+
+# Iterate through the custom logos to extract (name, art) and add it to the logo_list
+for name, art in (config_file.logo or {}).items():
+    logo_list[name] = art
+
+# (name, colored): the loaded LogoAsset
+assets = {}
 
 class Logo:
     @staticmethod
     def list() -> list:
-        # Iterate through the logo_list to construct a list of only name key
+        # Only the names, listing the logos doesn't load any of them
         return [name for name in logo_list]
 
     @staticmethod
-    def select(logo_name:str) -> str:
-        logo = logo_list[logo_name]
-        if isinstance(logo, list):
-            logo = "\n".join(logo)
+    def asset(logo_name:str, colors:dict = None) -> LogoAsset:
+        """
+        Loads a logo and measures it, once per run.
+
+        Args:
+        logo_name (str): The logo name, as listed by `Logo.list`.
+        colors (dict): The color codes filled in the "{color}" fields of the art, if any.
+
+        Returns:
+        LogoAsset: The logo art and its metrics.
+        """
+        key = (logo_name, bool(colors))
+
+        if key not in assets:
+            art = logo_list[logo_name]
+
+            if art is None:
+                with open(os.path.join(LOGO_DIR, f"{logo_name}.txt"), encoding="utf-8") as f:
+                    art = f.read()
 
-        return logo
\ No newline at end of file
+            if colors:
+                try:
+                    art = art.format(**colors)
+                except Exception:
+                    # Braces in the art that aren't color fields
+                    pass
+
+            assets[key] = LogoAsset(logo_name, art)
+
+        return assets[key]
+
+    @staticmethod
+    def select(logo_name:str) -> str:
+        return Logo.asset(logo_name).art
@@ -0,0 +1,185 @@
+import os, sys, signal, tempfile
+from .daemon import collect
+from .network import family, parse_endpoint
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Content types of the two text formats, the body is valid in both
+OPENMETRICS_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+PROMETHEUS_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Served on the loopback interface unless another address is given
+DEFAULT_HOST = "127.0.0.1"
+
+def value(key:str):
+    # The value under `key` of a reading, as a single sample without labels
+    return lambda reading: [({}, reading[key])] if reading.get(key) is not None else []
+
+def mounts(key:str):
+    # The value under `key` of each mount of the disk reading that answered, labeled with its mount point
+    return lambda reading: [({"mount": mount["mount"]}, mount[key]) for mount in reading["mounts"] if not mount["stale"]]
+
+# Each metric family: (name, unit, description, the probe it is read from,
+# function returning the (labels, value) samples of the probe reading)
+METRICS = [
+    ("twidgets_internet_up", None, "Whether one of the connectivity endpoints answered.", "internet", lambda online: [({}, int(bool(online)))]),
+    ("twidgets_packages", None, "Number of installed packages.", "package", lambda reading: [({"manager": reading["manager"]}, reading["count"])]),
+    ("twidgets_cpu_frequency_hertz", "hertz", "Advertised frequency of the CPU.", "cpu", value("frequency")),
+    ("twidgets_cpu_usage_percent", "percent", "Busy time of all the cores since the previous reading.", "usage", value("percent")),
+    ("twidgets_cpu_core_usage_percent", "percent", "Busy time of each core since the previous reading.", "usage", lambda reading: [({"core": core}, percent) for core, percent in enumerate(reading["cores"])]),
+    ("twidgets_cpu_current_frequency_hertz", "hertz", "Current frequency of the CPU, averaged over its cores.", "usage", value("frequency")),
+    ("twidgets_load1", None, "Load average over 1 minute.", "usage", lambda reading: [({}, reading["load"][0])] if reading["load"] else []),
+    ("twidgets_load5", None, "Load average over 5 minutes.", "usage", lambda reading: [({}, reading["load"][1])] if reading["load"] else []),
+    ("twidgets_load15", None, "Load average over 15 minutes.", "usage", lambda reading: [({}, reading["load"][2])] if reading["load"] else []),
+    ("twidgets_memory_used_bytes", "bytes", "Memory in use.", "ram", value("used")),
+    ("twidgets_memory_total_bytes", "bytes", "Total memory.", "ram", value("total")),
+    ("twidgets_disk_free_bytes", "bytes", "Free space of each mounted disk.", "disk", mounts("free")),
+    ("twidgets_disk_total_bytes", "bytes", "Total space of each mounted disk.", "disk", mounts("total")),
+    ("twidgets_disk_stale", None, "Whether the mount didn't answer in time.", "disk", lambda reading: [({"mount": mount["mount"]}, int(mount["stale"])) for mount in reading["mounts"]]),
+    ("twidgets_battery_percent", "percent", "Charge of the battery.", "battery", value("percent")),
+    ("twidgets_battery_plugged", None, "Whether the power is plugged in.", "battery", lambda reading: [({}, int(reading["plugged"]))]),
+    ("twidgets_uptime_seconds", "seconds", "Time since the system booted.", "uptime", value("seconds")),
+    ("twidgets_weather_temperature_celsius", "celsius", "Temperature at the weather location.", "weather", lambda reading: [({"type": reading["type"]}, reading["temp"])])
+]
+
+def escape(label:str) -> str:
+    # Backslashes, double quotes and line feeds are escaped in label values
+    return str(label).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+def render(readings:dict) -> str:
+    """
+    Renders the raw readings of the probes as metrics, in the OpenMetrics text format.
+
+    The metrics of a probe without a reading (not run yet, disabled or
+    unavailable) are left out.
+
+    Args:
+    readings (dict): The latest reading of each probe, by probe name.
+
+    Returns:
+    str: The metrics, ending with the "# EOF" line.
+    """
+    lines = []
+
+    for name, unit, description, probe, samples in METRICS:
+        reading = readings.get(probe)
+
+        if reading is None:
+            continue
+
+        try:
+            samples = samples(reading)
+        except (KeyError, TypeError, ValueError):
+            # A reading without the expected values
+            continue
+
+        if not samples:
+            continue
+
+        lines.append(f"# TYPE {name} gauge")
+        if unit:
+            lines.append(f"# UNIT {name} {unit}")
+        lines.append(f"# HELP {name} {description}")
+
+        for labels, sample in samples:
+            labels = ",".join(f'{label}="{escape(text)}"' for label, text in labels.items())
+            lines.append(f"{name}{{{labels}}} {sample}" if labels else f"{name} {sample}")
+
+    lines.append("# EOF")
+    return "\n".join(lines) + "\n"
+
+def parse_address(address:str) -> tuple:
+    """
+    Parses the address to serve the metrics at: "port", ":port" or "address:port",
+    IPv6 addresses written as "[address]:port".
+
+    Returns:
+    tuple: The (host, port) pair.
+
+    Raises:
+    ValueError: The address is not an IP address and a port.
+    """
+    if ":" not in address:
+        address = f":{address}"
+
+    if address.startswith(":"):
+        address = DEFAULT_HOST + address
+
+    try:
+        host, port = parse_endpoint(address)
+    except OSError:
+        raise ValueError(address)
+
+    if not 0 < port < 65536:
+        raise ValueError(address)
+
+    return host, port
+
+def write_textfile(path:str, text:str) -> None:
+    """
+    Writes the metrics to `path` atomically, so a collector reading the
+    file (like node-exporter's textfile collector) never sees it half written.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    # Written next to the file, renaming only is atomic within a file system
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".twidgets.", suffix=".tmp")
+
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+class MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split("?")[0] not in ("/", "/metrics"):
+            self.send_error(404)
+            return
+
+        body = self.server.metrics().encode()
+        # OpenMetrics when the scraper asks for it, the Prometheus text format otherwise
+        openmetrics = "application/openmetrics-text" in self.headers.get("Accept", "")
+
+        self.send_response(200)
+        self.send_header("Content-Type", OPENMETRICS_TYPE if openmetrics else PROMETHEUS_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # Scrapes are not logged
+        pass
+
+def serve(address:tuple, probes:dict) -> None:
+    """
+    Serves the metrics over HTTP until interrupted. Every probe is refreshed
+    on its own interval in the background, a scrape only renders the latest readings.
+
+    Args:
+    address (tuple): The (host, port) to listen on.
+    probes (dict): Probe name mapped to a (function, default value, interval in seconds) tuple.
+    """
+    values, lock = collect(probes)
+
+    def metrics():
+        with lock:
+            return render(values)
+
+    host, port = address
+    server_class = type("MetricsServer", (ThreadingHTTPServer,), {"address_family": family(host)})
+    server = server_class((host, port), MetricsHandler)
+    server.daemon_threads = True
+    server.metrics = metrics
+
+    # Shut down cleanly when stopped by a service manager or kill
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
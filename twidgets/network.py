@@ -0,0 +1,162 @@
+import errno, socket, selectors
+from time import time, perf_counter
+from .cache import load, store
+
+# Well-known anycast resolvers, reachable by IP address so no DNS lookup is needed
+DEFAULT_ENDPOINTS = [["1.1.1.1", 443], ["8.8.8.8", 53], ["9.9.9.9", 443], ["2606:4700:4700::1111", 443]]
+
+# Seconds to wait for any endpoint to accept a connection
+DEFAULT_TIMEOUT = 1
+
+# Seconds a verdict is reused by the next runs
+DEFAULT_TTL = 10
+
+# connect() results meaning the connection is still being established
+IN_PROGRESS = {0, errno.EINPROGRESS, errno.EWOULDBLOCK, getattr(errno, "WSAEWOULDBLOCK", errno.EWOULDBLOCK)}
+
+class Connectivity:
+    """
+    The verdict of a connectivity check.
+
+    Attributes:
+    online (bool): Whether an endpoint accepted a connection.
+    endpoint (list): The [host, port] that answered first, if online.
+    latency (float): Seconds the first connection took, if online.
+    reason (str): Why the check failed ("no route", "refused", "timeout"), if offline.
+    checked (float): When the check ran, as a Unix timestamp.
+    """
+
+    def __init__(self, online:bool, endpoint:list = None, latency:float = None, reason:str = None, checked:float = None):
+        self.online = online
+        self.endpoint = endpoint
+        self.latency = latency
+        self.reason = reason
+        self.checked = checked if checked is not None else time()
+
+    def __bool__(self):
+        return self.online
+
+    def __repr__(self):
+        return f"Connectivity(online={self.online}, endpoint={self.endpoint}, latency={self.latency}, reason={self.reason})"
+
+    def as_dict(self) -> dict:
+        return {"online": self.online, "endpoint": self.endpoint, "latency": self.latency, "reason": self.reason, "checked": self.checked}
+
+def parse_endpoint(endpoint:str) -> list:
+    """
+    Parses an "address:port" endpoint, IPv6 addresses written as "[address]:port".
+
+    Returns:
+    list: The [host, port] pair.
+
+    Raises:
+    ValueError: The endpoint is not an IP address and a port.
+    """
+    host, _, port = endpoint.rpartition(":")
+    host = host.strip("[]")
+
+    # Only IP addresses, resolving a host name could block for longer than the whole check
+    socket.inet_pton(socket.AF_INET6 if ":" in host else socket.AF_INET, host)
+    return [host, int(port)]
+
+def family(host:str):
+    return socket.AF_INET6 if ":" in host else socket.AF_INET
+
+def has_route(endpoints:list) -> bool:
+    """
+    Checks whether the system has a route to any of the endpoints.
+
+    Connecting a UDP socket only looks up the route, no packet is sent, so
+    a machine without a network interface up is known to be offline at once.
+    """
+    for host, port in endpoints:
+        try:
+            with socket.socket(family(host), socket.SOCK_DGRAM) as sock:
+                sock.connect((host, port))
+            return True
+        except OSError:
+            continue
+    return False
+
+def race(endpoints:list, timeout:float) -> Connectivity:
+    """
+    Starts a non-blocking TCP connection to every endpoint at once and
+    returns as soon as the first one is established.
+    """
+    start = perf_counter()
+    deadline = start + timeout
+    selector = selectors.DefaultSelector()
+
+    try:
+        for host, port in endpoints:
+            try:
+                sock = socket.socket(family(host), socket.SOCK_STREAM)
+            except OSError:
+                # The address family isn't supported (e.g. IPv6 disabled)
+                continue
+
+            try:
+                sock.setblocking(False)
+                in_progress = sock.connect_ex((host, port)) in IN_PROGRESS
+            except OSError:
+                in_progress = False
+
+            if in_progress:
+                selector.register(sock, selectors.EVENT_WRITE, [host, port])
+            else:
+                # Unreachable right away (e.g. no IPv6 route)
+                sock.close()
+
+        while selector.get_map():
+            remaining = deadline - perf_counter()
+            if remaining <= 0:
+                return Connectivity(False, reason="timeout")
+
+            for key, _ in selector.select(remaining):
+                error = key.fileobj.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+                selector.unregister(key.fileobj)
+                key.fileobj.close()
+
+                if not error:
+                    return Connectivity(True, endpoint=key.data, latency=perf_counter() - start)
+
+        # Every endpoint refused or failed before the deadline
+        return Connectivity(False, reason="refused")
+    finally:
+        for key in list(selector.get_map().values()):
+            key.fileobj.close()
+        selector.close()
+
+def check_connectivity(endpoints:list = None, timeout:float = DEFAULT_TIMEOUT, ttl:float = DEFAULT_TTL, refresh:bool = False) -> Connectivity:
+    """
+    Checks whether the internet is reachable, within `timeout` seconds at most.
+
+    The route check and the TCP connections need no DNS, TLS or HTTP round trip.
+    The verdict is cached for `ttl` seconds, so runs close together share it.
+
+    Args:
+    endpoints (list): The [host, port] pairs to try, any one answering means online.
+    timeout (float): Seconds to wait for an endpoint to answer.
+    ttl (float): Seconds the verdict is cached, 0 to disable caching.
+    refresh (bool): Ignore the cached verdict.
+
+    Returns:
+    Connectivity: The verdict.
+    """
+    endpoints = endpoints or DEFAULT_ENDPOINTS
+
+    if ttl and not refresh:
+        cached = load("internet")
+        # Only reuse a verdict about the same endpoints
+        if cached and cached.get("endpoints") == endpoints and 0 <= time() - cached["result"]["checked"] < ttl:
+            return Connectivity(**cached["result"])
+
+    if has_route(endpoints):
+        result = race(endpoints, timeout)
+    else:
+        result = Connectivity(False, reason="no route")
+
+    if ttl:
+        store("internet", {"endpoints": endpoints, "result": result.as_dict()})
+
+    return result
@@ -0,0 +1,176 @@
+import os, sqlite3, subprocess
+from .cache import remember
+
+def count_occurrences(path:str, needle:bytes, chunk_size:int = 1 << 16) -> int:
+    """
+    Counts the occurrences of `needle` in a file, streaming it in chunks
+    so large package databases are never loaded into memory at once.
+    """
+    count = 0
+    # A leading newline lets a needle anchored with "\n" match the very first line
+    tail = b"\n"
+
+    with open(path, "rb") as f:
+        while chunk := f.read(chunk_size):
+            data = tail + chunk
+            count += data.count(needle)
+            # Keep enough bytes to catch a match split across two chunks
+            tail = data[-(len(needle) - 1):]
+
+    return count
+
+def count_dirs(path:str) -> int:
+    # Each installed package is a directory in the database
+    with os.scandir(path) as entries:
+        return sum(1 for entry in entries if entry.is_dir())
+
+def count_sqlite(path:str, query:str) -> int:
+    # Open read-only, the database is owned by the package manager
+    connection = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+    try:
+        return connection.execute(query).fetchone()[0]
+    finally:
+        connection.close()
+
+def count_dpkg(path:str) -> int:
+    # Matches `dpkg -l | grep '^ii'`, packages wanted and installed
+    return count_occurrences(path, b"\nStatus: install ok installed\n")
+
+def count_rpm(path:str) -> int:
+    if path.endswith(".sqlite"):
+        return count_sqlite(path, "SELECT COUNT(*) FROM Packages")
+
+    # Berkeley DB databases can't be read natively, ask rpm itself (no shell, no repos)
+    output = subprocess.run(["rpm", "-qa"], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, check=True).stdout
+    return len(output.splitlines())
+
+def count_apk(path:str) -> int:
+    # Every package record starts with its name line "P:<name>"
+    return count_occurrences(path, b"\nP:")
+
+def count_xbps(path:str) -> int:
+    # Every package dictionary holds exactly one pkgver key
+    return count_occurrences(path, b"<key>pkgver</key>")
+
+def count_freebsd(path:str) -> int:
+    return count_sqlite(path, "SELECT COUNT(*) FROM packages")
+
+def count_brew(path:str) -> int:
+    # Formulae live in Cellar and casks in Caskroom, like `brew list`
+    return sum(count_dirs(os.path.join(path, name)) for name in ["Cellar", "Caskroom"] if os.path.isdir(os.path.join(path, name)))
+
+def count_windows(path:str) -> int:
+    import winreg, re
+
+    count = 0
+    with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, path) as key:
+        for index in range(winreg.QueryInfoKey(key)[0]):
+            try:
+                with winreg.OpenKey(key, winreg.EnumKey(key, index)) as program:
+                    name = winreg.QueryValueEx(program, "DisplayName")[0]
+            except OSError:
+                # Entries without a display name are not shown as installed programs
+                continue
+
+            # Skip Windows updates (KB...), like the Control Panel does
+            if name and not re.match(r"^KB[0-9]", name):
+                count += 1
+    return count
+
+def databases(system:str) -> list:
+    """
+    Returns the package databases to look for on the given system,
+    as (manager, path, counter) tuples in order of preference.
+    """
+    if system == "windows":
+        return [("exe", r"Software\Microsoft\Windows\CurrentVersion\Uninstall", count_windows)]
+
+    if system == "android":
+        # Termux keeps its dpkg database under its own prefix
+        prefix = os.environ.get("PREFIX", "/data/data/com.termux/files/usr")
+        return [("apt", os.path.join(prefix, "var/lib/dpkg/status"), count_dpkg)]
+
+    if system == "freebsd":
+        return [("pkg", "/var/db/pkg/local.sqlite", count_freebsd)]
+
+    if system in ["openbsd", "netbsd"]:
+        return [("pkg", "/var/db/pkg", count_dirs)]
+
+    if system == "macos":
+        return [
+            ("brew", os.environ.get("HOMEBREW_PREFIX", "/opt/homebrew"), count_brew),
+            ("brew", "/usr/local", count_brew)
+        ]
+
+    return [
+        ("apt", "/var/lib/dpkg/status", count_dpkg),
+        ("pacman", "/var/lib/pacman/local", count_dirs),
+        ("rpm", "/usr/lib/sysimage/rpm/rpmdb.sqlite", count_rpm),
+        ("rpm", "/var/lib/rpm/rpmdb.sqlite", count_rpm),
+        ("rpm", "/var/lib/rpm/Packages", count_rpm),
+        ("apk", "/lib/apk/db/installed", count_apk),
+        ("xbps", "/var/db/xbps/pkgdb-0.38.plist", count_xbps),
+        ("brew", "/home/linuxbrew/.linuxbrew", count_brew)
+    ]
+
+def database_stamp(manager:str, path:str):
+    """
+    Returns a value that changes whenever the package database changes,
+    or None if the database does not exist.
+    """
+    if manager == "exe":
+        import winreg
+
+        # The Uninstall key's last write time changes when programs are added or removed
+        with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, path) as key:
+            return winreg.QueryInfoKey(key)[2]
+
+    if manager == "brew":
+        paths = [os.path.join(path, name) for name in ["Cellar", "Caskroom"]]
+    else:
+        paths = [path]
+
+    stamp = []
+    for item in paths:
+        try:
+            stat = os.stat(item)
+            stamp.append([stat.st_mtime_ns, stat.st_size])
+        except OSError:
+            stamp.append(None)
+
+    return stamp if any(stamp) else None
+
+def count_packages(system:str, refresh:bool = False):
+    """
+    Counts the installed packages by reading the package manager's database directly.
+
+    The count is cached along with the database's modification time, so the
+    database is only read again after packages are installed or removed.
+
+    Args:
+    system (str): The current system, as in `twidgets.system`.
+    refresh (bool): Ignore the cached count.
+
+    Returns:
+    tuple or None: The package count and the package manager name, or None if
+    no known package database is found.
+    """
+    for manager, path, counter in databases(system):
+        try:
+            stamp = database_stamp(manager, path)
+        except Exception:
+            stamp = None
+
+        if not stamp:
+            # Database not present, try the next package manager
+            continue
+
+        try:
+            # Recount only when the database changed since the cached count
+            count = remember("packages", [manager, path, stamp], lambda: counter(path), refresh=refresh)
+        except Exception:
+            continue
+
+        return count, manager
+
+    return None
@@ -6,3 +6,8 @@ HOME = os.path.expanduser("~")
 # Construct the path to the configuration file within the user's home directory
 CONFIG_PATH = os.path.join(HOME, ".twidgets.json")
 
+# Construct the path to the cache directory, next to the configuration file
+CACHE_DIR = os.path.join(HOME, ".twidgets.cache")
+
+# Construct the path to the collector daemon socket within the cache directory
+SOCKET_PATH = os.path.join(CACHE_DIR, "daemon.sock")
@@ -0,0 +1,108 @@
+import os
+
+# Readers of the kernel interfaces of Linux and Android, used before psutil.
+# Each file is read once as bytes and parsed in a single pass, the readers
+# raise OSError where the file (or the system call) isn't available.
+
+MEMINFO_PATH = "/proc/meminfo"
+UPTIME_PATH = "/proc/uptime"
+LOADAVG_PATH = "/proc/loadavg"
+POWER_SUPPLY_DIR = "/sys/class/power_supply"
+
+def read(path:str) -> bytes:
+    # The whole file at once, /proc files are generated on each read
+    with open(path, "rb") as f:
+        return f.read()
+
+def meminfo(*fields:str) -> dict:
+    """
+    Reads fields of /proc/meminfo, stopping once all of them are found.
+
+    Args:
+    fields (str): The field names, as in the file (e.g. "MemTotal").
+
+    Returns:
+    dict: The value of each field found, in bytes.
+    """
+    wanted = {field.encode(): field for field in fields}
+    values = {}
+
+    for line in read(MEMINFO_PATH).splitlines():
+        name, _, value = line.partition(b":")
+        field = wanted.get(name)
+
+        if field is None:
+            continue
+
+        # "MemTotal:       16314460 kB", the size is in kibibytes
+        values[field] = int(value.split()[0]) * 1024
+
+        if len(values) == len(wanted):
+            break
+
+    return values
+
+def memory() -> dict:
+    """
+    Reads the memory in use, what can't be made available without swapping.
+
+    Returns:
+    dict: The "used" and "total" memory in bytes.
+
+    Raises:
+    OSError: /proc/meminfo isn't available.
+    """
+    values = meminfo("MemTotal", "MemAvailable", "MemFree", "Buffers", "Cached")
+    total = values["MemTotal"]
+
+    # Kernels before 3.14 don't report the available memory
+    available = values.get("MemAvailable")
+    if available is None:
+        available = values.get("MemFree", 0) + values.get("Buffers", 0) + values.get("Cached", 0)
+
+    return {"used": total - available, "total": total}
+
+def uptime() -> float:
+    # The seconds since boot, the first of the two values in /proc/uptime
+    return float(read(UPTIME_PATH).split(None, 1)[0])
+
+def loadavg() -> list:
+    # The 1, 5 and 15 minutes load averages, the first three values in /proc/loadavg
+    return [float(value) for value in read(LOADAVG_PATH).split(None, 3)[:3]]
+
+def batteries() -> list:
+    """
+    Lists the batteries among the power supplies.
+
+    Returns:
+    list: The names of the batteries (e.g. "BAT0"), empty on desktops and servers.
+
+    Raises:
+    OSError: /sys/class/power_supply isn't available.
+    """
+    names = []
+
+    for name in os.listdir(POWER_SUPPLY_DIR):
+        try:
+            if read(os.path.join(POWER_SUPPLY_DIR, name, "type")).strip() == b"Battery":
+                names.append(name)
+        except OSError:
+            continue
+
+    return names
+
+def disk_usage(path:str) -> dict:
+    """
+    Reads the space of the file system holding `path`, as df reports it.
+
+    Returns:
+    dict: The "free" space (available to unprivileged users) and "total" space in bytes.
+
+    Raises:
+    OSError: The path doesn't exist, or statvfs isn't available (Windows).
+    """
+    if not hasattr(os, "statvfs"):
+        raise OSError("statvfs is not available")
+
+    stats = os.statvfs(path)
+    return {"free": stats.f_bavail * stats.f_frsize, "total": stats.f_blocks * stats.f_frsize}
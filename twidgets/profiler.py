@@ -0,0 +1,123 @@
+import sys, json, threading
+from time import perf_counter
+from functools import partial
+from collections import deque
+from contextlib import contextmanager, nullcontext
+
+# Records kept for the report, the oldest ones are dropped in long running
+# modes (watch, daemon) while the totals of each phase keep counting
+MAX_RECORDS = 1000
+
+class Profiler:
+    """
+    Records the wall time of each phase of a run, and for tasks run in a
+    thread pool how long they waited in its queue before starting.
+
+    Recording only happens with `--profile`, it is on until the arguments
+    are parsed so the configuration loading is timed too, then turned off
+    (and the records dropped) without the flag.
+    """
+
+    def __init__(self):
+        # Every time is relative to the import of this module, early in the startup
+        self.origin = perf_counter()
+        self.enabled = True
+        self.lock = threading.Lock()
+        self.records = deque(maxlen=MAX_RECORDS)
+        # name: [count, total_ms, max_ms] of every record, dropped or not
+        self.totals = {}
+
+    def enable(self, enabled:bool) -> None:
+        self.enabled = enabled
+
+        if not enabled:
+            with self.lock:
+                self.records.clear()
+                self.totals.clear()
+
+    def record(self, name:str, start:float, end:float, queued:float = None) -> None:
+        if not self.enabled:
+            return
+
+        wall = (end - start) * 1000
+
+        with self.lock:
+            self.records.append({
+                "name": name,
+                "thread": threading.current_thread().name,
+                "start_ms": (start - self.origin) * 1000,
+                "queue_ms": (start - queued) * 1000 if queued is not None else None,
+                "wall_ms": wall
+            })
+
+            totals = self.totals.setdefault(name, [0, 0.0, 0.0])
+            totals[0] += 1
+            totals[1] += wall
+            totals[2] = max(totals[2], wall)
+
+    def phase(self, name:str):
+        """
+        Times the enclosed block as the phase `name`, a no-op context when not recording.
+        """
+        if not self.enabled:
+            return nullcontext()
+        return self.timed(name)
+
+    @contextmanager
+    def timed(self, name:str):
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, start, perf_counter())
+
+    def task(self, name:str, func, *args):
+        """
+        Wraps `func(*args)` to be submitted to a thread pool, timing both
+        its run and the delay between now (submission) and its start.
+        """
+        if not self.enabled:
+            return partial(func, *args)
+
+        queued = perf_counter()
+
+        def run():
+            start = perf_counter()
+            try:
+                return func(*args)
+            finally:
+                self.record(name, start, perf_counter(), queued)
+
+        return run
+
+    def report(self, form:str = "text", stream=None) -> None:
+        """
+        Prints the recorded timings, ordered by start time, as a table or as JSON,
+        followed by the totals of the phases recorded more than once.
+        """
+        stream = stream or sys.stderr
+
+        with self.lock:
+            records = sorted(self.records, key=lambda record: record["start_ms"])
+            totals = {name: list(values) for name, values in self.totals.items() if values[0] > 1}
+
+        total = (perf_counter() - self.origin) * 1000
+
+        if form == "json":
+            phases = {name: {"count": count, "total_ms": wall, "max_ms": longest} for name, (count, wall, longest) in totals.items()}
+            stream.write(json.dumps({"total_ms": total, "records": records, "phases": phases}) + "\n")
+            return
+
+        stream.write(f"{'phase':<28} {'start':>9} {'queue':>9} {'wall':>9}  (ms)\n")
+        for record in records:
+            queue = f"{record['queue_ms']:9.1f}" if record["queue_ms"] is not None else f"{'':>9}"
+            stream.write(f"{record['name']:<28} {record['start_ms']:9.1f} {queue} {record['wall_ms']:9.1f}\n")
+        stream.write(f"{'total':<28} {'':>9} {'':>9} {total:9.1f}\n")
+
+        if totals:
+            stream.write(f"\n{'repeated phase':<28} {'count':>9} {'max':>9} {'total':>9}  (ms)\n")
+            for name, (count, wall, longest) in totals.items():
+                stream.write(f"{name:<28} {count:9d} {longest:9.1f} {wall:9.1f}\n")
+        stream.flush()
+
+profiler = Profiler()
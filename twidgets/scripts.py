@@ -0,0 +1,172 @@
+import os, sys, atexit, marshal, hashlib, tempfile, threading
+from io import StringIO
+from functools import partial
+from contextlib import redirect_stdout
+from concurrent.futures import Future
+from .path import CACHE_DIR
+
+class ScriptError(Exception):
+    """
+    Raised when the Python code of a script addon fails.
+    """
+
+def compile_script(source:str, name:str) -> bytes:
+    """
+    Compiles the Python code of a script addon.
+
+    The compiled code is cached on disk, one file per addon (and interpreter
+    version) along with the hash of its source, so a script is only compiled
+    again after it changes and an edit replaces the previous file.
+
+    Args:
+    source (str): The Python code.
+    name (str): The addon name.
+
+    Returns:
+    bytes: The marshalled code object.
+    """
+    key = hashlib.sha256(name.encode()).hexdigest()[:24]
+    path = os.path.join(CACHE_DIR, f"script-{key}.{sys.implementation.cache_tag}")
+    # The first line of the file, the code follows
+    digest = hashlib.sha256(source.encode()).hexdigest().encode() + b"\n"
+
+    try:
+        with open(path, "rb") as f:
+            cached = f.read()
+        if cached.startswith(digest):
+            return cached[len(digest):]
+    except OSError:
+        pass
+
+    code = marshal.dumps(compile(source, "<addon>", "exec"))
+
+    try:
+        # Written atomically, caching is best effort
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, prefix=".script.", suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(digest + code)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+
+    return code
+
+def execute(code:bytes, isolated:bool = True) -> str:
+    """
+    Runs compiled script code in a fresh namespace and returns what it printed.
+
+    In a worker process the script owns the process, so its stdout is simply
+    redirected. In a thread only its own print() is captured, so the shared
+    sys.stdout of the main program is never swapped.
+    """
+    output = StringIO()
+    namespace = {"__name__": "__addon__"}
+
+    try:
+        if isolated:
+            with redirect_stdout(output):
+                exec(marshal.loads(code), namespace)
+        else:
+            namespace["print"] = partial(print, file=output)
+            exec(marshal.loads(code), namespace)
+    except (Exception, SystemExit) as err:
+        # Plain message only, the original exception may not be picklable
+        raise ScriptError(f"{type(err).__name__}: {err}") from None
+
+    return output.getvalue()
+
+class ScriptPool:
+    """
+    A small pool of worker processes that run script addons, started once and reused.
+
+    Each script runs in its own process memory with a time limit. Where worker
+    processes can't be forked (e.g. Windows) scripts run in threads instead.
+    """
+
+    def __init__(self, max_workers:int = 8):
+        self.max_workers = max_workers
+        self.workers = 0
+        self.pool = None
+        # A worker is still running a script that timed out
+        self.stuck = False
+        # Whether a pool was already started, only the first one is forked
+        self.started = False
+
+    def start(self, scripts:int = 1) -> None:
+        """
+        Starts enough workers for the given number of scripts. Call it before
+        other threads are started, the first workers are forked from this process.
+
+        A pool started again later (more scripts, or a worker stuck on a script
+        that timed out) no longer forks this process, which has threads by then:
+        its workers come from a fork server (or are spawned), importing twidgets afresh.
+        """
+        # Scripts mostly wait on I/O, one worker per script so a hung one doesn't hold up the others
+        workers = max(1, min(scripts, self.max_workers))
+
+        if self.workers:
+            if workers <= self.workers and not self.stuck:
+                # Warm workers are reused
+                return
+            self.close()
+
+        import multiprocessing
+
+        if os.name == "posix" and "fork" in multiprocessing.get_all_start_methods():
+            if not self.started:
+                method = "fork"
+            elif "forkserver" in multiprocessing.get_all_start_methods():
+                method = "forkserver"
+            else:
+                method = "spawn"
+
+            self.pool = multiprocessing.get_context(method).Pool(workers)
+
+            if not self.started:
+                atexit.register(self.close)
+            self.started = True
+
+        self.workers = workers
+        self.stuck = False
+
+    def run(self, code:bytes, timeout:float) -> str:
+        """
+        Runs compiled script code in a worker and waits for its output.
+
+        Raises:
+        ScriptError: The script failed.
+        TimeoutError: The script did not finish within `timeout` seconds.
+        """
+        if not self.workers:
+            self.start()
+
+        if self.pool is not None:
+            import multiprocessing
+
+            try:
+                return self.pool.apply_async(execute, (code,)).get(timeout)
+            except multiprocessing.TimeoutError:
+                # The worker is replaced on the next start
+                self.stuck = True
+                raise TimeoutError() from None
+
+        future = Future()
+
+        def target():
+            try:
+                future.set_result(execute(code, isolated=False))
+            except BaseException as err:
+                future.set_exception(err)
+
+        # A daemon thread, a script still running after its timeout never blocks the exit
+        threading.Thread(target=target, daemon=True).start()
+        return future.result(timeout)
+
+    def close(self) -> None:
+        if self.pool is not None:
+            # Kills workers still running a script
+            self.pool.terminate()
+            self.pool = None
+
+        self.workers = 0
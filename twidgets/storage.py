@@ -0,0 +1,124 @@
+import re, threading
+from concurrent.futures import Future, wait
+from . import procfs
+from .lazy import lazy_module
+
+psutil = lazy_module("psutil")
+
+# Seconds a mount may take to answer before it is shown as stale
+MOUNT_TIMEOUT = 2
+
+MOUNTS_PATH = "/proc/mounts"
+
+# File systems that hold no user data, never detected as mounts
+PSEUDO_TYPES = {
+    b"proc", b"sysfs", b"devtmpfs", b"devpts", b"tmpfs", b"ramfs", b"cgroup", b"cgroup2",
+    b"securityfs", b"pstore", b"debugfs", b"tracefs", b"configfs", b"fusectl", b"mqueue",
+    b"hugetlbfs", b"binfmt_misc", b"autofs", b"bpf", b"nsfs", b"efivarfs", b"selinuxfs",
+    b"rpc_pipefs", b"squashfs"
+}
+
+# Spaces, tabs and backslashes in the paths of /proc/mounts are written as octal escapes
+ESCAPE = re.compile(rb"\\([0-7]{3})")
+
+# mount point: the statvfs still running on it. A hung mount keeps its
+# thread, it isn't asked again until that one returns.
+running = {}
+lock = threading.Lock()
+
+def detect_mounts() -> list:
+    """
+    Lists the writable file systems holding data, each device once.
+
+    Returns:
+    list: The mount points, in the order they were mounted.
+    """
+    try:
+        data = procfs.read(MOUNTS_PATH)
+    except OSError:
+        try:
+            # Where there is no /proc (macOS, BSD)
+            return [partition.mountpoint for partition in psutil.disk_partitions()]
+        except Exception:
+            return []
+
+    mounts = []
+    devices = set()
+
+    for line in data.splitlines():
+        # "device mount_point type options dump pass"
+        fields = line.split()
+
+        if len(fields) < 4 or fields[2] in PSEUDO_TYPES:
+            continue
+
+        # Read-only file systems (images, recovery partitions) never fill up
+        if b"ro" in fields[3].split(b","):
+            continue
+
+        # A file system mounted more than once (bind mounts) is shown once
+        if fields[0] in devices:
+            continue
+        devices.add(fields[0])
+
+        mounts.append(ESCAPE.sub(lambda match: bytes([int(match[1], 8)]), fields[1]).decode(errors="replace"))
+
+    return mounts
+
+def disk_usage(path:str) -> dict:
+    try:
+        return procfs.disk_usage(path)
+    except OSError:
+        # Windows has no statvfs
+        usage = psutil.disk_usage(path)
+        return {"free": usage.free, "total": usage.total}
+
+def stat_mount(path:str) -> Future:
+    # The space of the mount, read in a daemon thread so a hung mount never holds up the exit
+    with lock:
+        future = running.get(path)
+
+        if future is None:
+            future = running[path] = Future()
+            threading.Thread(target=run_stat, args=(path, future), daemon=True).start()
+
+    return future
+
+def run_stat(path:str, future:Future) -> None:
+    try:
+        result = disk_usage(path)
+    except Exception as err:
+        future.set_exception(err)
+    else:
+        future.set_result(result)
+    finally:
+        with lock:
+            running.pop(path, None)
+
+def usage(paths:list, timeout:float = MOUNT_TIMEOUT) -> list:
+    """
+    Reads the space of the mounts in parallel, waiting at most `timeout`
+    seconds for each of them.
+
+    Args:
+    paths (list): The mount points.
+    timeout (float): The seconds a mount may take to answer.
+
+    Returns:
+    list: The "mount" point, "free" and "total" space in bytes of each mount,
+    in the order given. The ones that didn't answer in time are "stale",
+    without space, the ones that failed (not mounted anymore) are left out.
+    """
+    futures = [(path, stat_mount(path)) for path in paths]
+    # They run alongside, so waiting for all of them at once gives each the same deadline
+    wait([future for path, future in futures], timeout=timeout)
+
+    mounts = []
+
+    for path, future in futures:
+        if not future.done():
+            mounts.append({"mount": path, "free": None, "total": None, "stale": True})
+        elif future.exception() is None:
+            mounts.append({"mount": path, **future.result(), "stale": False})
+
+    return mounts
@@ -0,0 +1,138 @@
+import hashlib
+from time import time
+from .lazy import lazy_module
+from .cache import load, store
+
+requests = lazy_module("requests")
+
+WEATHER_URL = "https://api.openweathermap.org/data/2.5/weather"
+
+# Seconds a weather report is shown before it is fetched again
+DEFAULT_TTL = 600
+
+# Seconds an expired report is still shown while it is refreshed out of band
+DEFAULT_STALE_TTL = 3600
+
+# Seconds to wait before asking again after a failed request, doubled on every failure
+BACKOFF_BASE = 60
+BACKOFF_MAX = 3600
+
+session = None
+
+class WeatherError(Exception):
+    """
+    Raised when the weather API answers with an error.
+    """
+
+    def __init__(self, status:int, message:str, retry_after:float = None):
+        super().__init__(f"{status}: {message}")
+        self.status = status
+        self.retry_after = retry_after
+
+def get_session():
+    # One pooled session per process, long running modes reuse its connection
+    global session
+    if session is None:
+        session = requests.Session()
+    return session
+
+def fetch_weather(location:str, api_key:str, units:str = "metric", url:str = WEATHER_URL, timeout:float = 3) -> dict:
+    """
+    Fetches the current weather of a location from the OpenWeatherMap API.
+
+    Returns:
+    dict: The weather "type", "temp" and "feels_like" temperature.
+
+    Raises:
+    WeatherError: The API answered with an error status.
+    """
+    response = get_session().get(url, params={"q": location, "appid": api_key, "units": units}, timeout=timeout)
+
+    if response.status_code != 200:
+        try:
+            retry_after = float(response.headers.get("Retry-After"))
+        except (TypeError, ValueError):
+            retry_after = None
+        raise WeatherError(response.status_code, response.text, retry_after)
+
+    report = response.json()
+    return {
+        "type": report["weather"][0]["main"],
+        "temp": report["main"]["temp"],
+        "feels_like": report["main"].get("feels_like")
+    }
+
+def cache_name(location:str, units:str) -> str:
+    # One cache per location and units, the API key doesn't change the weather
+    digest = hashlib.sha1(f"{location.strip().lower()}|{units}".encode()).hexdigest()
+    return f"weather-{digest[:16]}"
+
+def update_weather(location:str, api_key:str, units:str = "metric", url:str = WEATHER_URL):
+    """
+    Fetches the weather and caches it. After an error response no request
+    is made until the backoff delay (or the API's Retry-After) has passed.
+
+    Returns:
+    dict or None: The weather, or None if it couldn't be fetched.
+    """
+    name = cache_name(location, units)
+    cached = load(name) or {}
+
+    if time() < cached.get("backoff_until", 0):
+        return None
+
+    try:
+        weather = fetch_weather(location, api_key, units, url)
+    except WeatherError as err:
+        # Rate limited or rejected, back off instead of asking on every run
+        failures = cached.get("failures", 0) + 1
+        delay = err.retry_after or min(BACKOFF_BASE * 2 ** (failures - 1), BACKOFF_MAX)
+        store(name, {**cached, "failures": failures, "backoff_until": time() + delay, "error": str(err)})
+        return None
+    except Exception:
+        # Offline or timed out, nothing to remember
+        return None
+
+    store(name, {"time": time(), "weather": weather})
+    return weather
+
+def get_weather(location:str, api_key:str, units:str = "metric", ttl:float = DEFAULT_TTL, stale_ttl:float = DEFAULT_STALE_TTL, refresh:bool = False, on_stale=None, url:str = WEATHER_URL):
+    """
+    Returns the weather of a location, from the cache while it is fresh.
+
+    Args:
+    location (str): The location, as accepted by OpenWeatherMap.
+    api_key (str): The OpenWeatherMap API key.
+    units (str): "metric", "imperial" or "standard".
+    ttl (float): Seconds a cached report is used as is.
+    stale_ttl (float): Seconds an expired report is still used, while `on_stale` refreshes it.
+    refresh (bool): Ignore the cached report.
+    on_stale (callable): Starts a refresh out of band, the stale report is returned meanwhile.
+    If not provided the report is fetched right away instead.
+    url (str): The API endpoint, e.g. a local stand-in.
+
+    Returns:
+    dict or None: The weather "type", "temp" and "feels_like", or None if unavailable.
+    """
+    name = cache_name(location, units)
+    cached = load(name) or {}
+    weather = cached.get("weather")
+    age = time() - cached.get("time", 0)
+
+    if not refresh and weather:
+        if age < ttl:
+            return weather
+
+        if age < ttl + stale_ttl:
+            if time() < cached.get("backoff_until", 0):
+                # Backing off, keep showing the last report
+                return weather
+
+            if on_stale:
+                # Don't start another refresh while one is running
+                if time() - cached.get("refreshing", 0) > 30:
+                    store(name, {**cached, "refreshing": time()})
+                    on_stale()
+                return weather
+
+    return update_weather(location, api_key, units, url) or (weather if age < ttl + stale_ttl else None)